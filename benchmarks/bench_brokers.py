@@ -0,0 +1,109 @@
+"""Benchmark flat and hierarchical broker layouts with mock federates.
+
+Builds chain, star and fan-out diagrams (see diagrams.py) of
+`MockComponent` federates twice, once with the single root broker and
+once with a `BrokerTopology` of sub-brokers, runs each federation with
+``helics run`` and reports the wall time from start to the last
+federate exiting. Each mock federate exchanges 100 time steps.
+
+Run with::
+
+    python benchmarks/bench_brokers.py
+    python benchmarks/bench_brokers.py --sizes 50 200 --max-federates 16 --shapes chain
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import tempfile
+import time
+
+from diagrams import SHAPES, make_diagram
+
+from oedisi.componentframework.mock_component import MockComponent
+from oedisi.componentframework.system_configuration import (
+    BrokerTopology,
+    WiringDiagram,
+    generate_runner_config,
+)
+from oedisi.types.helics_config import SharedFederateConfig
+
+
+def run_federation(
+    diagram: WiringDiagram, brokers: BrokerTopology | None, timeout: float
+) -> tuple[int, float | None]:
+    """Build and run `diagram`.
+
+    Returns the number of brokers and the run wall time, None on failure.
+    """
+    with tempfile.TemporaryDirectory() as directory:
+        runner = generate_runner_config(
+            diagram,
+            {"Mock": MockComponent},
+            target_directory=directory,
+            brokers=brokers,
+        )
+        runner_path = os.path.join(directory, "system_runner.json")
+        with open(runner_path, "w") as f:
+            f.write(runner.model_dump_json(indent=2))
+        n_brokers = sum(
+            federate.exec.startswith("helics_broker") for federate in runner.federates
+        )
+        start = time.perf_counter()
+        try:
+            subprocess.run(
+                ["helics", "run", f"--path={runner_path}"],
+                cwd=directory,
+                capture_output=True,
+                check=True,
+                timeout=timeout,
+            )
+        except (subprocess.CalledProcessError, subprocess.TimeoutExpired):
+            return n_brokers, None
+        return n_brokers, time.perf_counter() - start
+
+
+def main():
+    """Run every shape and size with both layouts and report the results."""
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10, 50, 100])
+    parser.add_argument("--shapes", nargs="+", choices=SHAPES, default=SHAPES)
+    parser.add_argument("--max-federates", type=int, default=16)
+    parser.add_argument("--timeout", type=float, default=600)
+    parser.add_argument("--output", help="Write results as JSON to this file")
+    args = parser.parse_args()
+
+    results = []
+    print(f"{'shape':<7} {'size':>6} {'layout':<6} {'brokers':>7} {'wall (s)':>10}")
+    for shape in args.shapes:
+        for size in args.sizes:
+            data = make_diagram(shape, size, component_type="Mock")
+            data["shared_helics_config"] = SharedFederateConfig(core_type="zmq")
+            diagram = WiringDiagram.model_validate(data)
+            for layout, brokers in [
+                ("flat", None),
+                ("tree", BrokerTopology(max_federates=args.max_federates)),
+            ]:
+                n_brokers, wall_time = run_federation(diagram, brokers, args.timeout)
+                results.append(
+                    {
+                        "shape": shape,
+                        "size": size,
+                        "layout": layout,
+                        "brokers": n_brokers,
+                        "wall_time_s": wall_time,
+                    }
+                )
+                shown = "failed" if wall_time is None else f"{wall_time:.2f}"
+                print(f"{shape:<7} {size:>6} {layout:<6} {n_brokers:>7} {shown:>10}")
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump({"results": results}, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
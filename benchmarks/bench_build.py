@@ -0,0 +1,173 @@
+"""Benchmark the build pipeline on synthetic wiring diagrams.
+
+Times each phase of `oedisi build` separately:
+
+- ``validate``: `WiringDiagram.model_validate` of the diagram dictionary,
+- ``link_map``: `WiringDiagram.get_link_map`,
+- ``initialize``: `initialize_federates`,
+- ``runner_config``: `generate_runner_config` (includes initialization),
+
+for chain, star and fan-out diagrams (see diagrams.py) using the no-I/O
+``null`` component type and `MockComponent`. Wall time is measured
+without tracing; peak memory is measured in a second run under
+tracemalloc. Results are printed and optionally written as JSON, which
+``--compare`` can diff against an earlier run.
+
+Run with::
+
+    python benchmarks/bench_build.py
+    python benchmarks/bench_build.py --sizes 10 100 1000 10000 100000 --types null
+    python benchmarks/bench_build.py --output after.json --compare before.json
+"""
+
+import argparse
+import datetime
+import json
+import platform
+import subprocess
+import tempfile
+import time
+import tracemalloc
+
+from diagrams import COMPONENT_TYPES, SHAPES, make_diagram
+
+from oedisi.componentframework.system_configuration import (
+    WiringDiagram,
+    generate_runner_config,
+    initialize_federates,
+)
+
+PHASES = ["validate", "link_map", "initialize", "runner_config"]
+
+
+def _accept(source_type, target_type):
+    return True
+
+
+def run_phase(phase: str, data: dict, component_type: str):
+    """Return a zero argument function running `phase` on `data`."""
+    types = {"Null": COMPONENT_TYPES[component_type]}
+    diagram = WiringDiagram.model_validate(data)
+    if phase == "validate":
+        return lambda: WiringDiagram.model_validate(data)
+    if phase == "link_map":
+        return diagram.get_link_map
+
+    def build():
+        with tempfile.TemporaryDirectory() as directory:
+            if phase == "initialize":
+                initialize_federates(diagram, types, _accept, directory)
+            else:
+                generate_runner_config(diagram, types, target_directory=directory)
+
+    return build
+
+
+def measure(func) -> tuple[float, int]:
+    """Wall time in seconds and tracemalloc peak in bytes of `func`."""
+    start = time.perf_counter()
+    func()
+    wall_time = time.perf_counter() - start
+
+    tracemalloc.start()
+    try:
+        func()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return wall_time, peak
+
+
+def git_commit() -> str | None:
+    """Commit hash of the working tree, if available."""
+    try:
+        result = subprocess.run(
+            ["git", "rev-parse", "HEAD"], capture_output=True, text=True, check=True
+        )
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    return result.stdout.strip()
+
+
+def _key(result: dict) -> tuple:
+    return (result["shape"], result["size"], result["component_type"], result["phase"])
+
+
+def compare(results: list[dict], baseline_path: str):
+    """Print the wall time ratio of every result against a baseline file."""
+    with open(baseline_path) as f:
+        baseline = {_key(result): result for result in json.load(f)["results"]}
+    print(f"\nCompared with {baseline_path} (ratio > 1 is slower)")
+    print(f"{'shape':<7} {'size':>7} {'type':<5} {'phase':<14} {'ratio':>7}")
+    for result in results:
+        old = baseline.get(_key(result))
+        if old is None or old["wall_time_s"] == 0:
+            continue
+        ratio = result["wall_time_s"] / old["wall_time_s"]
+        print(
+            f"{result['shape']:<7} {result['size']:>7} {result['component_type']:<5} "
+            f"{result['phase']:<14} {ratio:>7.2f}"
+        )
+
+
+def main():
+    """Run the benchmark matrix and report the results."""
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10, 100, 1000, 10000])
+    parser.add_argument("--shapes", nargs="+", choices=SHAPES, default=SHAPES)
+    parser.add_argument(
+        "--types", nargs="+", choices=list(COMPONENT_TYPES), default=["null", "mock"]
+    )
+    parser.add_argument("--phases", nargs="+", choices=PHASES, default=PHASES)
+    parser.add_argument("--output", help="Write results as JSON to this file")
+    parser.add_argument("--compare", help="Baseline JSON results to compare against")
+    args = parser.parse_args()
+
+    results = []
+    print(
+        f"{'shape':<7} {'size':>7} {'type':<5} {'phase':<14} "
+        f"{'wall (s)':>10} {'peak (MB)':>10}"
+    )
+    for shape in args.shapes:
+        for size in args.sizes:
+            data = make_diagram(shape, size)
+            for component_type in args.types:
+                for phase in args.phases:
+                    wall_time, peak = measure(run_phase(phase, data, component_type))
+                    results.append(
+                        {
+                            "shape": shape,
+                            "size": size,
+                            "links": len(data["links"]),
+                            "component_type": component_type,
+                            "phase": phase,
+                            "wall_time_s": wall_time,
+                            "peak_memory_bytes": peak,
+                        }
+                    )
+                    print(
+                        f"{shape:<7} {size:>7} {component_type:<5} {phase:<14} "
+                        f"{wall_time:>10.4f} {peak / 1e6:>10.2f}"
+                    )
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(
+                {
+                    "commit": git_commit(),
+                    "timestamp": datetime.datetime.now().isoformat(),
+                    "python": platform.python_version(),
+                    "platform": platform.platform(),
+                    "results": results,
+                },
+                f,
+                indent=2,
+            )
+    if args.compare:
+        compare(results, args.compare)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,74 @@
+"""Benchmark the binary codec against the JSON path for VoltagesReal and PowersReal.
+
+Run with::
+
+    python benchmarks/bench_codec.py
+    python benchmarks/bench_codec.py --sizes 1000 10000 --repeat 20
+"""
+
+import argparse
+import timeit
+
+import numpy as np
+
+from oedisi.types.codec import decode, encode
+from oedisi.types.data_types import PowersReal, VoltagesReal
+
+
+def make_models(n: int):
+    """Create VoltagesReal and PowersReal payloads with `n` ids."""
+    rng = np.random.default_rng(0)
+    ids = [f"bus_{i}.{i % 3 + 1}" for i in range(n)]
+    voltages = VoltagesReal(values=rng.normal(2400, 10, n).tolist(), ids=ids)
+    powers = PowersReal(
+        values=rng.normal(5, 1, n).tolist(),
+        ids=ids,
+        equipment_ids=[f"Load.load_{i}" for i in range(n)],
+    )
+    return voltages, powers
+
+
+def best_of(func, repeat: int) -> float:
+    """Best wall time of `func` over `repeat` runs in seconds."""
+    return min(timeit.repeat(func, number=1, repeat=repeat))
+
+
+def main():
+    """Print encode/decode timings and sizes for JSON and binary."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1_000, 10_000, 100_000])
+    parser.add_argument("--repeat", type=int, default=10)
+    args = parser.parse_args()
+
+    print(
+        f"{'model':<12} {'ids':>8} {'path':<7} {'size (kB)':>10} "
+        f"{'encode (ms)':>12} {'decode (ms)':>12}"
+    )
+    for n in args.sizes:
+        for model in make_models(n):
+            cls = type(model)
+            json_data = model.model_dump_json()
+            binary_data = encode(model)
+            rows = [
+                (
+                    "json",
+                    len(json_data),
+                    best_of(model.model_dump_json, args.repeat),
+                    best_of(lambda: cls.model_validate_json(json_data), args.repeat),
+                ),
+                (
+                    "binary",
+                    len(binary_data),
+                    best_of(lambda: encode(model), args.repeat),
+                    best_of(lambda: decode(binary_data, cls), args.repeat),
+                ),
+            ]
+            for path, size, encode_time, decode_time in rows:
+                print(
+                    f"{cls.__name__:<12} {n:>8} {path:<7} {size / 1e3:>10.1f} "
+                    f"{encode_time * 1e3:>12.2f} {decode_time * 1e3:>12.2f}"
+                )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,107 @@
+"""Benchmark compression of a synthetic 50k-bus Topology.
+
+Reports the compression ratio and compress/decompress time of every
+available codec on the JSON payload.
+
+Run with::
+
+    python benchmarks/bench_compression.py
+    python benchmarks/bench_compression.py --buses 10000
+"""
+
+import argparse
+import timeit
+
+import numpy as np
+
+from oedisi.types.compression import available_codecs, compress, decompress
+from oedisi.types.data_types import (
+    AdmittanceSparse,
+    Injection,
+    PowersImaginary,
+    PowersReal,
+    Topology,
+    VoltagesAngle,
+    VoltagesMagnitude,
+)
+
+
+def make_topology(n_buses: int) -> Topology:
+    """Radial feeder with `n_buses` buses, one load per bus."""
+    rng = np.random.default_rng(0)
+    buses = [f"bus_{i}.{i % 3 + 1}" for i in range(n_buses)]
+    parents = [max(i - 3, 0) for i in range(n_buses)]
+    y = rng.normal(5, 1, n_buses) - 1j * rng.normal(15, 2, n_buses)
+
+    from_equipment, to_equipment, admittance = [], [], []
+    for i, parent in enumerate(parents):
+        from_equipment.append(buses[i])
+        to_equipment.append(buses[i])
+        admittance.append((2 * y[i].real, 2 * y[i].imag))
+        if i != parent:
+            from_equipment.extend([buses[i], buses[parent]])
+            to_equipment.extend([buses[parent], buses[i]])
+            admittance.extend([(-y[i].real, -y[i].imag)] * 2)
+
+    loads = [f"Load.load_{i}" for i in range(n_buses)]
+    return Topology(
+        admittance=AdmittanceSparse(
+            from_equipment=from_equipment,
+            to_equipment=to_equipment,
+            admittance_list=admittance,
+        ),
+        injections=Injection(
+            power_real=PowersReal(
+                values=rng.normal(5, 1, n_buses).tolist(), ids=buses, equipment_ids=loads
+            ),
+            power_imaginary=PowersImaginary(
+                values=rng.normal(1, 0.2, n_buses).tolist(),
+                ids=buses,
+                equipment_ids=loads,
+            ),
+        ),
+        base_voltage_magnitudes=VoltagesMagnitude(
+            values=rng.normal(2400, 10, n_buses).tolist(), ids=buses
+        ),
+        base_voltage_angles=VoltagesAngle(
+            values=rng.normal(0, 0.1, n_buses).tolist(), ids=buses
+        ),
+        slack_bus=buses[:3],
+    )
+
+
+def best_of(func, repeat: int) -> float:
+    """Best wall time of `func` over `repeat` runs in seconds."""
+    return min(timeit.repeat(func, number=1, repeat=repeat))
+
+
+def main():
+    """Print compression ratio and timings per payload and codec."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--buses", type=int, default=50_000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    topology = make_topology(args.buses)
+    payload = topology.model_dump_json().encode("utf-8")
+    print(
+        f"{'codec':<6} {'size (MB)':>10} {'ratio':>7} "
+        f"{'compress (ms)':>14} {'decompress (ms)':>16}"
+    )
+    print(f"{'none':<6} {len(payload) / 1e6:>10.2f} {1.0:>7.2f}")
+    for codec in available_codecs():
+        compressed = compress(payload, threshold=0, codec=codec)
+        assert decompress(compressed) == payload
+        compress_time = best_of(
+            lambda: compress(payload, threshold=0, codec=codec), args.repeat
+        )
+        decompress_time = best_of(lambda: decompress(compressed), args.repeat)
+        print(
+            f"{codec:<6} {len(compressed) / 1e6:>10.2f} "
+            f"{len(payload) / len(compressed):>7.2f} "
+            f"{compress_time * 1e3:>14.1f} {decompress_time * 1e3:>16.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,136 @@
+"""Synthetic wiring diagrams and component types for build benchmarks.
+
+Shapes:
+
+- ``chain``: ``n`` components, each subscribing to the previous one.
+- ``star``: ``n - 1`` leaves all publishing into one hub.
+- ``fanout``: a feeder publishing to ``n - 2`` sensors, which all publish
+  into a single estimator, like the feeder/sensor/estimator test systems.
+
+Diagrams are returned as plain dictionaries, so benchmarks can time
+`WiringDiagram` validation separately.
+"""
+
+from oedisi.componentframework.mock_component import MockComponent
+from oedisi.componentframework.system_configuration import (
+    AnnotatedType,
+    ComponentCapabilities,
+    ComponentType,
+)
+
+SHAPES = ["chain", "star", "fanout"]
+
+
+class NullComponent(ComponentType):
+    """Component type which does no I/O, to time the framework alone.
+
+    Takes the same "inputs" and "outputs" parameters as `MockComponent`.
+    """
+
+    _capabilities = ComponentCapabilities(broker_config=True)
+
+    def __init__(
+        self, base_config, parameters, directory, host=None, port=None, comp_type=None
+    ):
+        """Record the declared ports."""
+        self._dynamic_inputs = {
+            name: AnnotatedType(type="", port_id=name) for name in parameters["inputs"]
+        }
+        self._dynamic_outputs = {
+            name: AnnotatedType(type=type, port_id=name)
+            for name, type in parameters["outputs"].items()
+        }
+
+    def generate_input_mapping(self, links):
+        """Ignore the input mapping."""
+        self._links = links
+
+    @property
+    def execute_function(self):
+        """Command which is never run."""
+        return "true"
+
+    @property
+    def dynamic_inputs(self):
+        """Dynamic input ports."""
+        return self._dynamic_inputs
+
+    @property
+    def dynamic_outputs(self):
+        """Dynamic output ports."""
+        return self._dynamic_outputs
+
+
+COMPONENT_TYPES = {"null": NullComponent, "mock": MockComponent}
+
+
+def _component(name: str, type: str, inputs: list[str], outputs: list[str]) -> dict:
+    return {
+        "name": name,
+        "type": type,
+        "parameters": {
+            "inputs": inputs,
+            "outputs": {output: "double" for output in outputs},
+        },
+    }
+
+
+def _link(source: str, source_port: str, target: str, target_port: str) -> dict:
+    return {
+        "source": source,
+        "source_port": source_port,
+        "target": target,
+        "target_port": target_port,
+    }
+
+
+def make_diagram(shape: str, n: int, component_type: str = "Null") -> dict:
+    """Build a wiring diagram dictionary of `shape` with `n` components.
+
+    Parameters
+    ----------
+    shape : str
+        One of `SHAPES`.
+    n : int
+        Number of components (at least 3).
+    component_type : str
+        Type name used for every component.
+
+    Returns
+    -------
+    dict
+        Wiring diagram suitable for `WiringDiagram.model_validate`.
+    """
+    if n < 3:
+        raise ValueError("Synthetic diagrams need at least 3 components")
+    components, links = [], []
+    if shape == "chain":
+        for i in range(n):
+            components.append(
+                _component(f"c{i}", component_type, ["x"] if i else [], ["x"])
+            )
+            if i:
+                links.append(_link(f"c{i - 1}", "x", f"c{i}", "x"))
+    elif shape == "star":
+        leaves = [f"leaf{i}" for i in range(n - 1)]
+        components.append(
+            _component("hub", component_type, [f"x{i}" for i in range(n - 1)], [])
+        )
+        for i, leaf in enumerate(leaves):
+            components.append(_component(leaf, component_type, [], ["x"]))
+            links.append(_link(leaf, "x", "hub", f"x{i}"))
+    elif shape == "fanout":
+        sensors = [f"sensor{i}" for i in range(n - 2)]
+        components.append(_component("feeder", component_type, [], ["voltages"]))
+        components.append(
+            _component("estimator", component_type, [f"m{i}" for i in range(n - 2)], [])
+        )
+        for i, sensor in enumerate(sensors):
+            components.append(
+                _component(sensor, component_type, ["voltages"], ["measurement"])
+            )
+            links.append(_link("feeder", "voltages", sensor, "voltages"))
+            links.append(_link(sensor, "measurement", "estimator", f"m{i}"))
+    else:
+        raise ValueError(f"Unknown shape {shape}, expected one of {SHAPES}")
+    return {"name": f"{shape}_{n}", "components": components, "links": links}
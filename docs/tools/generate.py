@@ -24,11 +24,15 @@ installed ``oedisi`` package.
 from __future__ import annotations
 
 import argparse
+import functools
 import inspect
 import json
+import operator
 import os
 import re
 import sys
+import types
+import typing
 from pathlib import Path
 from typing import Any
 
@@ -67,7 +71,33 @@ def clean_type(annotation: Any) -> str:
     return s.strip()
 
 
+def _strip_annotated(annotation: Any) -> Any:
+    """Drop ``Annotated`` metadata (validators, serializers) from a type.
+
+    Aliases such as ``FloatArray`` wrap ``list[float]`` in validators that only
+    change the in-memory form, so the docs show the underlying type.
+    """
+    origin, args = typing.get_origin(annotation), typing.get_args(annotation)
+    if origin is typing.Annotated:
+        return _strip_annotated(args[0])
+    if origin is None or not args:
+        return annotation
+    stripped = tuple(_strip_annotated(arg) for arg in args)
+    if stripped == args:
+        return annotation
+    if origin in (typing.Union, types.UnionType):
+        # ``Annotated[...] | None`` is a typing.Union; render it as ``X | None``.
+        return functools.reduce(operator.or_, stripped)
+    if isinstance(annotation, types.GenericAlias):
+        return types.GenericAlias(origin, stripped)
+    try:
+        return annotation.copy_with(stripped)
+    except Exception:  # pragma: no cover - defensive
+        return annotation
+
+
 def _annotation_repr(annotation: Any) -> str:
+    annotation = _strip_annotated(annotation)
     try:
         return str(annotation)
     except Exception:  # pragma: no cover - defensive
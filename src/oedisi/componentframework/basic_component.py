@@ -1,5 +1,6 @@
 """Generate basic component from description JSON."""
 
+import hashlib
 import json
 import os
 from shutil import copytree, ignore_patterns
@@ -8,7 +9,10 @@ from typing import Any
 from pydantic import BaseModel, Field
 
 from . import system_configuration
+from .code_store import link_tree, populate_store, replace_file
+from .parameter_refs import link_parameter_refs
 from .system_configuration import AnnotatedType, ComponentCapabilities
+from oedisi.types.common import Encoding
 from oedisi.types.helics_config import HELICSFederateConfig
 
 
@@ -29,6 +33,9 @@ class ComponentDescription(BaseModel):
         List of output types. Typically publications.
     capabilities :
         Component capability declarations for build-time validation.
+    entry_point :
+        Optional 'module:function' running the federate in a given directory,
+        which lets the component be packed into a shared host process.
     """
 
     directory: str
@@ -42,6 +49,8 @@ class ComponentDescription(BaseModel):
     dynamic_outputs: list[AnnotatedType]
     "List of output types. Typically publications."
     capabilities: ComponentCapabilities = Field(default_factory=ComponentCapabilities)
+    entry_point: str | None = None
+    "'module:function' taking the component directory, used for packing"
 
 
 def _types_to_dict(types: list[AnnotatedType]) -> dict[str, AnnotatedType]:
@@ -49,6 +58,26 @@ def _types_to_dict(types: list[AnnotatedType]) -> dict[str, AnnotatedType]:
     return {t.port_name: t for t in types}
 
 
+def _hash_directory(directory) -> str:
+    """Hash file names and contents of a directory tree, skipping dotfiles.
+
+    Dotfiles are skipped to match what `copy_code_into_directory` copies.
+    """
+    digest = hashlib.sha256()
+    for root, dirs, files in os.walk(directory):
+        dirs[:] = sorted(d for d in dirs if not d.startswith("."))
+        for name in sorted(files):
+            if name.startswith("."):
+                continue
+            path = os.path.join(root, name)
+            relative = os.path.relpath(path, directory)
+            digest.update(f"{relative}\x00{os.path.getsize(path)}\x00".encode())
+            with open(path, "rb") as f:
+                for chunk in iter(lambda: f.read(1 << 20), b""):
+                    digest.update(chunk)
+    return digest.hexdigest()
+
+
 def component_from_json(filepath, type_checker):
     """Load component description from JSON file and create component type.
 
@@ -88,6 +117,12 @@ def basic_component(comp_desc: ComponentDescription, type_checker):
         _dynamic_outputs = _types_to_dict(comp_desc.dynamic_outputs)
         _static_inputs = _types_to_dict(comp_desc.static_inputs)
         _capabilities = comp_desc.capabilities
+        _entry_point = comp_desc.entry_point
+        _declares_encodings = any(
+            t.encodings != [Encoding.JSON]
+            for t in comp_desc.dynamic_inputs + comp_desc.dynamic_outputs
+        )
+        _build_options = frozenset({"release_parameters", "base_directory"})
 
         def __init__(
             self,
@@ -97,13 +132,29 @@ def basic_component(comp_desc: ComponentDescription, type_checker):
             host: str,
             port: int,
             comp_type: str,
+            *,
+            reuse_code: bool = False,
+            code_store: str | None = None,
+            release_parameters: bool = False,
+            base_directory=".",
         ):
             self._base_config = base_config
             self._directory = directory
+            self._base_directory = base_directory
             self._parameters = parameters
             self.check_parameters(parameters)
-            self.copy_code_into_directory()
+            if not reuse_code and code_store is not None:
+                self.link_code_into_directory(code_store)
+            elif not reuse_code:
+                self.copy_code_into_directory()
             self.generate_parameter_config()
+            if release_parameters:
+                # Streamed parameters can be large and are already written out.
+                self._parameters = None
+
+        @classmethod
+        def source_hash(cls):
+            return _hash_directory(cls._origin_directory)
 
         def check_parameters(self, parameters):
             for parameter_type in self._static_inputs.values():
@@ -121,13 +172,25 @@ def basic_component(comp_desc: ComponentDescription, type_checker):
                 self._directory,
                 dirs_exist_ok=True,
                 ignore=ignore_patterns(".*"),
+                copy_function=replace_file,
             )
 
+        def link_code_into_directory(self, store_path):
+            populate_store(self._origin_directory, store_path)
+            link_tree(store_path, self._directory)
+
         def generate_parameter_config(self):
+            if self._parameters is None:
+                raise ValueError(
+                    "Parameters were released after writing static_inputs.json"
+                )
+            parameters = link_parameter_refs(
+                self._parameters, self._directory, self._base_directory
+            )
             if self.broker_config_support:
-                config = self._base_config.to_dict() | self._parameters
+                config = self._base_config.to_dict() | parameters
             else:  # Backwards compatible behavior where we ignore extra information.
-                config = self._parameters
+                config = dict(parameters)
                 config["name"] = self._base_config.name
             with open(os.path.join(self._directory, "static_inputs.json"), "w") as f:
                 json.dump(config, f)
@@ -136,6 +199,20 @@ def basic_component(comp_desc: ComponentDescription, type_checker):
             with open(os.path.join(self._directory, "input_mapping.json"), "w") as f:
                 json.dump(links, f)
 
+        def generate_encoding_config(self, input_encodings, output_encodings):
+            # Components which only speak JSON keep their static_inputs.json as is.
+            if not self._declares_encodings:
+                return
+            path = os.path.join(self._directory, "static_inputs.json")
+            with open(path) as f:
+                config = json.load(f)
+            config["encodings"] = {
+                "inputs": {port: e.value for port, e in input_encodings.items()},
+                "outputs": {port: e.value for port, e in output_encodings.items()},
+            }
+            with open(path, "w") as f:
+                json.dump(config, f)
+
         @property
         def dynamic_inputs(self):
             return self._dynamic_inputs
@@ -0,0 +1,151 @@
+"""Content-addressed store for component code shared between instances.
+
+Large wiring diagrams often contain hundreds of instances of the same
+component type. Instead of copying the component source tree into every
+instance directory, the tree is copied once into
+``<target_directory>/.code_store/<source hash>`` and each instance
+directory gets links to the stored files. The link type is chosen
+automatically by what the filesystem supports, in order of preference:
+
+- reflinks (copy-on-write clones, e.g. on btrfs or XFS),
+- hardlinks,
+- relative symlinks,
+- plain copies.
+
+Hardlinked and symlinked files are shared between all instances, so
+component code should not modify its own files in place. Files written
+by the build itself (static_inputs.json and input_mapping.json) are never
+linked.
+"""
+
+import logging
+import os
+import shutil
+import sys
+import uuid
+from shutil import copytree, ignore_patterns
+
+CODE_STORE_DIRNAME = ".code_store"
+"Name of the store directory inside the build target directory"
+
+REFLINK = "reflink"
+HARDLINK = "hardlink"
+SYMLINK = "symlink"
+COPY = "copy"
+LINK_MODES = [REFLINK, HARDLINK, SYMLINK, COPY]
+"Link modes in order of preference"
+
+_GENERATED_FILES = {"static_inputs.json", "input_mapping.json"}
+_FICLONE = 0x40049409
+_link_modes: dict[tuple[int, int], str] = {}
+
+
+def _reflink(source: str, destination: str):
+    if not sys.platform.startswith("linux"):
+        raise OSError("Reflinks are only supported on Linux")
+    import fcntl
+
+    with open(source, "rb") as src, open(destination, "wb") as dst:
+        try:
+            fcntl.ioctl(dst.fileno(), _FICLONE, src.fileno())
+        except OSError:
+            dst.close()
+            os.remove(destination)
+            raise
+
+
+def _symlink(source: str, destination: str):
+    os.symlink(os.path.relpath(source, os.path.dirname(destination)), destination)
+
+
+_LINKERS = {
+    REFLINK: _reflink,
+    HARDLINK: os.link,
+    SYMLINK: _symlink,
+    COPY: shutil.copy2,
+}
+
+
+def replace_file(source: str, destination: str, mode: str = COPY):
+    """Replace `destination` by a link to `source` with `mode`.
+
+    The destination is removed first, so an existing hardlink or symlink
+    into the store is never written through.
+    """
+    if os.path.lexists(destination):
+        os.remove(destination)
+    _LINKERS[mode](source, destination)
+
+
+def _link_file(source: str, destination: str, key: tuple[int, int]) -> str:
+    """Link one file with the best mode that works, remembering it for `key`."""
+    start = LINK_MODES.index(_link_modes.get(key, REFLINK))
+    for mode in LINK_MODES[start:]:
+        try:
+            replace_file(source, destination, mode)
+        except OSError:
+            continue
+        if _link_modes.get(key) != mode:
+            logging.debug(f"Linking component code with {mode}s")
+            _link_modes[key] = mode
+        return mode
+    raise OSError(f"Could not link or copy {source} to {destination}")
+
+
+def link_file(source: str, destination: str) -> str:
+    """Link `source` to `destination` with the best supported mode.
+
+    Returns the mode used, one of `LINK_MODES`.
+    """
+    key = (os.stat(source).st_dev, os.stat(os.path.dirname(destination)).st_dev)
+    return _link_file(source, destination, key)
+
+
+def populate_store(origin_directory: str, store_path: str):
+    """Copy `origin_directory` into `store_path` unless it is already stored.
+
+    The copy is made under a temporary name and renamed into place, so
+    concurrent builds never see a partially written entry.
+    """
+    if os.path.isdir(store_path):
+        return
+    os.makedirs(os.path.dirname(store_path), exist_ok=True)
+    temporary = f"{store_path}.tmp-{uuid.uuid4().hex}"
+    copytree(origin_directory, temporary, ignore=ignore_patterns(".*"))
+    try:
+        os.rename(temporary, store_path)
+    except OSError:
+        # Another thread stored the same hash first.
+        shutil.rmtree(temporary)
+        if not os.path.isdir(store_path):
+            raise
+
+
+def link_tree(store_path: str, directory: str):
+    """Mirror the files of `store_path` into `directory` as links.
+
+    Directories are created, files are reflinked, hardlinked, symlinked or
+    copied depending on filesystem support. Generated files at the top
+    level are skipped.
+    """
+    os.makedirs(directory, exist_ok=True)
+    key = (os.stat(store_path).st_dev, os.stat(directory).st_dev)
+    for root, dirs, files in os.walk(store_path):
+        relative = os.path.relpath(root, store_path)
+        target = os.path.normpath(os.path.join(directory, relative))
+        for name in dirs:
+            os.makedirs(os.path.join(target, name), exist_ok=True)
+        for name in files:
+            if relative == "." and name in _GENERATED_FILES:
+                continue
+            _link_file(os.path.join(root, name), os.path.join(target, name), key)
+
+
+def prune_store(target_directory: str, keep: set[str]):
+    """Remove entries of the store in `target_directory` not in `keep`."""
+    store = os.path.join(target_directory, CODE_STORE_DIRNAME)
+    if not os.path.isdir(store):
+        return
+    for name in os.listdir(store):
+        if name not in keep:
+            shutil.rmtree(os.path.join(store, name), ignore_errors=True)
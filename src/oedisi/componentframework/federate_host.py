@@ -0,0 +1,168 @@
+"""Run several lightweight federates in one process.
+
+Normally every component becomes its own process with its own HELICS
+core, so small components (sensors, recorders, aggregators) each pay for
+interpreter startup, loading HELICS and a core connection. With packing
+(see `PackingPolicy`), `oedisi build` instead writes a host directory
+with a `federate_host.json` listing several member components, and the
+runner starts one host process::
+
+    python -m oedisi.componentframework.federate_host
+
+The host runs each member in its own thread by calling the member's
+entry point, a ``"module:function"`` string taking the member's
+directory::
+
+    def run_federate(directory: str) -> None: ...
+
+Entry points must not rely on the working directory (threads share it)
+and should read static_inputs.json and input_mapping.json from
+`directory`. Members share one HELICS core because the build gives them
+the same `core_name`, so they must also not close the HELICS library
+when they finish. If a member raises, the host aborts HELICS so that the
+other members do not wait forever for its time requests.
+
+Entry point modules found in a member's directory are loaded from their
+file under a name unique to that file, so two component types shipping
+a ``server.py`` each run their own code. Modules they import themselves
+are still shared by name across the process.
+"""
+
+import hashlib
+import importlib
+import importlib.util
+import json
+import logging
+import os
+import sys
+import threading
+import traceback
+from collections.abc import Callable
+
+import helics as h
+from pydantic import BaseModel
+
+HOST_CONFIG = "federate_host.json"
+"File in the host directory listing the members"
+
+logger = logging.getLogger(__name__)
+
+
+class HostMember(BaseModel):
+    """Federate run inside a host process."""
+
+    name: str
+    "Component name"
+    directory: str
+    "Component directory relative to the host directory"
+    entry_point: str
+    "Python entry point as 'module:function' taking the component directory"
+
+
+class FederateHostConfig(BaseModel):
+    """Members of one host process."""
+
+    members: list[HostMember]
+
+
+def _module_file(module_name: str, directory: str) -> str | None:
+    """File of `module_name` inside `directory`, if it is defined there."""
+    path = os.path.join(directory, *module_name.split("."))
+    for candidate in (f"{path}.py", os.path.join(path, "__init__.py")):
+        if os.path.isfile(candidate):
+            return os.path.abspath(candidate)
+    return None
+
+
+def _load_module_file(module_name: str, path: str):
+    """Load a module from its file under a name unique to that file."""
+    digest = hashlib.blake2b(path.encode("utf-8"), digest_size=8).hexdigest()
+    unique_name = f"_federate_host_{digest}_{module_name.replace('.', '_')}"
+    if unique_name in sys.modules:
+        return sys.modules[unique_name]
+    spec = importlib.util.spec_from_file_location(unique_name, path)
+    if spec is None or spec.loader is None:
+        raise ImportError(f"Cannot load {module_name} from {path}")
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[unique_name] = module
+    try:
+        spec.loader.exec_module(module)
+    except BaseException:
+        del sys.modules[unique_name]
+        raise
+    return module
+
+
+def load_entry_point(entry_point: str, directory: str) -> Callable[..., None]:
+    """Load a 'module:function' entry point, preferring modules in `directory`.
+
+    A module defined in `directory` is loaded from its file, otherwise it
+    is imported from the installed packages.
+    """
+    module_name, _, function_name = entry_point.partition(":")
+    if not function_name:
+        raise ValueError(f"Entry point {entry_point} must look like 'module:function'")
+    path = _module_file(module_name, directory)
+    if path is None:
+        module = importlib.import_module(module_name)
+    else:
+        # Sibling modules of the entry point are imported by name.
+        if directory not in sys.path:
+            sys.path.insert(0, directory)
+        module = _load_module_file(module_name, path)
+    return getattr(module, function_name)
+
+
+def run_host(config_path: str = HOST_CONFIG) -> int:
+    """Run every member of a host configuration in its own thread.
+
+    When a member raises, HELICS is aborted, which makes the blocking
+    calls of the other members raise as well.
+
+    Returns
+    -------
+    int
+        0 if every member finished without raising, 1 otherwise.
+    """
+    with open(config_path) as f:
+        config = FederateHostConfig.model_validate(json.load(f))
+    base_directory = os.path.dirname(os.path.abspath(config_path))
+
+    failures = []
+
+    def run_member(member: HostMember, entry: Callable[[str], None], directory: str):
+        try:
+            entry(directory)
+        except Exception:
+            logger.error(f"Federate {member.name} failed:\n{traceback.format_exc()}")
+            failures.append(member.name)
+
+    threads = []
+    for member in config.members:
+        directory = os.path.normpath(os.path.join(base_directory, member.directory))
+        entry = load_entry_point(member.entry_point, directory)
+        thread = threading.Thread(
+            target=run_member, args=(member, entry, directory), name=member.name
+        )
+        thread.start()
+        threads.append(thread)
+    for thread in threads:
+        thread.join(timeout=0.5)
+        while thread.is_alive():
+            # Unblock members waiting on a failed federate, also those which
+            # only created their federate after an earlier abort.
+            if failures:
+                h.helicsAbort(-1, f"Federate {failures[0]} failed")
+            thread.join(timeout=0.5)
+
+    if failures:
+        logger.error(f"Failed federates: {', '.join(failures)}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    logging.basicConfig(
+        level=logging.INFO, format="%(threadName)s %(levelname)s %(message)s"
+    )
+    sys.exit(run_host())
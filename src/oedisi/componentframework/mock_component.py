@@ -33,6 +33,7 @@ class MockComponent(system_configuration.ComponentType):
     """
 
     _capabilities = ComponentCapabilities(broker_config=True)
+    _entry_point = "oedisi.componentframework.mock_component:run_federate"
 
     def __init__(
         self,
@@ -142,11 +143,15 @@ def get_default_value(date_type: h.HelicsDataType):
     return 3.1415926536
 
 
-def destroy_federate(fed):
-    """Disconnect and free a HELICS federate."""
+def destroy_federate(fed, close_library: bool = True):
+    """Disconnect and free a HELICS federate.
+
+    Federates sharing a process with others must not close the library.
+    """
     _ = h.helicsFederateDisconnect(fed)
     h.helicsFederateFree(fed)
-    h.helicsCloseLibrary()
+    if close_library:
+        h.helicsCloseLibrary()
     logger.info("Federate finalized")
 
 
@@ -157,13 +162,16 @@ class MockFederate:
     test values during simulation.
     """
 
-    def __init__(self):
+    def __init__(self, directory: str = ".", close_library: bool = True):
         """Initialize mock federate from HELICS and input mapping configs."""
-        logger.info(f"Current Working Directory: {os.path.abspath(os.curdir)}")
-        self.fed = h.helicsCreateValueFederateFromConfig("helics_config.json")
+        logger.info(f"Component Directory: {os.path.abspath(directory)}")
+        self.close_library = close_library
+        self.fed = h.helicsCreateValueFederateFromConfig(
+            os.path.join(directory, "helics_config.json")
+        )
         logger.info(f"Created federate {self.fed.name}")
 
-        with open("input_mapping.json") as f:
+        with open(os.path.join(directory, "input_mapping.json")) as f:
             port_mapping = json.load(f)
             self.subscriptions = {}
             for name, key in port_mapping.items():
@@ -194,7 +202,12 @@ class MockFederate:
                 if sub.is_updated():
                     logger.info(f"From subscription {name}: {sub.bytes} of type {sub.type}")
 
-        destroy_federate(self.fed)
+        destroy_federate(self.fed, self.close_library)
+
+
+def run_federate(directory: str):
+    """Run a mock federate inside a shared federate host process."""
+    MockFederate(directory, close_library=False).run()
 
 
 if __name__ == "__main__":
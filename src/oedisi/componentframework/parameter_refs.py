@@ -0,0 +1,77 @@
+"""Link files referenced by component parameters into build directories.
+
+Parameters of the form ``{"$ref": "profiles/load.npy"}`` (see
+`oedisi.types.refs`) are not read at build time. Each referenced file is
+linked into ``<component directory>/refs/`` with the same reflink,
+hardlink, symlink or copy fallback as the code store, and the reference
+is rewritten relative to the component directory, so the federate finds
+it from its working directory.
+
+Relative references are resolved against the directory of the wiring
+diagram, so a system.json and its data files can be built from anywhere.
+"""
+
+import hashlib
+import os
+from typing import Any
+
+from oedisi.types.refs import REF_KEY, is_ref
+
+from .code_store import link_file
+
+REFS_DIRNAME = "refs"
+"Directory inside each component directory holding referenced files"
+
+
+def _ref_destination(path: str) -> str:
+    """Path under refs/ for a referenced file, keeping simple relative paths."""
+    normalized = os.path.normpath(path)
+    outside = normalized == os.pardir or normalized.startswith(os.pardir + os.sep)
+    if not os.path.isabs(normalized) and not outside:
+        return os.path.join(REFS_DIRNAME, normalized)
+    digest = hashlib.blake2b(
+        os.path.abspath(path).encode("utf-8"), digest_size=4
+    ).hexdigest()
+    return os.path.join(REFS_DIRNAME, f"{digest}-{os.path.basename(normalized)}")
+
+
+def link_parameter_refs(parameters: Any, directory: str, base_directory=".") -> Any:
+    """Link referenced files into `directory` and rewrite the references.
+
+    Parameters
+    ----------
+    parameters : Any
+        Component parameters, possibly containing nested references.
+    directory : str
+        Component build directory.
+    base_directory : str | Path
+        Directory relative references are resolved against.
+
+    Returns
+    -------
+    Any
+        Copy of `parameters` with references relative to `directory`.
+
+    Raises
+    ------
+    ValueError
+        If a referenced file does not exist.
+    """
+    if is_ref(parameters):
+        source = os.path.join(base_directory, parameters[REF_KEY])
+        if not os.path.isfile(source):
+            raise ValueError(f"Referenced parameter file {source} does not exist")
+        destination = _ref_destination(parameters[REF_KEY])
+        os.makedirs(os.path.join(directory, os.path.dirname(destination)), exist_ok=True)
+        link_file(os.path.abspath(source), os.path.join(directory, destination))
+        return parameters | {REF_KEY: destination.replace(os.sep, "/")}
+    if isinstance(parameters, dict):
+        return {
+            key: link_parameter_refs(value, directory, base_directory)
+            for key, value in parameters.items()
+        }
+    if isinstance(parameters, list):
+        return [
+            link_parameter_refs(value, directory, base_directory) for value in parameters
+        ]
+    return parameters
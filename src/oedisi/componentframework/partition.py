@@ -0,0 +1,279 @@
+"""Split a federation across several hosts.
+
+Co-simulations that exceed one machine are partitioned so that the
+links carrying the most data stay on one host while every host gets a
+share of the CPU load proportional to its size:
+
+- link weights are the declared or observed payload size of each
+  publication, in bytes per time step, keyed by the HELICS publication
+  key ``"<source>/<source_port>"`` (1 for unlisted publications),
+- CPU weights are estimates per component name or component type (1 for
+  unlisted components).
+
+`partition_wiring_diagram` grows one part per host along the heaviest
+links of the `wiring_diagram_utils.get_graph` link graph and then
+greedily moves components to the host they exchange the most data with,
+while the hosts stay within the allowed imbalance.
+
+`generate_partitioned_runner_configs` builds the federation once and
+returns one `RunnerConfig` per host. Every host runs a sub-broker for
+its federates, and host 0 also runs the root broker, so only traffic
+between hosts crosses the network. All hosts need the build directory
+at the same path. With ``localhost`` hostnames every runner config can
+be run on a single machine for testing::
+
+    helics run --path=system_runner_host0.json &
+    helics run --path=system_runner_host1.json
+
+Examples
+--------
+>>> config = PartitionConfig(
+...     hosts=[HostSpec(name="a", hostname="10.0.0.1", cpus=16),
+...            HostSpec(name="b", hostname="10.0.0.2", cpus=8)],
+...     link_weights={"feeder/voltages": 8e5},
+... )
+>>> runner_configs = generate_partitioned_runner_configs(
+...     wiring_diagram, component_types, config, target_directory="build"
+... )
+"""
+
+import heapq
+
+from pydantic import BaseModel, Field
+
+from .system_configuration import (
+    BrokerTopology,
+    ComponentType,
+    RunnerConfig,
+    WiringDiagram,
+    _bad_compatability_checker,
+    generate_runner_config,
+)
+from .wiring_diagram_utils import get_graph
+
+_LOCAL_HOSTNAMES = {"localhost", "127.0.0.1", "::1"}
+
+
+class HostSpec(BaseModel):
+    """Machine running part of a federation."""
+
+    name: str
+    "Name of the host, used for runner config file names"
+    hostname: str = "localhost"
+    "Address of the machine, the first host also runs the root broker"
+    cpus: float = Field(default=1.0, gt=0)
+    "Relative CPU capacity"
+
+
+class PartitionConfig(BaseModel):
+    """Hosts and weights for partitioning a federation."""
+
+    hosts: list[HostSpec] = Field(min_length=1)
+    link_weights: dict[str, float] = {}
+    "Payload size per publication key 'source/source_port'"
+    cpu_weights: dict[str, float] = {}
+    "CPU estimate per component name or component type"
+    imbalance: float = Field(default=0.1, ge=0)
+    "Allowed relative load above a host's share of the total CPU"
+    assignment: dict[str, list[str]] | None = None
+    "Component names per host name, to skip the partitioner"
+
+
+def _link_graph(
+    wiring_diagram: WiringDiagram, link_weights: dict[str, float]
+) -> dict[str, dict[str, float]]:
+    """Undirected adjacency with the summed payload weight of every link."""
+    graph = get_graph(wiring_diagram)
+    adjacency = {name: {} for name in graph.nodes}
+    for source, target, data in graph.edges(data=True):
+        if source == target:
+            continue
+        weight = link_weights.get(f"{source}/{data['source_port']}", 1.0)
+        adjacency[source][target] = adjacency[source].get(target, 0.0) + weight
+        adjacency[target][source] = adjacency[target].get(source, 0.0) + weight
+    return adjacency
+
+
+def cpu_estimates(
+    wiring_diagram: WiringDiagram, cpu_weights: dict[str, float]
+) -> dict[str, float]:
+    """CPU estimate of every component, by name first and then by type."""
+    return {
+        component.name: cpu_weights.get(
+            component.name, cpu_weights.get(component.type, 1.0)
+        )
+        for component in wiring_diagram.components
+    }
+
+
+def cut_weight(
+    wiring_diagram: WiringDiagram,
+    assignment: dict[str, list[str]],
+    link_weights: dict[str, float] | None = None,
+) -> float:
+    """Total payload weight of links between different hosts."""
+    host_of = {name: host for host, names in assignment.items() for name in names}
+    return sum(
+        (link_weights or {}).get(f"{link.source}/{link.source_port}", 1.0)
+        for link in wiring_diagram.links
+        if host_of[link.source] != host_of[link.target]
+    )
+
+
+def partition_wiring_diagram(
+    wiring_diagram: WiringDiagram, config: PartitionConfig, passes: int = 10
+) -> dict[str, list[str]]:
+    """Assign every component to a host.
+
+    Parameters
+    ----------
+    wiring_diagram : WiringDiagram
+        Federation to partition.
+    config : PartitionConfig
+        Hosts, link weights, CPU weights and allowed imbalance.
+    passes : int
+        Maximum number of refinement passes over all components.
+
+    Returns
+    -------
+    dict[str, list[str]]
+        Component names per host name, in wiring diagram order.
+    """
+    adjacency = _link_graph(wiring_diagram, config.link_weights)
+    cpu = cpu_estimates(wiring_diagram, config.cpu_weights)
+    order = {component.name: i for i, component in enumerate(wiring_diagram.components)}
+    total_cpus = sum(host.cpus for host in config.hosts)
+    total_load = sum(cpu.values())
+    shares = [total_load * host.cpus / total_cpus for host in config.hosts]
+    limits = [share * (1 + config.imbalance) for share in shares]
+
+    # Grow one part at a time, always adding the unassigned component with the
+    # heaviest links into the part, until the part reaches the host's share.
+    part = {}
+    loads = [0.0] * len(config.hosts)
+    current = 0
+    connection: dict[str, float] = {}
+    frontier: list[tuple[float, int, str]] = []
+    unassigned = iter(order)
+    while len(part) < len(order):
+        while frontier and (
+            frontier[0][2] in part or -frontier[0][0] != connection[frontier[0][2]]
+        ):
+            heapq.heappop(frontier)
+        if frontier:
+            name = heapq.heappop(frontier)[2]
+        else:
+            name = next(name for name in unassigned if name not in part)
+        # Move on once a component would end closer above the share than below.
+        full = loads[current] + cpu[name] / 2 >= shares[current]
+        if full and loads[current] > 0 and current < len(config.hosts) - 1:
+            current += 1
+            connection, frontier = {}, []
+        part[name] = current
+        loads[current] += cpu[name]
+        for neighbor, weight in adjacency[name].items():
+            if neighbor not in part:
+                connection[neighbor] = connection.get(neighbor, 0.0) + weight
+                heapq.heappush(frontier, (-connection[neighbor], order[neighbor], neighbor))
+
+    # Move components to the host they exchange the most data with.
+    for _ in range(passes):
+        moved = False
+        for name in order:
+            source = part[name]
+            traffic = [0.0] * len(config.hosts)
+            for neighbor, weight in adjacency[name].items():
+                traffic[part[neighbor]] += weight
+            best, gain = source, 0.0
+            for host in range(len(config.hosts)):
+                if host == source or loads[host] + cpu[name] > limits[host]:
+                    continue
+                if traffic[host] - traffic[source] > gain:
+                    best, gain = host, traffic[host] - traffic[source]
+            if best != source:
+                part[name] = best
+                loads[source] -= cpu[name]
+                loads[best] += cpu[name]
+                moved = True
+        if not moved:
+            break
+
+    assignment = {host.name: [] for host in config.hosts}
+    for name in order:
+        assignment[config.hosts[part[name]].name].append(name)
+    return assignment
+
+
+def generate_partitioned_runner_configs(
+    wiring_diagram: WiringDiagram,
+    component_types: dict[str, type[ComponentType]],
+    config: PartitionConfig,
+    compatibility_checker=_bad_compatability_checker,
+    target_directory=".",
+    base_port: int = 24000,
+    **kwargs,
+) -> dict[str, RunnerConfig]:
+    """Build a federation and split its run configuration across hosts.
+
+    Parameters
+    ----------
+    wiring_diagram : WiringDiagram
+        Federation to build.
+    component_types : dict[str, type[ComponentType]]
+        Wiring diagram component types to Python component types.
+    config : PartitionConfig
+        Hosts and weights, or an explicit assignment.
+    compatibility_checker : function of two types to a bool
+        Link type compatibility check.
+    target_directory : str | Path
+        Directory where all components are initialized.
+    base_port : int
+        Port of the first host's sub-broker.
+    **kwargs
+        Further `generate_runner_config` options, e.g. `max_workers`.
+
+    Returns
+    -------
+    dict[str, RunnerConfig]
+        Run configuration per host name, with the root broker on the first
+        host.
+    """
+    if "packing" in kwargs or "brokers" in kwargs:
+        raise ValueError("Partitioned builds set up brokers and do not support packing")
+    assignment = config.assignment or partition_wiring_diagram(wiring_diagram, config)
+    if set(assignment) != {host.name for host in config.hosts}:
+        raise ValueError("The assignment must list every host")
+
+    hosts = [host for host in config.hosts if assignment[host.name]]
+    clusters = [assignment[host.name] for host in hosts]
+    shared = wiring_diagram.shared_helics_config
+    root_host = hosts[0].hostname
+    if shared is not None and shared.broker is not None and shared.broker.host:
+        root_host = shared.broker.host
+    topology = BrokerTopology(
+        max_federates=max(len(cluster) for cluster in clusters),
+        base_port=base_port,
+        root_host=root_host,
+        external=any(host.hostname not in _LOCAL_HOSTNAMES for host in hosts),
+        clusters=clusters,
+    )
+    runner_config = generate_runner_config(
+        wiring_diagram,
+        component_types,
+        compatibility_checker,
+        target_directory,
+        brokers=topology,
+        **kwargs,
+    )
+
+    host_of = {name: i for i, cluster in enumerate(clusters) for name in cluster}
+    host_of |= {f"broker{i}": i for i in range(len(hosts))}
+    host_of["broker"] = 0
+    federates = {host.name: [] for host in hosts}
+    for federate in runner_config.federates:
+        host = hosts[host_of[federate.name]]
+        federates[host.name].append(federate.model_copy(update={"hostname": host.hostname}))
+    return {
+        name: RunnerConfig(name=runner_config.name, federates=host_federates)
+        for name, host_federates in federates.items()
+    }
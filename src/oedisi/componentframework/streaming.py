@@ -0,0 +1,163 @@
+"""Stream very large wiring diagram files.
+
+Generated `system.json` files can embed large component `parameters`
+(load profiles, node lists) and run to hundreds of MB. `json.load`
+followed by `WiringDiagram.model_validate` holds the whole document
+several times over in memory. This module reads the file in two passes
+with `json.JSONDecoder.raw_decode` over a growing buffer:
+
+1. `load_wiring_diagram_skeleton` keeps every top-level field and the
+   links, but drops the `parameters` of each component as soon as the
+   component has been parsed.
+2. `iter_components` yields one fully validated `Component` at a time,
+   for `initialize_federates(..., components=...)`.
+
+Peak memory is bounded by the largest single component rather than the
+whole file.
+
+Examples
+--------
+>>> wiring_diagram = load_wiring_diagram_skeleton("system.json")
+>>> generate_runner_config(
+...     wiring_diagram, component_types, components=iter_components("system.json")
+... )
+"""
+
+import json
+from collections.abc import Iterator
+from typing import Any
+
+from .system_configuration import Component, WiringDiagram
+
+DEFAULT_CHUNK_SIZE = 1 << 20
+"Number of characters read from the file at a time"
+
+_WHITESPACE = " \t\r\n"
+_ARRAY_KEYS = ("components", "links")
+
+
+class _JSONStream:
+    """Incrementally decode JSON values from a text file."""
+
+    def __init__(self, file, chunk_size: int = DEFAULT_CHUNK_SIZE):
+        self._file = file
+        self._chunk_size = chunk_size
+        self._decoder = json.JSONDecoder()
+        self._buffer = ""
+        self._pos = 0
+        self._eof = False
+
+    def _read(self, size: int) -> bool:
+        if self._pos > self._chunk_size:
+            self._buffer = self._buffer[self._pos :]
+            self._pos = 0
+        data = self._file.read(size)
+        if not data:
+            self._eof = True
+        self._buffer += data
+        return bool(data)
+
+    def peek(self) -> str:
+        """Return the next non-whitespace character without consuming it."""
+        while True:
+            while self._pos < len(self._buffer) and self._buffer[self._pos] in _WHITESPACE:
+                self._pos += 1
+            if self._pos < len(self._buffer):
+                return self._buffer[self._pos]
+            if not self._read(self._chunk_size):
+                raise ValueError("Unexpected end of JSON file")
+
+    def expect(self, characters: str) -> str:
+        """Consume the next non-whitespace character, which must be in `characters`."""
+        character = self.peek()
+        if character not in characters:
+            raise ValueError(f"Expected one of {characters!r}, got {character!r}")
+        self._pos += 1
+        return character
+
+    def value(self) -> Any:
+        """Decode the next complete JSON value."""
+        self.peek()
+        size = self._chunk_size
+        while True:
+            try:
+                value, end = self._decoder.raw_decode(self._buffer, self._pos)
+            except json.JSONDecodeError:
+                if self._eof:
+                    raise
+            else:
+                # A number at the end of the buffer may continue in the next chunk.
+                if end < len(self._buffer) or self._eof:
+                    self._pos = end
+                    return value
+            self._read(size)
+            # Grow reads geometrically so huge values are not re-decoded too often.
+            size = max(size, len(self._buffer) - self._pos)
+
+
+def iter_wiring_diagram(
+    path, chunk_size: int = DEFAULT_CHUNK_SIZE
+) -> Iterator[tuple[str, Any]]:
+    """Yield the top-level fields of a wiring diagram file incrementally.
+
+    Parameters
+    ----------
+    path : str | Path
+        Wiring diagram JSON file.
+    chunk_size : int
+        Number of characters to read at a time.
+
+    Yields
+    ------
+    tuple[str, Any]
+        ("components", component dict) for each component, ("links", link
+        dict) for each link, and (key, value) for every other field.
+    """
+    with open(path, encoding="utf-8") as f:
+        stream = _JSONStream(f, chunk_size)
+        stream.expect("{")
+        if stream.peek() == "}":
+            return
+        while True:
+            key = stream.value()
+            stream.expect(":")
+            if key in _ARRAY_KEYS:
+                stream.expect("[")
+                if stream.peek() == "]":
+                    stream.expect("]")
+                else:
+                    while True:
+                        yield key, stream.value()
+                        if stream.expect(",]") == "]":
+                            break
+            else:
+                yield key, stream.value()
+            if stream.expect(",}") == "}":
+                return
+
+
+def load_wiring_diagram_skeleton(
+    path, chunk_size: int = DEFAULT_CHUNK_SIZE
+) -> WiringDiagram:
+    """Load a wiring diagram without component parameters.
+
+    Every component gets empty `parameters`; all other fields, links and
+    validation are the same as `WiringDiagram.model_validate`.
+    """
+    fields: dict[str, Any] = {"components": [], "links": []}
+    for key, value in iter_wiring_diagram(path, chunk_size):
+        if key == "components":
+            value["parameters"] = {}
+            fields[key].append(Component.model_validate(value))
+        elif key == "links":
+            fields[key].append(value)
+        else:
+            fields[key] = value
+    return WiringDiagram.model_validate(fields)
+
+
+def iter_components(path, chunk_size: int = DEFAULT_CHUNK_SIZE) -> Iterator[Component]:
+    """Yield the validated components of a wiring diagram file one at a time."""
+    for key, value in iter_wiring_diagram(path, chunk_size):
+        if key == "components":
+            yield Component.model_validate(value)
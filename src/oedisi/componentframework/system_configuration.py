@@ -13,17 +13,27 @@ The `WiringDiagram` configuration contains a list of components
 and the links between them.
 """
 
-from collections import defaultdict
+from collections import defaultdict, deque
+from concurrent.futures import ThreadPoolExecutor
+from collections.abc import Iterable
 from typing import Any
+import hashlib
+import json
 import os
 import logging
 import shutil
 import psutil
 from abc import ABC, abstractmethod
 
-from pydantic import field_validator, BaseModel, ValidationInfo
-from oedisi.types.common import DOCKER_HUB_USER, APP_NAME
-from oedisi.types.helics_config import HELICSFederateConfig, SharedFederateConfig
+from pydantic import field_validator, BaseModel, Field, ValidationInfo
+from oedisi.types.common import DOCKER_HUB_USER, APP_NAME, ENCODING_PREFERENCE, Encoding
+from oedisi.types.helics_config import (
+    HELICSBrokerConfig,
+    HELICSFederateConfig,
+    SharedFederateConfig,
+)
+from .code_store import CODE_STORE_DIRNAME, prune_store
+from .federate_host import HOST_CONFIG, FederateHostConfig, HostMember
 
 
 class ComponentCapabilities(BaseModel):
@@ -54,6 +64,8 @@ class AnnotatedType(BaseModel):
     unit: str | None = None
     port_id: str | None = None
     "Manually set port id"
+    encodings: list[Encoding] = [Encoding.JSON]
+    "Wire encodings supported on this port"
 
     @property
     def port_name(self):
@@ -85,11 +97,18 @@ class ComponentType(ABC):
     federate should then use these names to subscribe at the right location.
     This can also be used for endpoint targets less often.
 
+    Then `generate_encoding_config` is called with the wire encoding
+    negotiated for each linked input and output port.
+
     Finally, the execute_function property defines the command
     to run the component.
     """
 
     _capabilities: ComponentCapabilities = ComponentCapabilities()
+    _entry_point: str | None = None
+    "'module:function' running one federate in a directory, required for packing"
+    _build_options: frozenset[str] = frozenset()
+    "Keyword-only `__init__` arguments from `initialize_federates` the type accepts"
 
     @abstractmethod
     def __init__(
@@ -103,11 +122,37 @@ class ComponentType(ABC):
     ):
         pass
 
+    @classmethod
+    def source_hash(cls) -> str | None:
+        """Hash of the code the component copies into its build directory.
+
+        Incremental builds reuse a component directory when this hash and
+        the component's parameters, federate config and input links are
+        unchanged. Types which return a hash must accept keyword-only
+        `reuse_code` and `code_store` arguments in `__init__`: `reuse_code`
+        skips copying their code, and `code_store` is a directory of the
+        content-addressed store (see `code_store.py`) to link the code from
+        instead of copying it. By default None, so components are always
+        rebuilt and never stored.
+        """
+        return None
+
     @abstractmethod
     def generate_input_mapping(self, links: dict[str, str]):
         """Generate input mapping from link target ports to HELICS subscription keys."""
         pass
 
+    def generate_encoding_config(
+        self,
+        input_encodings: dict[str, Encoding],
+        output_encodings: dict[str, Encoding],
+    ):
+        """Receive negotiated wire encodings for linked input and output ports.
+
+        By default this does nothing, so the component uses JSON everywhere.
+        """
+        pass
+
     @property
     @abstractmethod
     def execute_function(self) -> str:
@@ -287,7 +332,7 @@ class WiringDiagram(BaseModel):
         """Add link to wiring diagram."""
         self.links.append(link)
 
-    def get_link_map(self) -> dict[str, Link]:
+    def get_link_map(self) -> dict[str, list[Link]]:
         """Create mapping from component names to their incoming links."""
         link_map = defaultdict(list)
         for link in self.links:
@@ -313,16 +358,440 @@ class Federate(BaseModel):
     "Command to start component"
 
 
+class PackingPolicy(BaseModel):
+    """How components of one type are packed into shared host processes.
+
+    Packed components run as threads of a `federate_host` process and share
+    one HELICS core, so their type needs an `_entry_point` and broker config
+    support.
+    """
+
+    max_federates: int = Field(default=16, ge=1)
+    "Maximum number of federates in one host process"
+    group: str | None = None
+    "Types with the same group share host processes, defaults to the type name"
+
+
+FEDERATE_HOST_EXEC = "python -m oedisi.componentframework.federate_host"
+"Command running a packed host directory"
+
+
+def _plan_packing(
+    wiring_diagram: WiringDiagram,
+    component_types: dict[str, type[ComponentType]],
+    packing: dict[str, PackingPolicy],
+) -> dict[str, list[str]]:
+    """Assign packed components to hosts, in wiring diagram order.
+
+    Returns
+    -------
+    dict[str, list[str]]
+        Host name to member component names.
+    """
+    groups = defaultdict(list)
+    for component in wiring_diagram.components:
+        policy = packing.get(component.type)
+        if policy is None:
+            continue
+        component_type = component_types[component.type]
+        if component_type._entry_point is None:
+            raise ValueError(
+                f"Component type {component.type} cannot be packed without an entry point"
+            )
+        if not component_type._capabilities.broker_config:
+            raise ValueError(
+                f"Component type {component.type} cannot be packed because it does "
+                "not support HELICS configuration (capabilities.broker_config)"
+            )
+        groups[policy.group or component.type].append(component)
+
+    names = {component.name for component in wiring_diagram.components}
+    hosts = {}
+    for group, members in groups.items():
+        size = packing[members[0].type].max_federates
+        for i in range(0, len(members), size):
+            host = f"{group}_host{i // size}"
+            if host in names:
+                raise ValueError(f"Host name {host} clashes with a component name")
+            hosts[host] = [member.name for member in members[i : i + size]]
+    return hosts
+
+
+class BrokerTopology(BaseModel):
+    """Tree of sub-brokers below the root broker.
+
+    Components are clustered along links, so that tightly coupled
+    components share a sub-broker and most messages never reach the root
+    broker. Every component then connects to its cluster's sub-broker,
+    which requires broker config support and a network core type.
+    """
+
+    max_federates: int = Field(default=32, ge=1)
+    "Maximum number of federates connected to one sub-broker"
+    base_port: int = 24000
+    "Port of the first sub-broker"
+    root_port: int = 23404
+    "Root broker port if `shared_helics_config` does not set one"
+    root_host: str = "127.0.0.1"
+    "Root broker host if `shared_helics_config` does not set one"
+    external: bool = False
+    "Listen on external interfaces, for brokers on different machines"
+    clusters: list[list[str]] | None = None
+    "Component names of each sub-broker, instead of walking the link graph"
+
+    def port(self, index: int) -> int:
+        """Port of sub-broker `index`.
+
+        Brokers bind a few ports of their own and hand the following ports
+        out to the cores of their federates, so every sub-broker gets a
+        block of ports sized for `max_federates`.
+        """
+        return self.base_port + (2 * self.max_federates + 10) * index
+
+
+_LOCAL_CORE_TYPES = {"inproc", "test", "ipc", "interprocess"}
+
+
+def _check_clusters(
+    wiring_diagram: WiringDiagram,
+    hosts: dict[str, list[str]],
+    clusters: list[list[str]],
+    max_federates: int,
+) -> list[list[str]]:
+    """Validate explicit sub-broker clusters."""
+    cluster_of = {}
+    for i, members in enumerate(clusters):
+        if len(members) > max_federates:
+            raise ValueError(
+                f"Cluster {i} has {len(members)} federates, more than "
+                f"max_federates={max_federates}"
+            )
+        for name in members:
+            if name in cluster_of:
+                raise ValueError(f"Component {name} is in more than one cluster")
+            cluster_of[name] = i
+    names = {component.name for component in wiring_diagram.components}
+    if set(cluster_of) != names:
+        missing = sorted(names - set(cluster_of))
+        unknown = sorted(set(cluster_of) - names)
+        raise ValueError(
+            f"Clusters must cover every component, missing {missing}, unknown {unknown}"
+        )
+    for host, members in hosts.items():
+        if len({cluster_of[name] for name in members}) > 1:
+            raise ValueError(f"Packed host {host} is split across clusters")
+    return [list(members) for members in clusters]
+
+
+def _plan_brokers(
+    wiring_diagram: WiringDiagram,
+    component_types: dict[str, type[ComponentType]],
+    hosts: dict[str, list[str]],
+    topology: BrokerTopology,
+) -> list[list[str]]:
+    """Cluster components for sub-brokers by walking the link graph.
+
+    Components are visited breadth first along links, starting from each
+    unvisited component in wiring diagram order, and consecutive
+    components fill clusters of up to `topology.max_federates`. Packed
+    components share a core, so each host is kept in a single cluster.
+    Explicit `topology.clusters` are validated and used as they are.
+
+    Returns
+    -------
+    list[list[str]]
+        Component names connected to each sub-broker.
+    """
+    shared = wiring_diagram.shared_helics_config
+    if shared is not None and shared.core_type in _LOCAL_CORE_TYPES:
+        raise ValueError(f"Broker trees need a network core type, not {shared.core_type}")
+    for component in wiring_diagram.components:
+        if not component_types[component.type]._capabilities.broker_config:
+            raise ValueError(
+                f"Component '{component.name}' (type: {component.type}) cannot be "
+                "connected to a sub-broker because it does not support HELICS "
+                "configuration (capabilities.broker_config)"
+            )
+    if topology.clusters is not None:
+        return _check_clusters(
+            wiring_diagram, hosts, topology.clusters, topology.max_federates
+        )
+
+    unit_of = {name: host for host, members in hosts.items() for name in members}
+    units = {}
+    for component in wiring_diagram.components:
+        units.setdefault(unit_of.get(component.name, component.name), []).append(
+            component.name
+        )
+    order = {unit: i for i, unit in enumerate(units)}
+    neighbors = defaultdict(set)
+    for link in wiring_diagram.links:
+        source = unit_of.get(link.source, link.source)
+        target = unit_of.get(link.target, link.target)
+        if source != target:
+            neighbors[source].add(target)
+            neighbors[target].add(source)
+
+    clusters = [[]]
+    visited = set()
+    for start in units:
+        if start in visited:
+            continue
+        visited.add(start)
+        queue = deque([start])
+        while queue:
+            unit = queue.popleft()
+            members = units[unit]
+            if clusters[-1] and len(clusters[-1]) + len(members) > topology.max_federates:
+                clusters.append([])
+            clusters[-1].extend(members)
+            for neighbor in sorted(neighbors[unit] - visited, key=order.__getitem__):
+                visited.add(neighbor)
+                queue.append(neighbor)
+    return [cluster for cluster in clusters if cluster]
+
+
+def negotiate_encoding(
+    source_type: AnnotatedType, target_types: list[AnnotatedType]
+) -> Encoding:
+    """Choose the fastest encoding supported by a publication and all its subscribers.
+
+    Parameters
+    ----------
+    source_type : AnnotatedType
+        Type of the dynamic output.
+    target_types : list[AnnotatedType]
+        Types of every dynamic input linked to the output.
+
+    Returns
+    -------
+    Encoding
+        First encoding in `ENCODING_PREFERENCE` shared by all ports.
+
+    Raises
+    ------
+    ValueError
+        If the ports share no encoding.
+    """
+    for encoding in ENCODING_PREFERENCE:
+        if encoding in source_type.encodings and all(
+            encoding in target_type.encodings for target_type in target_types
+        ):
+            return encoding
+    raise ValueError(
+        f"No common encoding between {source_type.encodings} and "
+        f"{[target_type.encodings for target_type in target_types]}"
+    )
+
+
+MANIFEST_FILENAME = "build_manifest.json"
+"Name of the build manifest written into the target directory"
+
+
+class ManifestEntry(BaseModel):
+    """Build manifest record of a single component."""
+
+    type: str
+    "Component type name"
+    hash: str
+    "Hash of source tree, parameters, federate config and input links"
+    source_hash: str | None = None
+    "Hash of the component source tree, if the component type provides one"
+    config_hash: str | None = None
+    "Hash of parameters, federate config and input links, without the source"
+
+
+class BuildManifest(BaseModel):
+    """Record of the last build of a target directory.
+
+    Written to `build_manifest.json` after every successful build, and
+    used by incremental builds to skip components whose inputs have not
+    changed.
+    """
+
+    components: dict[str, ManifestEntry] = {}
+    "Manifest entry for each component"
+    rebuilt: list[str] = []
+    "Components initialized from scratch by the last build"
+    reused: list[str] = []
+    "Components whose code was reused by the last build"
+    removed: list[str] = []
+    "Components from the previous build no longer in the wiring diagram"
+    diagram_hash: str | None = None
+    "Hash of the wiring diagram configuration, independent of component sources"
+    build_time: float | None = None
+    "Seconds the last ``oedisi build`` took, the manifest is otherwise reproducible"
+
+    @classmethod
+    def load(cls, target_directory) -> "BuildManifest":
+        """Load the manifest of `target_directory`, or an empty one."""
+        path = os.path.join(target_directory, MANIFEST_FILENAME)
+        try:
+            with open(path) as f:
+                return cls.model_validate_json(f.read())
+        except FileNotFoundError:
+            return cls()
+        except ValueError:
+            logging.warning(f"Ignoring invalid build manifest {path}")
+            return cls()
+
+    def save(self, target_directory):
+        """Write the manifest into `target_directory`."""
+        with open(os.path.join(target_directory, MANIFEST_FILENAME), "w") as f:
+            f.write(self.model_dump_json(indent=2))
+
+
+def _diagram_hash(name: str, components: dict[str, ManifestEntry]) -> str:
+    """Hash the configuration of every component, but not their sources."""
+    content = json.dumps(
+        [name, [[key, entry.type, entry.config_hash] for key, entry in components.items()]]
+    )
+    return hashlib.sha256(content.encode("utf-8")).hexdigest()
+
+
+def _component_hash(
+    component: Component,
+    source_hash: str | None,
+    federate_config: HELICSFederateConfig,
+    links: list[Link],
+) -> str:
+    """Hash everything a component build depends on."""
+    content = json.dumps(
+        {
+            "type": component.type,
+            "source_hash": source_hash,
+            "parameters": component.parameters,
+            "federate_config": federate_config.to_dict(),
+            "host": component.host,
+            "container_port": component.container_port,
+            "links": [link.model_dump() for link in links],
+        },
+        sort_keys=True,
+        default=str,
+    )
+    return hashlib.sha256(content.encode("utf-8")).hexdigest()
+
+
+class ComponentInitializationError(Exception):
+    """Errors from several components raised during a concurrent build.
+
+    Parameters
+    ----------
+    errors : dict[str, BaseException]
+        Exception raised by each failing component, in wiring diagram order.
+    """
+
+    def __init__(self, errors: dict[str, BaseException]):
+        """Collect the errors into a single message."""
+        self.errors = errors
+        message = "\n".join(
+            f"  {name}: {type(error).__name__}: {error}" for name, error in errors.items()
+        )
+        super().__init__(f"{len(errors)} component(s) failed to initialize:\n{message}")
+
+
+def _map_components(function, names: list[str], max_workers: int | None) -> list:
+    """Apply `function` to each name, in a thread pool if `max_workers` is set.
+
+    Results are returned in the order of `names`. With a thread pool every
+    name is attempted and all failures are raised together as a
+    `ComponentInitializationError`.
+    """
+    if max_workers is None:
+        return [function(name) for name in names]
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = [executor.submit(function, name) for name in names]
+    results = []
+    errors = {}
+    for name, future in zip(names, futures):
+        error = future.exception()
+        if error is not None:
+            errors[name] = error
+        else:
+            results.append(future.result())
+    if errors:
+        raise ComponentInitializationError(errors)
+    return results
+
+
+def _federate_config(
+    component: Component,
+    wiring_diagram: WiringDiagram,
+    component_type: type[ComponentType],
+) -> HELICSFederateConfig:
+    """Derive the HELICS federate config of one component."""
+    # Generate per-component federate config
+    federate_config = None
+    if component.helics_config_override is not None:
+        logging.warning(
+            f"Component '{component.name}' has helics_config_override. "
+            "Per-component overrides can cause subtle HELICS/timing issues."
+        )
+        federate_config = component.helics_config_override.to_federate_config(
+            name=component.name
+        )
+    elif wiring_diagram.shared_helics_config is not None:
+        federate_config = wiring_diagram.shared_helics_config.to_federate_config(
+            name=component.name
+        )
+
+    # Validate broker config support
+    if federate_config is not None and not component_type._capabilities.broker_config:
+        raise ValueError(
+            f"Component '{component.name}' (type: {component.type}) does not support "
+            'HELICS configuration. Add \'"capabilities": {"broker_config": true}\' '
+            "to the component's component_definition.json file."
+        )
+    elif federate_config is None:
+        federate_config = HELICSFederateConfig(name=component.name)
+    return federate_config
+
+
+def _write_host(
+    host: str,
+    members: list[str],
+    component_types: dict[str, type[ComponentType]],
+    by_name: dict[str, Component],
+    target_directory,
+) -> Federate:
+    """Write the host directory of packed components and return its `Federate`."""
+    directory = os.path.join(target_directory, host)
+    os.makedirs(directory, exist_ok=True)
+    config = FederateHostConfig(members=[])
+    for name in members:
+        entry_point = component_types[by_name[name].type]._entry_point
+        # Packing policies are rejected for types without an entry point.
+        assert entry_point is not None
+        config.members.append(
+            HostMember(
+                name=name, directory=os.path.join(os.pardir, name), entry_point=entry_point
+            )
+        )
+    with open(os.path.join(directory, HOST_CONFIG), "w") as f:
+        f.write(config.model_dump_json(indent=2))
+    return Federate(directory=host, name=host, exec=FEDERATE_HOST_EXEC)
+
+
 def initialize_federates(
     wiring_diagram: WiringDiagram,
     component_types: dict[str, type[ComponentType]],
     compatability_checker,
     target_directory=".",
+    max_workers: int | None = None,
+    incremental: bool = False,
+    code_store: bool = False,
+    components: Iterable[Component] | None = None,
+    packing: dict[str, PackingPolicy] | None = None,
+    brokers: BrokerTopology | None = None,
+    base_directory=".",
 ) -> list[Federate]:
     """Initialize all the federates.
 
     Extracts config and sends it to each Component in an initalization step,
     then finds all dynamic inputs and outputs and sends input mappings.
+    A publication has a single encoding, so the encoding of every link
+    from the same output port is negotiated together.
 
     Parameters
     ----------
@@ -332,48 +801,171 @@ def initialize_federates(
         Check if source type is compatible with target_type
     target_directory : str | Path = "."
         Directory where all components should be initialized.
+    max_workers : int, optional
+        Initialize components and write their input mappings in a thread
+        pool of this size. Component initialization is dominated by copying
+        directories and writing files, so threads overlap the I/O. By default
+        components are initialized serially.
+    incremental : bool = False
+        Reuse the code of components whose entry in the previous
+        `build_manifest.json` is unchanged, and delete the directories of
+        components which were removed from the wiring diagram. Parameter
+        and mapping files are always rewritten.
+    code_store : bool = False
+        Store each distinct component source tree once in
+        `target_directory/.code_store` and link instance directories to it
+        with reflinks, hardlinks or symlinks, whichever the filesystem
+        supports. Unused store entries are removed.
+    components : Iterable[Component], optional
+        Components with their parameters, in the order of
+        `wiring_diagram.components`, e.g. from
+        `streaming.iter_components`. The wiring diagram then only needs
+        names, types and links, and each component's parameters can be
+        freed as soon as it is initialized. Requires serial initialization.
+        Component types with "release_parameters" in their `_build_options`
+        get `release_parameters=True` and should not keep their parameters.
+    packing : dict[str, PackingPolicy], optional
+        Component type names whose components are run as threads of shared
+        host processes instead of one process each. Packed components get
+        the `core_name` of their host and a core expecting every member.
+    brokers : BrokerTopology, optional
+        Connect each component to the sub-broker of its cluster instead of
+        the root broker.
+    base_directory : str | Path = "."
+        Directory relative ``$ref`` parameter files are resolved against,
+        usually the directory of the wiring diagram. Passed to component
+        types with "base_directory" in their `_build_options`.
 
     Returns
     -------
-    List of `Federate` run configuration
+    List of `Federate` run configuration, in wiring diagram order. A host
+    process takes the place of its first member.
 
     Raises
     ------
     ComponentType classes may return errors on configuration.
+    With `max_workers`, every component is attempted and the errors are
+    raised together as a `ComponentInitializationError`.
     """
-    components = {}
+    hosts, clusters = _plan_build(wiring_diagram, component_types, packing, brokers)
+    return _initialize_federates(
+        wiring_diagram,
+        component_types,
+        compatability_checker,
+        target_directory,
+        max_workers,
+        incremental,
+        code_store,
+        components,
+        brokers,
+        base_directory,
+        hosts,
+        clusters,
+    )
+
+
+def _plan_build(
+    wiring_diagram: WiringDiagram,
+    component_types: dict[str, type[ComponentType]],
+    packing: dict[str, PackingPolicy] | None,
+    brokers: BrokerTopology | None,
+) -> tuple[dict[str, list[str]], list[list[str]] | None]:
+    """Packed hosts and sub-broker clusters, None without a broker tree."""
+    hosts = _plan_packing(wiring_diagram, component_types, packing or {})
+    clusters = None
+    if brokers is not None:
+        clusters = _plan_brokers(wiring_diagram, component_types, hosts, brokers)
+    return hosts, clusters
+
+
+def _initialize_federates(
+    wiring_diagram: WiringDiagram,
+    component_types: dict[str, type[ComponentType]],
+    compatability_checker,
+    target_directory,
+    max_workers: int | None,
+    incremental: bool,
+    code_store: bool,
+    components: Iterable[Component] | None,
+    brokers: BrokerTopology | None,
+    base_directory,
+    hosts: dict[str, list[str]],
+    clusters: list[list[str]] | None,
+) -> list[Federate]:
+    """Initialize the federates with packed hosts and clusters from `_plan_build`."""
+    by_name = {component.name: component for component in wiring_diagram.components}
+    names = list(by_name)
     link_map = wiring_diagram.get_link_map()
-    for component in wiring_diagram.components:
-        directory = os.path.join(target_directory, component.name)
-        if not os.path.exists(directory):
-            os.makedirs(directory)
-        component_type = component_types[component.type]
 
-        # Generate per-component federate config
-        federate_config = None
-        if component.helics_config_override is not None:
-            logging.warning(
-                f"Component '{component.name}' has helics_config_override. "
-                "Per-component overrides can cause subtle HELICS/timing issues."
-            )
-            federate_config = component.helics_config_override.to_federate_config(
-                name=component.name
+    previous = BuildManifest.load(target_directory) if incremental else BuildManifest()
+    manifest_path = os.path.join(target_directory, MANIFEST_FILENAME)
+    if os.path.exists(manifest_path):
+        # Only a completed build leaves a manifest behind.
+        os.remove(manifest_path)
+    host_of = {name: host for host, members in hosts.items() for name in members}
+    port_of = {}
+    if brokers is not None and clusters is not None:
+        port_of = {
+            name: brokers.port(i) for i, members in enumerate(clusters) for name in members
+        }
+    # Source trees are hashed once per type. The manifest keeps the hashes
+    # also for full builds, where the run history uses them.
+    source_hashes = {
+        type_name: component_types[type_name].source_hash()
+        for type_name in {component.type for component in wiring_diagram.components}
+    }
+
+    def initialize(component: Component) -> tuple[ComponentType, ManifestEntry, bool]:
+        name = component.name
+        component_type = component_types[component.type]
+        federate_config = _federate_config(component, wiring_diagram, component_type)
+        if name in host_of:
+            # The shared core must wait for every member before initializing.
+            host = host_of[name]
+            core_init = f"--federates={len(hosts[host])}"
+            if federate_config.core_init:
+                core_init = f"{core_init} {federate_config.core_init}"
+            federate_config = federate_config.model_copy(
+                update={"core_name": f"{host}_core", "core_init": core_init}
             )
-        elif wiring_diagram.shared_helics_config is not None:
-            federate_config = wiring_diagram.shared_helics_config.to_federate_config(
-                name=component.name
+        if name in port_of:
+            # Sub-brokers run next to their federates, the root may not.
+            broker = federate_config.broker or HELICSBrokerConfig()
+            federate_config = federate_config.model_copy(
+                update={
+                    "broker": broker.model_copy(
+                        update={"host": None, "port": port_of[name]}
+                    )
+                }
             )
-
-        # Validate broker config support
-        if federate_config is not None and not component_type._capabilities.broker_config:
-            raise ValueError(
-                f"Component '{component.name}' (type: {component.type}) does not support "
-                'HELICS configuration. Add \'"capabilities": {"broker_config": true}\' '
-                "to the component's component_definition.json file."
-            )
-        elif federate_config is None:
-            federate_config = HELICSFederateConfig(name=component.name)
-
+        source_hash = source_hashes[component.type]
+        entry = ManifestEntry(
+            type=component.type,
+            hash=_component_hash(component, source_hash, federate_config, link_map[name]),
+            source_hash=source_hash,
+            config_hash=_component_hash(component, None, federate_config, link_map[name]),
+        )
+        directory = os.path.join(target_directory, name)
+        reuse = (
+            source_hash is not None
+            and previous.components.get(name) == entry
+            and os.path.isdir(directory)
+        )
+        if name in previous.components and not reuse and os.path.isdir(directory):
+            shutil.rmtree(directory)
+        os.makedirs(directory, exist_ok=True)
+
+        options = {}
+        if "release_parameters" in component_type._build_options:
+            options["release_parameters"] = components is not None
+        if "base_directory" in component_type._build_options:
+            options["base_directory"] = base_directory
+        if source_hash is not None:
+            options["reuse_code"] = reuse
+            if code_store:
+                options["code_store"] = os.path.join(
+                    target_directory, CODE_STORE_DIRNAME, source_hash
+                )
         initialized_component = component_type(
             federate_config,
             component.parameters,
@@ -381,12 +973,52 @@ def initialize_federates(
             component.host,
             component.container_port,
             component.type,
+            **options,
         )
-        components[component.name] = initialized_component
+        return initialized_component, entry, reuse
 
+    if components is None:
+        results = _map_components(
+            lambda name: initialize(by_name[name]), names, max_workers
+        )
+    elif max_workers is not None:
+        raise ValueError("Streamed components can only be initialized serially")
+    else:
+        results = []
+        for name, component in zip(names, components, strict=True):
+            if component.name != name:
+                raise ValueError(f"Expected component {name}, got {component.name}")
+            # Only the current component's parameters are held in memory.
+            results.append(initialize(component))
+    initialized = dict(zip(names, results))
+    initialized_components = {name: result[0] for name, result in initialized.items()}
+    entries = {name: result[1] for name, result in initialized.items()}
+    manifest = BuildManifest(
+        components=entries,
+        rebuilt=[name for name, result in initialized.items() if not result[2]],
+        reused=[name for name, result in initialized.items() if result[2]],
+        removed=[name for name in previous.components if name not in by_name],
+        diagram_hash=_diagram_hash(wiring_diagram.name, entries),
+    )
+    for name in manifest.removed:
+        directory = os.path.join(target_directory, name)
+        if os.path.isdir(directory):
+            shutil.rmtree(directory)
+    if code_store:
+        prune_store(target_directory, {h for h in source_hashes.values() if h})
+
+    # Port types are read once per component rather than once per link.
+    outputs = {
+        name: component.dynamic_outputs
+        for name, component in initialized_components.items()
+    }
+    inputs = {
+        name: component.dynamic_inputs for name, component in initialized_components.items()
+    }
+    output_links = defaultdict(list)
     for link in wiring_diagram.links:
-        source_types = components[link.source].dynamic_outputs
-        target_types = components[link.target].dynamic_inputs
+        source_types = outputs[link.source]
+        target_types = inputs[link.target]
         assert (
             link.source_port in source_types
         ), f"{link.source} does not have {link.source_port}"
@@ -398,18 +1030,44 @@ def initialize_federates(
         assert compatability_checker(
             source_type, target_type
         ), f"{source_type} is not compatible with {target_type}"
-
-    federates = []
-    for name, component in components.items():
-        links = link_map[name]
-        component.generate_input_mapping(
-            {link.target_port: f"{link.source}/{link.source_port}" for link in links}
+        output_links[(link.source, link.source_port)].append(link)
+
+    input_encodings = defaultdict(dict)
+    output_encodings = defaultdict(dict)
+    for (source, source_port), links in output_links.items():
+        encoding = negotiate_encoding(
+            outputs[source][source_port],
+            [inputs[link.target][link.target_port] for link in links],
         )
+        output_encodings[source][source_port] = encoding
+        for link in links:
+            input_encodings[link.target][link.target_port] = encoding
 
-        federates.append(
-            Federate(directory=name, name=name, exec=component.execute_function)
+    def finalize(name: str) -> Federate:
+        component = initialized_components[name]
+        component.generate_input_mapping(
+            {
+                link.target_port: f"{link.source}/{link.source_port}"
+                for link in link_map[name]
+            }
         )
+        component.generate_encoding_config(input_encodings[name], output_encodings[name])
+        return Federate(directory=name, name=name, exec=component.execute_function)
 
+    federates = []
+    for federate in _map_components(finalize, names, max_workers):
+        host = host_of.get(federate.name)
+        if host is None:
+            federates.append(federate)
+        elif hosts[host][0] == federate.name:
+            federates.append(
+                _write_host(host, hosts[host], component_types, by_name, target_directory)
+            )
+    manifest.save(target_directory)
+    logging.info(
+        f"Built {len(manifest.rebuilt)} components, reused {len(manifest.reused)}, "
+        f"removed {len(manifest.removed)}"
+    )
     return federates
 
 
@@ -442,6 +1100,13 @@ def generate_runner_config(
     component_types: dict[str, type[ComponentType]],
     compatibility_checker=_bad_compatability_checker,
     target_directory=".",
+    max_workers: int | None = None,
+    incremental: bool = False,
+    code_store: bool = False,
+    components: Iterable[Component] | None = None,
+    packing: dict[str, PackingPolicy] | None = None,
+    brokers: BrokerTopology | None = None,
+    base_directory=".",
 ):
     """Create HELICS run configuration from wiring diagram and component types.
 
@@ -455,6 +1120,28 @@ def generate_runner_config(
     compatibility_checker: function of two types to a bool
         Each link uses the compatability_checker to ensure the link types are
         compatible.
+    target_directory : str | Path = "."
+        Directory where all components should be initialized.
+    max_workers : int, optional
+        Number of threads used to initialize components concurrently.
+        See `initialize_federates`.
+    incremental : bool = False
+        Reuse unchanged components from the previous build in
+        `target_directory`. See `initialize_federates`.
+    code_store : bool = False
+        Link component code from a deduplicated store instead of copying
+        it. See `initialize_federates`.
+    components : Iterable[Component], optional
+        Stream of components with parameters. See `initialize_federates`.
+    packing : dict[str, PackingPolicy], optional
+        Run components of these types as threads of shared host processes.
+        See `initialize_federates`.
+    brokers : BrokerTopology, optional
+        Add a sub-broker federate per cluster of linked components below the
+        root broker. See `initialize_federates`.
+    base_directory : str | Path = "."
+        Directory relative ``$ref`` parameter files are resolved against.
+        See `initialize_federates`.
 
     Returns
     -------
@@ -465,12 +1152,26 @@ def generate_runner_config(
     ------
     Can raise any exception from component type initialization
     """
-    federates = initialize_federates(
-        wiring_diagram, component_types, compatibility_checker, target_directory
+    # The sub-brokers must serve exactly the clusters the federates connect to.
+    hosts, clusters = _plan_build(wiring_diagram, component_types, packing, brokers)
+    federates = _initialize_federates(
+        wiring_diagram,
+        component_types,
+        compatibility_checker,
+        target_directory,
+        max_workers,
+        incremental,
+        code_store,
+        components,
+        brokers,
+        base_directory,
+        hosts,
+        clusters,
     )
 
-    # Build broker command with SharedHELICSConfig
-    broker_cmd = f"helics_broker -f {len(federates)}"
+    # Build broker command with SharedHELICSConfig. The broker counts HELICS
+    # federates, which differs from the number of processes when packing.
+    broker_cmd = f"helics_broker -f {len(wiring_diagram.components)}"
 
     if wiring_diagram.shared_helics_config is not None:
         cfg = wiring_diagram.shared_helics_config
@@ -486,6 +1187,16 @@ def generate_runner_config(
             if cfg.broker.initstring is not None:
                 broker_cmd += f" {cfg.broker.initstring}"
 
+    sub_brokers = []
+    if brokers is not None and clusters is not None:
+        sub_brokers = _sub_broker_federates(wiring_diagram, hosts, clusters, brokers)
+        cfg = wiring_diagram.shared_helics_config
+        if cfg is None or cfg.broker is None or cfg.broker.port is None:
+            broker_cmd += f" --port {brokers.root_port}"
+        broker_cmd += f" --minbrokers={len(sub_brokers)}"
+        if brokers.external:
+            broker_cmd += " --ipv4"
+
     broker_cmd += " --loglevel=warning"
 
     broker_federate = Federate(
@@ -493,4 +1204,36 @@ def generate_runner_config(
         name="broker",
         exec=broker_cmd,
     )
-    return RunnerConfig(name=wiring_diagram.name, federates=([*federates, broker_federate]))
+    return RunnerConfig(
+        name=wiring_diagram.name, federates=[*federates, *sub_brokers, broker_federate]
+    )
+
+
+def _sub_broker_federates(
+    wiring_diagram: WiringDiagram,
+    hosts: dict[str, list[str]],
+    clusters: list[list[str]],
+    brokers: BrokerTopology,
+) -> list[Federate]:
+    """Sub-broker federates connecting each cluster to the root broker."""
+    cfg = wiring_diagram.shared_helics_config or SharedFederateConfig()
+    root = cfg.broker or HELICSBrokerConfig()
+    root_address = f"{root.host or brokers.root_host}:{root.port or brokers.root_port}"
+
+    names = {component.name for component in wiring_diagram.components} | set(hosts)
+    sub_brokers = []
+    for i, members in enumerate(clusters):
+        name = f"broker{i}"
+        if name in names:
+            raise ValueError(f"Sub-broker name {name} clashes with a component name")
+        cmd = f"helics_broker -f {len(members)}"
+        if cfg.core_type is not None:
+            cmd += f" -t {cfg.core_type}"
+        cmd += f" --port {brokers.port(i)} --broker_address={root_address}"
+        if root.key is not None:
+            cmd += f" --brokerkey {root.key}"
+        if brokers.external:
+            cmd += " --ipv4"
+        cmd += " --loglevel=warning"
+        sub_brokers.append(Federate(directory=".", name=name, exec=cmd))
+    return sub_brokers
@@ -1,11 +1,136 @@
 """Wiring Diagram utilities.
 
 Wiring diagrams can be hard to manage in their final list based form.
-Some utilities plot, and future additions include nested wiring
-diagram composition and a programmatic interface.
+Some utilities plot, `WiringDiagramBuilder` is a programmatic interface
+with indexed lookups, and future additions include nested wiring
+diagram composition.
 """
 
-from .system_configuration import WiringDiagram
+from collections import defaultdict
+
+from .system_configuration import Component, Link, WiringDiagram
+from oedisi.types.helics_config import SharedFederateConfig
+
+
+class WiringDiagramBuilder:
+    """Indexed, incrementally validated wiring diagram construction.
+
+    `WiringDiagram` stores plain lists, so every lookup is a scan and
+    errors only show up when the whole diagram is validated. The builder
+    keeps components by name and links by source and target, and checks
+    every `add_component` and `add_link` immediately:
+
+    - component names are unique,
+    - links refer to existing components,
+    - a link is not added twice and an input port has a single source.
+
+    Examples
+    --------
+    >>> builder = WiringDiagramBuilder("sensors")
+    >>> feeder = builder.add_component(Component(name="feeder", type="F", parameters={}))
+    >>> sensor = builder.add_component(Component(name="sensor", type="S", parameters={}))
+    >>> builder.add_link(feeder.port("voltages").connect(sensor.port("voltages")))
+    >>> wiring_diagram = builder.to_wiring_diagram()
+    """
+
+    def __init__(self, name: str, shared_helics_config: SharedFederateConfig | None = None):
+        """Create an empty builder."""
+        self.name = name
+        self.shared_helics_config = shared_helics_config
+        self._components: dict[str, Component] = {}
+        self._links: list[Link] = []
+        self._links_by_source: defaultdict[str, list[Link]] = defaultdict(list)
+        self._links_by_target: defaultdict[str, list[Link]] = defaultdict(list)
+        self._inputs: dict[tuple[str, str], Link] = {}
+
+    @classmethod
+    def from_wiring_diagram(cls, wiring_diagram: WiringDiagram) -> "WiringDiagramBuilder":
+        """Index an existing wiring diagram, validating its links."""
+        builder = cls(wiring_diagram.name, wiring_diagram.shared_helics_config)
+        for component in wiring_diagram.components:
+            builder.add_component(component)
+        for link in wiring_diagram.links:
+            builder.add_link(link)
+        return builder
+
+    def add_component(self, component: Component) -> Component:
+        """Add a component, raising ValueError if the name is taken."""
+        if component.name in self._components:
+            raise ValueError(f"Component {component.name} already exists")
+        self._components[component.name] = component
+        return component
+
+    def add_link(self, link: Link) -> Link:
+        """Add a link, raising ValueError if it is invalid or duplicated."""
+        for name in (link.source, link.target):
+            if name not in self._components:
+                raise ValueError(f"Link {link} refers to unknown component {name}")
+        existing = self._inputs.get((link.target, link.target_port))
+        if existing == link:
+            raise ValueError(f"Duplicate link {link}")
+        if existing is not None:
+            raise ValueError(
+                f"{link.target}.{link.target_port} is already linked to "
+                f"{existing.source}.{existing.source_port}"
+            )
+        self._inputs[(link.target, link.target_port)] = link
+        self._links.append(link)
+        self._links_by_source[link.source].append(link)
+        self._links_by_target[link.target].append(link)
+        return link
+
+    def component(self, name: str) -> Component:
+        """Component by name."""
+        return self._components[name]
+
+    def __contains__(self, name: str) -> bool:
+        """Check whether a component with `name` exists."""
+        return name in self._components
+
+    def __len__(self) -> int:
+        """Return the number of components."""
+        return len(self._components)
+
+    @property
+    def components(self) -> list[Component]:
+        """Components in insertion order."""
+        return list(self._components.values())
+
+    @property
+    def links(self) -> list[Link]:
+        """Links in insertion order."""
+        return list(self._links)
+
+    def links_from(self, name: str, port: str | None = None) -> list[Link]:
+        """Links published by component `name`, optionally only from `port`."""
+        links = self._links_by_source.get(name, [])
+        if port is None:
+            return list(links)
+        return [link for link in links if link.source_port == port]
+
+    def links_to(self, name: str) -> list[Link]:
+        """Links subscribed to by component `name`."""
+        return list(self._links_by_target.get(name, []))
+
+    def get_link_map(self) -> dict[str, list[Link]]:
+        """Create mapping from component names to their incoming links."""
+        link_map = defaultdict(list)
+        for name, links in self._links_by_target.items():
+            link_map[name] = list(links)
+        return link_map
+
+    def to_wiring_diagram(self) -> WiringDiagram:
+        """Create the `WiringDiagram`, which serializes like one built from lists.
+
+        Components and links were validated as they were added, so the
+        model is constructed without validating the lists again.
+        """
+        return WiringDiagram.model_construct(
+            name=self.name,
+            components=self.components,
+            links=self.links,
+            shared_helics_config=self.shared_helics_config,
+        )
 
 
 def get_graph(wiring_diagram: WiringDiagram):
@@ -1,5 +1,7 @@
 """Utilities for HELICS broker time data management."""
 
+import shlex
+
 from pydantic import BaseModel
 
 
@@ -11,6 +13,37 @@ class TimeData(BaseModel):
     send_time: float
 
 
+def broker_init_args(n, broker_args: str = "") -> tuple[str, str]:
+    """Core type and init string of an in-process root broker.
+
+    Parameters
+    ----------
+    n : int
+        Number of federates, used unless `broker_args` has ``-f``.
+    broker_args : str
+        ``helics_broker`` command line to reuse, e.g. the exec of the
+        broker in a runner config, for its federate and sub-broker
+        counts, core type, port and key.
+
+    Returns
+    -------
+    tuple[str, str]
+        Core type and init string for ``helicsCreateBroker``.
+    """
+    args = shlex.split(broker_args)
+    if args and args[0].endswith("helics_broker"):
+        args = args[1:]
+    core_type = "zmq"
+    for flag in ("-t", "--coretype", "--core_type"):
+        if flag in args:
+            i = args.index(flag)
+            core_type = args[i + 1]
+            del args[i : i + 2]
+    if "-f" not in args and not any(a.startswith("--federates") for a in args):
+        args = ["-f", str(n), *args]
+    return core_type, shlex.join([*args, "--name=mainbroker"])
+
+
 def pprint_time_data(time_data):
     """Pretty print time data for a federate."""
     print(
@@ -22,18 +55,25 @@ def pprint_time_data(time_data):
     )
 
 
+def iter_federates(response):
+    """Federate entries of a broker query response, including sub-brokers."""
+    for core in response.get("cores", []):
+        yield from core.get("federates", [])
+    for broker in response.get("brokers", []):
+        yield from iter_federates(broker)
+
+
 def parse_time_data(response):
     """Parse broker response into list of TimeData objects."""
     time_data = []
-    for core in response["cores"]:
-        for fed in core["federates"]:
-            time_data.append(
-                TimeData(
-                    name=fed["attributes"]["name"],
-                    granted_time=fed["granted_time"],
-                    send_time=fed["send_time"],
-                )
+    for fed in iter_federates(response):
+        time_data.append(
+            TimeData(
+                name=fed["attributes"]["name"],
+                granted_time=fed["granted_time"],
+                send_time=fed["send_time"],
             )
+        )
 
     return time_data
 
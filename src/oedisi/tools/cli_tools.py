@@ -1,9 +1,12 @@
 """CLI tools for building and running OEDISI simulations."""
 
+from concurrent.futures import ThreadPoolExecutor
+import datetime
 from typing import Any
 from pathlib import Path
 from uuid import uuid4
 import subprocess
+import time
 import yaml
 import json
 import os
@@ -16,8 +19,20 @@ from oedisi.componentframework.basic_component import (
     ComponentDescription,
 )
 
+from oedisi.componentframework.federate_host import load_entry_point
 from oedisi.componentframework.mock_component import MockComponent
+from oedisi.componentframework.partition import (
+    PartitionConfig,
+    generate_partitioned_runner_configs,
+)
+from oedisi.componentframework.streaming import (
+    iter_components,
+    load_wiring_diagram_skeleton,
+)
 from oedisi.componentframework.system_configuration import (
+    BrokerTopology,
+    BuildManifest,
+    PackingPolicy,
     RunnerConfig,
     generate_runner_config,
     WiringDiagram,
@@ -25,7 +40,17 @@ from oedisi.componentframework.system_configuration import (
 )
 
 
-from .pausing_broker import PausingBroker
+from .pausing_broker import Hook, PausingBroker
+from .profiler import ProfilingBroker
+from .run_history import RunHistory
+from .run_summary import (
+    SUMMARY_FILE,
+    PeakMemoryMonitor,
+    remove_profile,
+    summarize_run,
+    write_profiled_runner,
+)
+from .supervisor import RunResult, run_runner_config
 from .testing_broker import TestingBroker
 from .metrics import evaluate_estimate
 
@@ -119,6 +144,45 @@ def _get_basic_component(filename):
     "--simulation-id",
     help="Simulation ID for kubernetres or docker compose configurations.",
 )
+@click.option(
+    "-j",
+    "--jobs",
+    type=click.IntRange(min=1),
+    help="Initialize this many components concurrently (local builds only).",
+)
+@click.option(
+    "--incremental",
+    is_flag=True,
+    default=False,
+    help="Reuse components unchanged since the last build in the target directory.",
+)
+@click.option(
+    "--code-store",
+    is_flag=True,
+    default=False,
+    help="Store each component's code once and link it into instance directories.",
+)
+@click.option(
+    "--streaming",
+    is_flag=True,
+    default=False,
+    help="Read system.json incrementally, keeping one component's parameters in memory.",
+)
+@click.option(
+    "--packing",
+    type=click.Path(exists=True, dir_okay=False),
+    help="JSON file mapping component types to packing policies (local builds only).",
+)
+@click.option(
+    "--broker-tree",
+    type=click.IntRange(min=1),
+    help="Connect linked components through sub-brokers of at most this many federates.",
+)
+@click.option(
+    "--partition",
+    type=click.Path(exists=True, dir_okay=False),
+    help="JSON partition config; writes one system_runner_<host>.json per host.",
+)
 def build(
     target_directory,
     system,
@@ -129,6 +193,13 @@ def build(
     helics_core_type,
     helics_broker_key,
     simulation_id,
+    jobs,
+    incremental,
+    code_store,
+    streaming,
+    packing,
+    broker_tree,
+    partition,
 ):
     r"""Build to the simulation folder.
 
@@ -152,6 +223,29 @@ def build(
         A boolean specifying whether or not we're using the multi-container approach
     broker_port: float
         The port of the broker. If using kubernetes, is internal to k8s
+    jobs: int, optional
+        Number of threads used to initialize components. All component errors
+        are reported together.
+    incremental: bool
+        Only rebuild components whose code, parameters, HELICS config or
+        input links changed since the last build (see build_manifest.json).
+    code_store: bool
+        Deduplicate component code in target_directory/.code_store and link
+        it into each component directory.
+    streaming: bool
+        Parse the wiring diagram incrementally and initialize components as
+        they are read, for very large system.json files. Local builds only,
+        and not combined with jobs.
+    packing: str, optional
+        JSON file like ``{"Recorder": {"max_federates": 32}}``. Components of
+        these types run as threads of shared host processes.
+    broker_tree: int, optional
+        Cluster components along links and connect each cluster of at most
+        this many federates to its own sub-broker below the root broker.
+    partition: str, optional
+        JSON `PartitionConfig` with hosts, link payload sizes and CPU
+        estimates. Components are split across the hosts and each host gets
+        its own runner config with a sub-broker.
     """
     click.echo(f"Loading the components defined in {component_dict}")
     with open(component_dict) as f:
@@ -162,8 +256,17 @@ def build(
         }
 
     click.echo(f"Loading system json {system}")
-    with open(system) as f:
-        wiring_diagram = WiringDiagram.model_validate(json.load(f))
+    components = None
+    if streaming:
+        if multi_container or jobs is not None:
+            raise click.UsageError(
+                "--streaming is not supported with --multi-container or --jobs."
+            )
+        wiring_diagram = load_wiring_diagram_skeleton(system)
+        components = iter_components(system)
+    else:
+        with open(system) as f:
+            wiring_diagram = WiringDiagram.model_validate(json.load(f))
 
     if helics_port or helics_core_type or helics_broker_key:
         if multi_container:
@@ -188,7 +291,27 @@ def build(
 
         wiring_diagram.shared_helics_config = shared_config
 
+    packing_policies = None
+    if packing is not None:
+        if multi_container:
+            raise click.UsageError("--packing is not supported for multi-container builds.")
+        with open(packing) as f:
+            packing_policies = {
+                name: PackingPolicy.model_validate(policy)
+                for name, policy in json.load(f).items()
+            }
+    if broker_tree is not None and multi_container:
+        raise click.UsageError("--broker-tree is not supported for multi-container builds.")
+    if partition is not None and (
+        multi_container or streaming or packing is not None or broker_tree is not None
+    ):
+        raise click.UsageError(
+            "--partition is not supported with --multi-container, --streaming, "
+            "--packing or --broker-tree."
+        )
+
     click.echo(f"Building system in {target_directory}")
+    start = time.perf_counter()
 
     if multi_container:
         # Validate no broker overrides in multicontainer mode
@@ -223,14 +346,63 @@ def build(
             wiring_diagram, simulation_dir, broker_port, simulation_id
         )
 
+    elif partition is not None:
+        with open(partition) as f:
+            partition_config = PartitionConfig.model_validate(json.load(f))
+        runner_configs = generate_partitioned_runner_configs(
+            wiring_diagram,
+            component_types,
+            partition_config,
+            target_directory=target_directory,
+            max_workers=jobs,
+            incremental=incremental,
+            code_store=code_store,
+            base_directory=os.path.dirname(os.path.abspath(system)),
+        )
+        for host, runner_config in runner_configs.items():
+            runner_path = f"{target_directory}/system_runner_{host}.json"
+            with open(runner_path, "w") as f:
+                f.write(runner_config.model_dump_json(indent=2))
+            click.echo(
+                f"Host {host}: {len(runner_config.federates)} federates in {runner_path}"
+            )
+        _save_build_time(target_directory, time.perf_counter() - start)
+
     else:
         runner_config = generate_runner_config(
-            wiring_diagram, component_types, target_directory=target_directory
+            wiring_diagram,
+            component_types,
+            target_directory=target_directory,
+            max_workers=jobs,
+            incremental=incremental,
+            code_store=code_store,
+            components=components,
+            packing=packing_policies,
+            brokers=None
+            if broker_tree is None
+            else BrokerTopology(max_federates=broker_tree),
+            base_directory=os.path.dirname(os.path.abspath(system)),
         )
 
         with open(f"{target_directory}/system_runner.json", "w") as f:
             f.write(runner_config.model_dump_json(indent=2))
 
+        manifest = _save_build_time(target_directory, time.perf_counter() - start)
+        click.echo(
+            f"Rebuilt {len(manifest.rebuilt)}, reused {len(manifest.reused)}, "
+            f"removed {len(manifest.removed)} components"
+        )
+        for name in manifest.removed:
+            click.echo(f"  removed {name}")
+
+
+def _save_build_time(target_directory, build_time: float) -> BuildManifest:
+    """Record the build time in the build manifest for the run history."""
+    manifest = BuildManifest.load(target_directory)
+    manifest.build_time = build_time
+    manifest.save(target_directory)
+    return manifest
+
 
 def validate_optional_inputs(wiring_diagram: WiringDiagram):
     """Validate required host and container_port for multi-container."""
@@ -491,14 +663,182 @@ def create_docker_compose_file(
     type=click.Path(),
     help="Location of helics run json. Usually build/system_runner.json",
 )
-def run(runner):
+@click.option(
+    "--native",
+    is_flag=True,
+    default=False,
+    help="Supervise federates directly instead of using helics run.",
+)
+@click.option(
+    "--timeout",
+    type=float,
+    help="Wall-clock limit in seconds for the whole simulation (--native only).",
+)
+@click.option(
+    "--grace-period",
+    default=5.0,
+    show_default=True,
+    help="Seconds federates get to exit on teardown before being killed (--native only).",
+)
+@click.option(
+    "--summary/--no-summary",
+    default=False,
+    show_default=True,
+    help="Profile the run with HELICS and save run_summary.json.",
+)
+@click.option(
+    "--history",
+    type=click.Path(dir_okay=False),
+    envvar="OEDISI_RUN_HISTORY",
+    help="SQLite run history to record the run summary in, implies --summary.",
+)
+def run(runner, native, timeout, grace_period, summary, history):
     """Run HELICS simulation using helics run command.
 
+    With --native, federates are started and supervised by oedisi: their
+    output is tagged with the federate name, the whole simulation is torn
+    down as soon as one federate fails or the timeout expires, and the exit
+    code and start latency of every federate are reported.
+
+    With --summary, the run is profiled with HELICS and a run summary
+    with the wall-clock start and end, time steps, grant latencies and
+    simulated seconds per wall second is saved as run_summary.json next
+    to the runner config. The HELICS profile grows with every time step
+    and is deleted once summarized. With --history, the summary is also
+    recorded in the run history database. See compare-runs.
+
     Examples::
 
         oedisi run
+
+        oedisi run --native --timeout 3600
+
+        oedisi run --summary --history runs.sqlite
+    """
+    summary = summary or history is not None
+    if not summary:
+        if not native:
+            subprocess.run(["helics", "run", f"--path={runner}"])
+            return
+        _check_result(run_runner_config(runner, timeout=timeout, grace_period=grace_period))
+        return
+
+    with open(runner) as f:
+        runner_config = RunnerConfig.model_validate(json.load(f))
+    build_directory = os.path.dirname(runner)
+    profiled_runner, profile_path = write_profiled_runner(runner)
+    start = datetime.datetime.now()
+    result = None
+    try:
+        with PeakMemoryMonitor(runner_config, build_directory) as memory:
+            if not native:
+                subprocess.run(["helics", "run", f"--path={profiled_runner}"])
+            else:
+                result = run_runner_config(
+                    profiled_runner, timeout=timeout, grace_period=grace_period
+                )
+        end = datetime.datetime.now()
+        run_summary = summarize_run(
+            runner_config.name, start, end, profile_path, memory.peaks
+        )
+    finally:
+        remove_profile(profiled_runner, profile_path)
+    with open(os.path.join(build_directory, SUMMARY_FILE), "w") as f:
+        f.write(run_summary.model_dump_json(indent=2))
+    if history is not None:
+        with RunHistory(history) as run_history:
+            run_id = run_history.record(run_summary, BuildManifest.load(build_directory))
+        click.echo(f"Recorded run {run_id} in {history}")
+    click.echo(run_summary.report())
+    _check_result(result)
+
+
+@cli.command()
+@click.option(
+    "--history",
+    required=True,
+    type=click.Path(exists=True, dir_okay=False),
+    envvar="OEDISI_RUN_HISTORY",
+    help="SQLite run history written by oedisi run --history.",
+)
+@click.option(
+    "--build-dir",
+    default="build",
+    type=click.Path(),
+    help="Build whose wiring diagram to compare, the latest run's by default.",
+)
+@click.option(
+    "--z-threshold",
+    default=3.0,
+    show_default=True,
+    help="Standard deviations beyond which a slower value is significant.",
+)
+@click.option(
+    "--min-change",
+    default=0.05,
+    show_default=True,
+    help="Minimum relative slowdown to flag.",
+)
+@click.option(
+    "--min-runs",
+    default=3,
+    show_default=True,
+    type=click.IntRange(min=2),
+    help="Minimum number of previous runs to compare against.",
+)
+def compare_runs(history, build_dir, z_threshold, min_change, min_runs):
+    """Compare the latest run against the history of the same wiring diagram.
+
+    Exits with status 1 if any federate or the run as a whole is
+    significantly slower than in previous runs.
+
+    Examples::
+
+        oedisi run --history runs.sqlite
+        oedisi compare-runs --history runs.sqlite
+
+        federate                 metric                   latest        mean   change      z
+        feeder                   compute_time              41.2        30.1    36.9%    7.4
+        Run 12: 1 slowdowns against 11 runs
+    """
+    diagram_hash = BuildManifest.load(build_dir).diagram_hash
+    with RunHistory(history) as run_history:
+        comparison = run_history.compare(
+            diagram_hash,
+            z_threshold=z_threshold,
+            min_change=min_change,
+            min_runs=min_runs,
+        )
+    click.echo(comparison.report())
+    if comparison.slowdowns:
+        raise SystemExit(1)
+
+
+def _start_federation(runner_path: str, native: bool):
+    """Run a federation in the background and return a function waiting for it.
+
+    The function returns the `RunResult` of a native run, otherwise None.
     """
-    subprocess.run(["helics", "run", f"--path={runner}"])
+    if not native:
+        process = subprocess.Popen(["helics", "run", f"--path={runner_path}"])
+
+        def wait() -> None:
+            process.wait()
+
+        return wait
+    executor = ThreadPoolExecutor(max_workers=1)
+    future = executor.submit(run_runner_config, runner_path)
+    executor.shutdown(wait=False)
+    return future.result
+
+
+def _check_result(result: RunResult | None):
+    """Report a native run and exit with status 1 if it failed."""
+    if result is None:
+        return
+    click.echo(result.report())
+    if not result.ok:
+        raise SystemExit(1)
 
 
 @cli.command()
@@ -508,14 +848,39 @@ def run(runner):
     type=click.Path(),
     help="Location of helics run json. Usually build/system_runner.json",
 )
-def run_with_pause(runner):
+@click.option(
+    "--native",
+    is_flag=True,
+    default=False,
+    help="Supervise federates directly instead of using helics run.",
+)
+@click.option(
+    "-b",
+    "--breakpoint",
+    "breakpoints",
+    multiple=True,
+    type=float,
+    help="Simulation time to pause at, runs without prompting. Repeatable.",
+)
+@click.option(
+    "--hook",
+    "hooks",
+    multiple=True,
+    help="'module:function' called at every breakpoint. Repeatable.",
+)
+def run_with_pause(runner, native, breakpoints, hooks):
     """Run HELICS simulation with interactive time barrier control.
 
     Helics broker is run in the foreground, and we allow user input
-    to block time.
+    to block time. With --breakpoint, the simulation instead pauses at
+    each breakpoint without prompting, and every hook is called with the
+    broker, the barrier and the federate time data, e.g. to take
+    snapshots or dump metrics.
 
     Examples::
 
+        oedisi run-with-pause -b 3600 -b 7200 --hook hooks:snapshot
+
         oedisi run-with-pause
 
 
@@ -532,11 +897,81 @@ def run_with_pause(runner):
             Send Time    : 0.0
 
     """
-    new_system, new_path, _ = remove_from_json(runner, "broker")
-    background_runner = subprocess.Popen(["helics", "run", f"--path={new_path}"])
-    broker = PausingBroker(len(new_system.federates))
-    broker.run()
-    background_runner.wait()
+    if hooks and not breakpoints:
+        raise click.UsageError("--hook requires --breakpoint.")
+    hook_functions: list[Hook] = [load_entry_point(hook, os.getcwd()) for hook in hooks]
+    new_system, new_path, brokers = remove_from_json(runner, "broker")
+    wait = _start_federation(new_path, native)
+    broker = PausingBroker(
+        len(new_system.federates),
+        breakpoints=sorted(breakpoints) if breakpoints else None,
+        hooks=hook_functions,
+        broker_args=brokers[0].exec if brokers else "",
+    )
+    try:
+        reached = broker.run()
+    except Exception:
+        # The broker has let the federation run on, reap it before failing.
+        wait()
+        raise
+    result = wait()
+    if breakpoints:
+        click.echo(f"Paused at {len(reached)} of {len(breakpoints)} breakpoints")
+    _check_result(result)
+
+
+@cli.command()
+@click.option(
+    "--runner",
+    default="build/system_runner.json",
+    type=click.Path(),
+    help="Location of helics run json. Usually build/system_runner.json",
+)
+@click.option(
+    "--interval",
+    default=0.1,
+    show_default=True,
+    help="Seconds between samples of the federate time state.",
+)
+@click.option(
+    "--output",
+    type=click.Path(),
+    help="Write raw samples to this .csv or .feather file.",
+)
+@click.option(
+    "--native",
+    is_flag=True,
+    default=False,
+    help="Supervise federates directly instead of using helics run.",
+)
+def profile(runner, interval, output, native):
+    """Run HELICS simulation and report which federates gate time advancement.
+
+    The broker is run in the foreground and samples the granted time of
+    every federate against wall time.
+
+    Examples::
+
+        oedisi profile --interval 0.05 --output build/profile.csv
+
+        gating federate            seconds  fraction
+        feeder                       41.20     82.4%
+        estimator                     6.10     12.2%
+        (coordination)                2.70      5.4%
+    """
+    new_system, new_path, brokers = remove_from_json(runner, "broker")
+    broker_args = brokers[0].exec if brokers else ""
+    wait = _start_federation(new_path, native)
+    broker = ProfilingBroker(len(new_system.federates), interval, broker_args)
+    timeline = broker.run()
+    result = wait()
+    click.echo(timeline.report())
+    if output is not None:
+        if Path(output).suffix in (".feather", ".arrow"):
+            timeline.to_feather(output)
+        else:
+            timeline.to_csv(output)
+    _check_result(result)
 
 
 @cli.command()
@@ -640,9 +1075,11 @@ def test_description(target_directory, component_desc, parameters):
         comp_desc = ComponentDescription.model_validate(json.load(f))
     comp_desc.directory = os.path.dirname(component_desc)
 
+    base_directory = "."
     if parameters is None:
         parameters = {}
     else:
+        base_directory = os.path.dirname(os.path.abspath(parameters))
         with open(parameters) as f:
             parameters = json.load(f)
 
@@ -671,7 +1108,7 @@ def test_description(target_directory, component_desc, parameters):
         "UserComponent": basic_component(comp_desc, _bad_type_checker),
     }
     runner_config = generate_runner_config(
-        w, component_types, target_directory=target_directory
+        w, component_types, target_directory=target_directory, base_directory=base_directory
     )
     runner_config, _ = remove_from_runner_config(runner_config, "broker")
     with open(f"{target_directory}/system_runner.json", "w") as f:
@@ -732,7 +1169,13 @@ def remove_from_json(system_json, element):
     help="Location of helics run json. Usually build/system_runner.json",
 )
 @click.option("--foreground", type=str, help="Name of component to run in background")
-def debug_component(runner, foreground):
+@click.option(
+    "--native",
+    is_flag=True,
+    default=False,
+    help="Supervise the other federates directly instead of using helics run.",
+)
+def debug_component(runner, foreground, native):
     r"""
     Run system runner json with one component in the JSON.
 
@@ -749,6 +1192,9 @@ def debug_component(runner, foreground):
 
     foreground : str
         name of component
+
+    native : bool
+        run the other federates with the native supervisor
     """
     _, new_path, foreground_federates = remove_from_json(runner, foreground)
     assert len(foreground_federates) == 1
@@ -763,11 +1209,14 @@ Command   : {foreground_fed.exec}
     """
     )
 
-    click.echo("Starting system (note you may have to kill manually)")
-    helics_sim = subprocess.Popen(["helics", "run", f"--path={new_path}"])
+    if native:
+        click.echo("Starting system")
+    else:
+        click.echo("Starting system (note you may have to kill manually)")
+    wait = _start_federation(new_path, native)
     click.echo(f"Running component {foreground_fed.name} in foreground")
     _ = subprocess.run(foreground_fed.exec.split(), cwd=directory)
-    helics_sim.wait()
+    _check_result(wait())
 
 
 cli.add_command(evaluate_estimate)
@@ -1,27 +1,150 @@
-"""Pausing broker for interactive HELICS simulations."""
+"""Pausing broker for interactive and scripted HELICS simulations.
+
+By default the broker asks for every next time barrier on the terminal.
+With a breakpoint schedule it runs unattended instead: it sets each time
+barrier, waits until every federate has arrived at it, calls the hooks
+and moves on to the next breakpoint. The schedule is either a list of
+simulation times or a function of the current barrier and the federate
+time data there, returning the next barrier or None to run to completion.
+HELICS holds federates back before the barrier, so at a breakpoint every
+federate has been granted a time earlier than it.
+
+Arrival is detected by polling the ``global_time_debugging`` query. The
+poll interval starts at `min_poll` and doubles while nothing changes, up
+to `max_poll`, so short steps are noticed quickly without busy waiting
+on long ones.
+
+Examples
+--------
+Dump the granted time of every federate every simulated hour
+
+>>> def report(broker, barrier, time_data):
+...     print(barrier, {sample.name: sample.granted_time for sample in time_data})
+>>> PausingBroker(4, breakpoints=range(3600, 86400, 3600), hooks=[report]).run()
+"""
 
 import time
+from collections.abc import Callable, Iterable
+from functools import partial
 
 import click
 import helics as h
-from .broker_utils import pprint_time_data, get_time_data
+
+from .broker_utils import broker_init_args, get_time_data, pprint_time_data
+from .profiler import TimeSample, parse_time_samples
+
+Schedule = Iterable[float] | Callable[[float | None, list[TimeSample]], float | None]
+"Breakpoint times, or function from the barrier and time data to the next breakpoint"
+Hook = Callable[["PausingBroker", float, list[TimeSample]], None]
+"Called with the broker, the barrier and the time data at every breakpoint"
+
+
+def arrived(time_data: list[TimeSample], barrier: float) -> bool:
+    """Whether every executing federate is blocked at the time barrier.
+
+    A federate has arrived once it has finished computing and requested the
+    barrier time or later, which HELICS holds back until the barrier moves.
+    """
+    return bool(time_data) and all(
+        not sample.computing and sample.requested_time >= barrier for sample in time_data
+    )
 
 
 class PausingBroker:
-    """Interactive HELICS broker with user-controlled time barriers."""
+    """HELICS broker with user-controlled or scripted time barriers."""
 
-    def __init__(self, n):
-        """Initialize pausing broker with n federates."""
-        self.initstring = f"-f {n} --name=mainbroker"
+    def __init__(
+        self,
+        n,
+        breakpoints: Schedule | None = None,
+        hooks: Iterable[Hook] = (),
+        min_poll: float = 0.01,
+        max_poll: float = 1.0,
+        broker_args: str = "",
+    ):
+        """Initialize pausing broker with n federates.
 
-    def run(self):
-        """Run broker with interactive time barrier control."""
-        self.broker = h.helicsCreateBroker("zmq", "", self.initstring)
+        Parameters
+        ----------
+        n : int
+            Number of federates, used unless `broker_args` has ``-f``.
+        breakpoints : list of float or function, optional
+            Breakpoint schedule for non-interactive runs. A function gets
+            the current barrier and the time data there, None and an empty
+            list for the first one. Without a schedule, the next time
+            barrier is prompted for.
+        hooks : list of functions
+            Called at every breakpoint of a scripted run.
+        min_poll, max_poll : float
+            Range of seconds between time queries while waiting.
+        broker_args : str
+            ``helics_broker`` command line to reuse, e.g. the exec of the
+            root broker in a runner config, which counts the federates of
+            packed hosts and the sub-brokers of a broker tree.
+        """
+        self.core_type, self.initstring = broker_init_args(n, broker_args)
+        self.breakpoints = breakpoints
+        self.hooks = list(hooks)
+        self.min_poll = min_poll
+        self.max_poll = max_poll
+
+    def time_data(self) -> list[TimeSample]:
+        """Time state of every executing federate."""
+        response = self.broker.query("broker", "global_time_debugging")
+        if not isinstance(response, dict):
+            return []
+        return parse_time_samples(response, 0.0)
+
+    def wait_for(
+        self, condition: Callable[[list[TimeSample]], bool]
+    ) -> list[TimeSample] | None:
+        """Poll the time data until `condition` holds.
+
+        Returns
+        -------
+        list[TimeSample] | None
+            Time data satisfying the condition, or None if the broker
+            disconnected first.
+        """
+        poll = self.min_poll
+        previous = None
+        while h.helicsBrokerIsConnected(self.broker) is True:
+            time_data = self.time_data()
+            if condition(time_data):
+                return time_data
+            if time_data != previous:
+                poll = self.min_poll
+            else:
+                poll = min(poll * 2, self.max_poll)
+            previous = time_data
+            time.sleep(poll)
+        return None
+
+    def run(self) -> list[float]:
+        """Run broker until the federation finishes.
+
+        Returns
+        -------
+        list[float]
+            Time barriers every federate arrived at in a scripted run.
+        """
+        self.broker = h.helicsCreateBroker(self.core_type, "", self.initstring)
+        if self.breakpoints is None:
+            return self._run_interactive()
+        return self._run_scripted()
+
+    def _run_interactive(self) -> list[float]:
         print("Setting time barrier to 0.0")
         h.helicsBrokerSetTimeBarrier(self.broker, 0.0)
         t = 0.0
 
-        time.sleep(3)
+        # Poll until the federates have connected instead of sleeping.
+        poll = self.min_poll
+        while h.helicsBrokerIsConnected(self.broker) is True and not get_time_data(
+            self.broker
+        ):
+            time.sleep(poll)
+            poll = min(poll * 2, self.max_poll)
         name_2_timedata = {}
         while h.helicsBrokerIsConnected(self.broker) is True:
             for time_data in get_time_data(self.broker):
@@ -36,3 +159,40 @@ class PausingBroker:
                 t = new_t
                 print(f"Setting time barrier to {t}")
                 h.helicsBrokerSetTimeBarrier(self.broker, t)
+        return []
+
+    def _schedule(self) -> Callable[[float | None, list[TimeSample]], float | None]:
+        """Breakpoint schedule as a function of the barrier and time data."""
+        breakpoints = self.breakpoints
+        if breakpoints is None:
+            return lambda barrier, time_data: None
+        if isinstance(breakpoints, Iterable):
+            times = iter(breakpoints)
+            return lambda barrier, time_data: next(times, None)
+        return breakpoints
+
+    def _run_scripted(self) -> list[float]:
+        next_barrier = self._schedule()
+        reached = []
+        try:
+            # Federates are still initializing at a barrier at time 0, where
+            # arrival cannot be told apart, so breakpoints start after it.
+            previous, barrier = 0.0, next_barrier(None, [])
+            while barrier is not None:
+                if barrier <= previous:
+                    raise ValueError(f"Breakpoint {barrier} does not come after {previous}")
+                h.helicsBrokerSetTimeBarrier(self.broker, barrier)
+                time_data = self.wait_for(partial(arrived, barrier=barrier))
+                if time_data is None:
+                    # The federation finished before reaching the barrier.
+                    return reached
+                reached.append(barrier)
+                for hook in self.hooks:
+                    hook(self, barrier, time_data)
+                previous = barrier
+                barrier = next_barrier(barrier, time_data)
+        finally:
+            # Let the federation run to completion, also when a hook failed.
+            h.helicsBrokerClearTimeBarrier(self.broker)
+        self.wait_for(lambda data: False)
+        return reached
@@ -0,0 +1,183 @@
+"""Runtime timeline profiler for HELICS federations.
+
+`ProfilingBroker` runs the root broker of a federation in process, like
+`PausingBroker`, and samples the ``global_time_debugging`` query at a
+fixed wall-clock interval. Every sample records, per federate, the
+granted and requested simulation time and whether the federate is
+computing, i.e. still holds its last grant and has not requested the
+next time yet.
+
+The resulting `TimelineProfile` shows which federate gates time
+advancement: at each sample, the computing federates at the lowest
+granted time are the ones the rest of the federation waits on. When no
+federate is computing, the federation waits on messages and time
+coordination, reported as ``(coordination)``. Each sample interval is
+attributed to the gating federates, so the report gives the fraction of
+the run every federate held the others back.
+
+Raw samples can be exported to CSV, or to Arrow feather files when
+pyarrow is installed.
+
+Examples
+--------
+>>> profile = ProfilingBroker(4, interval=0.05).run()
+>>> print(profile.report())
+>>> profile.to_csv("build/profile.csv")
+"""
+
+import csv
+import time
+from itertools import groupby, pairwise
+
+import helics as h
+from pydantic import BaseModel
+
+from .broker_utils import broker_init_args, iter_federates
+
+try:
+    import pyarrow as pa
+    import pyarrow.feather
+except ImportError:
+    _has_pyarrow = False
+else:
+    _has_pyarrow = True
+
+COORDINATION = "(coordination)"
+"Gating entry for samples where no federate is computing"
+
+
+class TimeSample(BaseModel):
+    """Time state of one federate at one sample."""
+
+    wall_time: float
+    "Seconds since the profiler started"
+    name: str
+    granted_time: float
+    requested_time: float
+    computing: bool
+    "Whether the federate holds its grant and has not requested the next time"
+
+
+class GatingShare(BaseModel):
+    """Wall time during which a federate gated time advancement."""
+
+    name: str
+    seconds: float
+    fraction: float
+
+
+def parse_time_samples(response, wall_time: float) -> list[TimeSample]:
+    """Parse a ``global_time_debugging`` response of executing federates."""
+    return [
+        TimeSample(
+            wall_time=wall_time,
+            name=fed["attributes"]["name"],
+            granted_time=fed["granted"],
+            requested_time=fed["requested"],
+            computing=fed["granted_mode"],
+        )
+        for fed in iter_federates(response)
+        if fed.get("federate_state") == "executing"
+    ]
+
+
+class TimelineProfile(BaseModel):
+    """Per-federate samples of granted time against wall time."""
+
+    interval: float
+    samples: list[TimeSample] = []
+
+    def federates(self) -> list[str]:
+        """Names of all sampled federates, in order of appearance."""
+        return list(dict.fromkeys(sample.name for sample in self.samples))
+
+    def gating(self) -> list[GatingShare]:
+        """Wall time attributed to each gating federate, largest first.
+
+        The time between two samples is split between the computing
+        federates at the lowest granted time of the first sample.
+        """
+        snapshots = [
+            (wall_time, list(samples))
+            for wall_time, samples in groupby(self.samples, lambda s: s.wall_time)
+        ]
+        seconds: dict[str, float] = {}
+        for (wall_time, samples), (next_wall_time, _) in pairwise(snapshots):
+            lowest = min(sample.granted_time for sample in samples)
+            gates = [
+                sample.name
+                for sample in samples
+                if sample.computing and sample.granted_time == lowest
+            ] or [COORDINATION]
+            share = (next_wall_time - wall_time) / len(gates)
+            for name in gates:
+                seconds[name] = seconds.get(name, 0.0) + share
+        total = sum(seconds.values())
+        return [
+            GatingShare(name=name, seconds=value, fraction=value / total)
+            for name, value in sorted(seconds.items(), key=lambda item: -item[1])
+        ]
+
+    def report(self) -> str:
+        """Table of the gating share of every federate."""
+        lines = [f"{'gating federate':<24} {'seconds':>9} {'fraction':>9}"]
+        for share in self.gating():
+            lines.append(f"{share.name:<24} {share.seconds:>9.2f} {share.fraction:>9.1%}")
+        if self.samples:
+            final = {sample.name: sample.granted_time for sample in self.samples}
+            lines.append(
+                f"{len(self.samples)} samples over {self.samples[-1].wall_time:.2f} s, "
+                f"final granted times: "
+                + ", ".join(f"{name}={t:g}" for name, t in final.items())
+            )
+        return "\n".join(lines)
+
+    def to_csv(self, path):
+        """Write the raw samples to a CSV file."""
+        with open(path, "w", newline="") as f:
+            writer = csv.DictWriter(f, fieldnames=list(TimeSample.model_fields))
+            writer.writeheader()
+            for sample in self.samples:
+                writer.writerow(sample.model_dump())
+
+    def to_feather(self, path):
+        """Write the raw samples to an Arrow feather file."""
+        if not _has_pyarrow:
+            raise ImportError("pyarrow is required to export Arrow files.")
+        table = pa.Table.from_pylist([sample.model_dump() for sample in self.samples])
+        pyarrow.feather.write_feather(table, str(path))
+
+
+class ProfilingBroker:
+    """HELICS broker sampling the time state of every federate."""
+
+    def __init__(self, n, interval: float = 0.1, broker_args: str = ""):
+        """Initialize profiling broker with n federates.
+
+        Parameters
+        ----------
+        n : int
+            Number of federates, used unless `broker_args` has ``-f``.
+        interval : float
+            Seconds between samples.
+        broker_args : str
+            ``helics_broker`` command line to reuse, e.g. the exec of the
+            broker in a runner config, for its core type, port and key.
+        """
+        self.core_type, self.initstring = broker_init_args(n, broker_args)
+        self.interval = interval
+
+    def run(self) -> TimelineProfile:
+        """Run broker until all federates disconnect and return the samples."""
+        self.broker = h.helicsCreateBroker(self.core_type, "", self.initstring)
+        profile = TimelineProfile(interval=self.interval)
+        start = time.perf_counter()
+        next_sample = start
+        while h.helicsBrokerIsConnected(self.broker) is True:
+            wall_time = time.perf_counter() - start
+            response = self.broker.query("broker", "global_time_debugging")
+            if isinstance(response, dict):
+                profile.samples.extend(parse_time_samples(response, wall_time))
+            next_sample += self.interval
+            time.sleep(max(next_sample - time.perf_counter(), 0))
+        return profile
@@ -0,0 +1,334 @@
+"""Local run history with performance regression detection.
+
+Every recorded run stores its `RunSummary` in a SQLite database together
+with the wiring diagram hash, build time and component source hashes
+from the build manifest. Runs of the same wiring diagram form a history,
+and `RunHistory.compare` checks the latest run against it:
+
+- per federate: startup time, compute time, mean and p95 grant latency
+  and peak resident memory,
+- per run (federate ``(run)``): build time, wall time and simulated
+  seconds per wall second.
+
+A metric is flagged as a slowdown when it is worse than the mean of the
+previous runs by more than `z_threshold` standard deviations of a new
+observation (``stdev * sqrt(1 + 1/n)``) and by more than `min_change`
+relative to the mean. Federates whose source hash differs from the
+previous run are marked, since their slowdowns likely come from code
+changes rather than noise.
+
+Examples
+--------
+>>> with RunHistory("runs.sqlite") as history:
+...     history.record(summary, BuildManifest.load("build"))
+...     print(history.compare().report())
+"""
+
+import math
+import sqlite3
+import statistics
+
+from pydantic import BaseModel
+
+from oedisi.componentframework.system_configuration import BuildManifest
+
+from .run_summary import RunSummary
+
+RUN = "(run)"
+"Federate name of metrics of the whole run"
+
+RUN_METRICS = {"build_time": 1, "wall_time": 1, "sim_throughput": -1}
+"Run metrics and their direction, 1 if higher is slower"
+FEDERATE_METRICS = {
+    "startup_time": 1,
+    "compute_time": 1,
+    "grant_latency_mean": 1,
+    "grant_latency_p95": 1,
+    "peak_rss": 1,
+}
+"Federate metrics and their direction, 1 if higher is slower"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    name TEXT NOT NULL,
+    diagram_hash TEXT,
+    start TEXT NOT NULL,
+    end TEXT NOT NULL,
+    build_time REAL,
+    wall_time REAL NOT NULL,
+    final_granted_time REAL,
+    sim_throughput REAL
+);
+CREATE INDEX IF NOT EXISTS runs_by_diagram ON runs (diagram_hash, id);
+CREATE TABLE IF NOT EXISTS federate_runs (
+    run_id INTEGER NOT NULL REFERENCES runs (id) ON DELETE CASCADE,
+    name TEXT NOT NULL,
+    source_hash TEXT,
+    time_steps INTEGER,
+    startup_time REAL,
+    compute_time REAL,
+    grant_latency_mean REAL,
+    grant_latency_p95 REAL,
+    peak_rss INTEGER,
+    PRIMARY KEY (run_id, name)
+);
+"""
+
+
+class MetricComparison(BaseModel):
+    """Latest value of a metric against its history."""
+
+    federate: str
+    metric: str
+    latest: float
+    mean: float
+    stdev: float
+    runs: int
+    "Number of previous runs in the history"
+    z: float
+    "Standard deviations of a new observation by which the latest is worse"
+    change: float
+    "Relative change by which the latest is worse than the mean"
+    slowdown: bool
+    source_changed: bool = False
+    "Whether the federate source hash differs from the previous run"
+
+
+class Comparison(BaseModel):
+    """Comparison of the latest run of a wiring diagram with its history."""
+
+    run_id: int
+    diagram_hash: str | None
+    history: int
+    "Number of previous runs of the same wiring diagram"
+    metrics: list[MetricComparison] = []
+
+    @property
+    def slowdowns(self) -> list[MetricComparison]:
+        """Metrics flagged as significantly slower."""
+        return [metric for metric in self.metrics if metric.slowdown]
+
+    def report(self) -> str:
+        """Table of flagged slowdowns."""
+        if not self.metrics:
+            return f"Run {self.run_id} has too little history ({self.history} runs)"
+        if not self.slowdowns:
+            return f"Run {self.run_id}: no slowdowns against {self.history} runs"
+        lines = [
+            f"{'federate':<24} {'metric':<20} {'latest':>11} {'mean':>11} "
+            f"{'change':>8} {'z':>6}"
+        ]
+        for metric in self.slowdowns:
+            marker = " (source changed)" if metric.source_changed else ""
+            lines.append(
+                f"{metric.federate:<24} {metric.metric:<20} {metric.latest:>11.4g} "
+                f"{metric.mean:>11.4g} {metric.change:>8.1%} {metric.z:>6.1f}{marker}"
+            )
+        lines.append(
+            f"Run {self.run_id}: {len(self.slowdowns)} slowdowns "
+            f"against {self.history} runs"
+        )
+        return "\n".join(lines)
+
+
+def _compare(
+    latest: float, history: list[float], direction: int
+) -> tuple[float, float, float, float]:
+    """Mean, stdev, z and relative change of `latest` in slowdown direction."""
+    mean = statistics.fmean(history)
+    stdev = statistics.stdev(history)
+    worse = direction * (latest - mean)
+    scale = stdev * math.sqrt(1 + 1 / len(history))
+    if scale > 0:
+        z = worse / scale
+    else:
+        z = math.inf if worse > 0 else 0.0
+    change = worse / abs(mean) if mean else (math.inf if worse > 0 else 0.0)
+    return mean, stdev, z, change
+
+
+class RunHistory:
+    """SQLite store of run summaries.
+
+    Parameters
+    ----------
+    path : str | Path
+        Database file, created if it does not exist.
+    """
+
+    def __init__(self, path):
+        """Open the database and create its tables."""
+        self.connection = sqlite3.connect(path)
+        self.connection.execute("PRAGMA foreign_keys = ON")
+        self.connection.executescript(_SCHEMA)
+
+    def __enter__(self):
+        """Return the history."""
+        return self
+
+    def __exit__(self, *args):
+        """Close the database."""
+        self.close()
+
+    def close(self):
+        """Close the database."""
+        self.connection.close()
+
+    def record(self, summary: RunSummary, manifest: BuildManifest | None = None) -> int:
+        """Store a run summary and return its run id.
+
+        Parameters
+        ----------
+        summary : RunSummary
+            Summary of the run.
+        manifest : BuildManifest, optional
+            Manifest of the build that was run, for the wiring diagram hash,
+            build time and component source hashes.
+        """
+        manifest = manifest or BuildManifest()
+        with self.connection:
+            cursor = self.connection.execute(
+                "INSERT INTO runs (name, diagram_hash, start, end, build_time, "
+                "wall_time, final_granted_time, sim_throughput) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (
+                    summary.name,
+                    manifest.diagram_hash,
+                    summary.start.isoformat(),
+                    summary.end.isoformat(),
+                    manifest.build_time,
+                    summary.wall_time,
+                    summary.final_granted_time,
+                    summary.sim_throughput,
+                ),
+            )
+            run_id = cursor.lastrowid
+            # Always set after a successful INSERT.
+            assert run_id is not None
+            self.connection.executemany(
+                "INSERT INTO federate_runs (run_id, name, source_hash, time_steps, "
+                "startup_time, compute_time, grant_latency_mean, grant_latency_p95, "
+                "peak_rss) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                [
+                    (
+                        run_id,
+                        federate.name,
+                        entry.source_hash if entry is not None else None,
+                        federate.time_steps,
+                        federate.startup_time,
+                        federate.compute_time,
+                        federate.grant_latency_mean,
+                        federate.grant_latency_p95,
+                        federate.peak_rss,
+                    )
+                    for federate in summary.federates
+                    for entry in [manifest.components.get(federate.name)]
+                ],
+            )
+        return run_id
+
+    def _metrics(self, run_id: int) -> dict[tuple[str, str], float]:
+        """Non-null metrics of a run keyed by federate and metric name."""
+        values = {}
+        row = self.connection.execute(
+            f"SELECT {', '.join(RUN_METRICS)} FROM runs WHERE id = ?", (run_id,)
+        ).fetchone()
+        for metric, value in zip(RUN_METRICS, row):
+            if value is not None:
+                values[(RUN, metric)] = value
+        rows = self.connection.execute(
+            f"SELECT name, {', '.join(FEDERATE_METRICS)} FROM federate_runs "
+            "WHERE run_id = ?",
+            (run_id,),
+        )
+        for name, *row in rows:
+            for metric, value in zip(FEDERATE_METRICS, row):
+                if value is not None:
+                    values[(name, metric)] = value
+        return values
+
+    def _source_hashes(self, run_id: int) -> dict[str, str | None]:
+        rows = self.connection.execute(
+            "SELECT name, source_hash FROM federate_runs WHERE run_id = ?", (run_id,)
+        )
+        return dict(rows.fetchall())
+
+    def compare(
+        self,
+        diagram_hash: str | None = None,
+        z_threshold: float = 3.0,
+        min_change: float = 0.05,
+        min_runs: int = 3,
+        max_runs: int = 30,
+    ) -> Comparison:
+        """Compare the latest run of a wiring diagram with its previous runs.
+
+        Parameters
+        ----------
+        diagram_hash : str, optional
+            Wiring diagram to compare, by default the one of the latest run.
+        z_threshold : float
+            Standard deviations of a new observation beyond which a worse
+            value is significant.
+        min_change : float
+            Minimum relative change for a slowdown, so that very stable
+            metrics do not flag negligible changes.
+        min_runs : int
+            Minimum number of previous runs needed to compare a metric, at
+            least 2 to estimate its variance.
+        max_runs : int
+            Only compare against this many of the most recent runs.
+        """
+        if min_runs < 2:
+            raise ValueError("At least 2 previous runs are needed to compare runs")
+        if diagram_hash is None:
+            row = self.connection.execute(
+                "SELECT diagram_hash FROM runs ORDER BY id DESC LIMIT 1"
+            ).fetchone()
+            if row is None:
+                raise ValueError("The run history is empty")
+            diagram_hash = row[0]
+        run_ids = [
+            run_id
+            for (run_id,) in self.connection.execute(
+                "SELECT id FROM runs WHERE diagram_hash IS ? ORDER BY id DESC LIMIT ?",
+                (diagram_hash, max_runs + 1),
+            )
+        ]
+        if not run_ids:
+            raise ValueError(f"No runs of wiring diagram {diagram_hash}")
+        latest_id, previous_ids = run_ids[0], run_ids[1:]
+        comparison = Comparison(
+            run_id=latest_id, diagram_hash=diagram_hash, history=len(previous_ids)
+        )
+
+        latest = self._metrics(latest_id)
+        history: dict[tuple[str, str], list[float]] = {}
+        for run_id in previous_ids:
+            for key, value in self._metrics(run_id).items():
+                history.setdefault(key, []).append(value)
+        sources = self._source_hashes(latest_id)
+        previous_sources = self._source_hashes(previous_ids[0]) if previous_ids else {}
+        directions = {**RUN_METRICS, **FEDERATE_METRICS}
+        for (federate, metric), value in latest.items():
+            values = history.get((federate, metric), [])
+            if len(values) < min_runs:
+                continue
+            mean, stdev, z, change = _compare(value, values, directions[metric])
+            comparison.metrics.append(
+                MetricComparison(
+                    federate=federate,
+                    metric=metric,
+                    latest=value,
+                    mean=mean,
+                    stdev=stdev,
+                    runs=len(values),
+                    z=z,
+                    change=change,
+                    slowdown=z > z_threshold and change > min_change,
+                    source_changed=federate in previous_sources
+                    and sources.get(federate) != previous_sources[federate],
+                )
+            )
+        return comparison
@@ -0,0 +1,321 @@
+"""Throughput summaries of co-simulation runs.
+
+`oedisi run --summary` starts the root broker with the HELICS ``--profiler`` option,
+which makes every federate log when it enters and leaves blocking HELICS
+calls, with the simulation time at that point. From this log and the
+wall-clock start and end of the run, `summarize_run` computes per
+federate the number of time steps, the final granted time and the mean
+and 95th percentile time-grant latency, i.e. the wall time spent waiting
+in ``request_time``, the startup time until the federate was created
+and the compute time spent outside HELICS calls. `PeakMemoryMonitor`
+adds the peak resident memory of every federate process. The summary is
+saved as ``run_summary.json`` next to ``system_runner.json``, and the
+profile, which has two lines per blocking HELICS call, is removed with
+`remove_profile` once summarized.
+
+Simulated-seconds-per-wall-second throughput is the final granted time
+of the slowest federate divided by the wall time of the run. HELICS does
+not report the size of published values, so ``bytes_published`` is null
+unless a later HELICS version exposes it.
+
+Examples
+--------
+>>> summary = RunSummary.model_validate_json(open("build/run_summary.json").read())
+>>> summary.sim_throughput
+8.3
+"""
+
+import datetime
+import math
+import os
+import re
+import threading
+
+import psutil
+from pydantic import BaseModel
+
+from oedisi.componentframework.system_configuration import RunnerConfig
+
+PROFILE_FILE = "helics_profile.txt"
+SUMMARY_FILE = "run_summary.json"
+
+_PROFILING = re.compile(
+    r"<PROFILING>(?P<name>.*)\[\d+\]\((?P<state>\w+)\)(?:HELICS CODE )?"
+    r"(?P<kind>ENTRY|EXIT|MARKER)<(?P<ns>\d+)(?:\|(?P<epoch_ns>\d+))?>"
+    r"\[t=(?P<time>[^\]]+)\]</PROFILING>"
+)
+
+
+class FederateSummary(BaseModel):
+    """Time advancement of one federate during a run."""
+
+    name: str
+    time_steps: int = 0
+    "Number of time grants while executing"
+    final_granted_time: float | None = None
+    grant_latency_mean: float | None = None
+    "Mean seconds from a time request until its grant"
+    grant_latency_p95: float | None = None
+    "95th percentile seconds from a time request until its grant"
+    startup_time: float | None = None
+    "Seconds from the start of the run until the federate was created"
+    compute_time: float | None = None
+    "Seconds spent outside HELICS calls while executing"
+    peak_rss: int | None = None
+    "Peak resident memory in bytes of the federate process and its children"
+    bytes_published: int | None = None
+    "Total size of published values, None where HELICS does not expose it"
+
+
+class RunSummary(BaseModel):
+    """Wall-clock and simulation time summary of a run."""
+
+    name: str
+    start: datetime.datetime
+    end: datetime.datetime
+    wall_time: float
+    final_granted_time: float | None = None
+    "Final granted time of the slowest federate"
+    sim_throughput: float | None = None
+    "Simulated seconds per wall-clock second"
+    bytes_published: int | None = None
+    federates: list[FederateSummary] = []
+
+    def report(self) -> str:
+        """One line summary of the run throughput."""
+        if self.sim_throughput is None:
+            return f"Ran {self.name} in {self.wall_time:.2f} s"
+        return (
+            f"Simulated {self.final_granted_time:g} s in {self.wall_time:.2f} s "
+            f"({self.sim_throughput:.3g} simulated s per wall s)"
+        )
+
+
+def enable_profiling(runner_config: RunnerConfig, profile_path) -> RunnerConfig:
+    """Copy of `runner_config` where the root broker writes a HELICS profile.
+
+    Runner configs without a federate named ``broker`` are returned as is.
+    """
+    return RunnerConfig(
+        name=runner_config.name,
+        federates=[
+            federate.model_copy(
+                update={"exec": f"{federate.exec} --profiler={profile_path}"}
+            )
+            if federate.name == "broker"
+            else federate
+            for federate in runner_config.federates
+        ],
+    )
+
+
+def write_profiled_runner(runner_path) -> tuple[str, str | None]:
+    """Save a profiling copy of a runner config next to it.
+
+    Returns
+    -------
+    tuple[str, str | None]
+        Path of the runner config to run and of the profile it writes,
+        None if the runner config has no root broker.
+    """
+    with open(runner_path) as f:
+        runner_config = RunnerConfig.model_validate_json(f.read())
+    if not any(federate.name == "broker" for federate in runner_config.federates):
+        return runner_path, None
+    directory = os.path.dirname(os.path.abspath(runner_path))
+    profile_path = os.path.join(directory, PROFILE_FILE)
+    if os.path.exists(profile_path):
+        os.remove(profile_path)
+    root, ext = os.path.splitext(runner_path)
+    profiled_path = f"{root}_profiled{ext}"
+    with open(profiled_path, "w") as f:
+        f.write(enable_profiling(runner_config, profile_path).model_dump_json())
+    return profiled_path, profile_path
+
+
+def remove_profile(profiled_path, profile_path):
+    """Delete the files written by `write_profiled_runner` after a run."""
+    if profile_path is None:
+        # Nothing was written, `profiled_path` is the runner config itself.
+        return
+    for path in (profiled_path, profile_path):
+        if os.path.exists(path):
+            os.remove(path)
+
+
+class PeakMemoryMonitor:
+    """Sample the resident memory of federate processes in a thread.
+
+    Processes started by this process are attributed to the federate whose
+    directory is their working directory, so the monitor works for
+    ``helics run`` and native runs alike.
+
+    Parameters
+    ----------
+    runner_config : RunnerConfig
+        Federates to monitor.
+    base_directory : str | Path
+        Directory federate directories are relative to.
+    interval : float
+        Seconds between samples.
+    """
+
+    def __init__(self, runner_config: RunnerConfig, base_directory=".", interval=0.5):
+        """Map federate directories to federate names."""
+        self.directories = {
+            os.path.realpath(os.path.join(base_directory, federate.directory)): (
+                federate.name
+            )
+            for federate in runner_config.federates
+        }
+        self.interval = interval
+        self.peaks: dict[str, int] = {}
+        "Peak resident memory in bytes per federate name"
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+
+    def sample(self):
+        """Add one sample of the current resident memory."""
+        rss: dict[str, int] = {}
+        for process in psutil.Process().children(recursive=True):
+            try:
+                name = self.directories.get(process.cwd())
+                if name is not None:
+                    rss[name] = rss.get(name, 0) + process.memory_info().rss
+            except psutil.Error:
+                continue
+        for name, value in rss.items():
+            self.peaks[name] = max(self.peaks.get(name, 0), value)
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            self.sample()
+
+    def __enter__(self):
+        """Start sampling."""
+        self._thread.start()
+        return self
+
+    def __exit__(self, *args):
+        """Stop sampling."""
+        self._stop.set()
+        self._thread.join()
+
+
+def _percentile(values: list[float], q: float) -> float:
+    """Nearest-rank percentile."""
+    ordered = sorted(values)
+    return ordered[max(math.ceil(q * len(ordered)) - 1, 0)]
+
+
+def summarize_profile(
+    profile_path, start: datetime.datetime | None = None
+) -> list[FederateSummary]:
+    """Time steps, grant latencies and timings per federate from a HELICS profile.
+
+    Parameters
+    ----------
+    profile_path : str | Path
+        HELICS profile written with ``--profiler``.
+    start : datetime.datetime, optional
+        Wall-clock start of the run, for startup times.
+    """
+    entries: dict[str, int | None] = {}
+    exits: dict[str, int] = {}
+    latencies: dict[str, list[float]] = {}
+    compute: dict[str, int] = {}
+    final: dict[str, float] = {}
+    created: dict[str, int] = {}
+    with open(profile_path) as f:
+        for line in f:
+            match = _PROFILING.search(line)
+            if match is None:
+                continue
+            name = match["name"]
+            ns = int(match["ns"])
+            latencies.setdefault(name, [])
+            if match["kind"] == "MARKER":
+                if match["epoch_ns"] is not None:
+                    created.setdefault(name, int(match["epoch_ns"]))
+                continue
+            if match["kind"] == "ENTRY":
+                executing = match["state"] == "executing"
+                entries[name] = ns if executing else None
+                if executing and name in exits:
+                    compute[name] = compute.get(name, 0) + ns - exits.pop(name)
+                continue
+            entry = entries.pop(name, None)
+            if match["state"] != "executing":
+                continue
+            final[name] = float(match["time"])
+            exits[name] = ns
+            if entry is not None:
+                latencies[name].append((ns - entry) / 1e9)
+
+    summaries = []
+    for name, values in latencies.items():
+        summary = FederateSummary(
+            name=name, time_steps=len(values), final_granted_time=final.get(name)
+        )
+        if values:
+            summary.grant_latency_mean = sum(values) / len(values)
+            summary.grant_latency_p95 = _percentile(values, 0.95)
+        if name in compute:
+            summary.compute_time = compute[name] / 1e9
+        if start is not None and name in created:
+            summary.startup_time = created[name] / 1e9 - start.timestamp()
+        summaries.append(summary)
+    return summaries
+
+
+def summarize_run(
+    name: str,
+    start: datetime.datetime,
+    end: datetime.datetime,
+    profile_path=None,
+    peak_rss: dict[str, int] | None = None,
+) -> RunSummary:
+    """Summarize a run from its wall-clock start and end and HELICS profile.
+
+    Parameters
+    ----------
+    name : str
+        Name of the federation.
+    start, end : datetime.datetime
+        Wall-clock start and end of the run.
+    profile_path : str | Path, optional
+        HELICS profile written with ``--profiler``. Without it, only wall
+        times are summarized.
+    peak_rss : dict[str, int], optional
+        Peak resident memory per federate, e.g. from `PeakMemoryMonitor`.
+        Processes without profile data, such as brokers, get a summary
+        with only their peak memory.
+    """
+    wall_time = (end - start).total_seconds()
+    federates = []
+    if profile_path is not None and os.path.exists(profile_path):
+        federates = summarize_profile(profile_path, start)
+    by_name = {federate.name: federate for federate in federates}
+    for name, value in (peak_rss or {}).items():
+        if name not in by_name:
+            by_name[name] = FederateSummary(name=name)
+            federates.append(by_name[name])
+        by_name[name].peak_rss = value
+    final_times = [
+        federate.final_granted_time
+        for federate in federates
+        if federate.final_granted_time is not None
+    ]
+    final_granted_time = min(final_times) if final_times else None
+    sim_throughput = None
+    if final_granted_time is not None and wall_time > 0:
+        sim_throughput = final_granted_time / wall_time
+    return RunSummary(
+        name=name,
+        start=start,
+        end=end,
+        wall_time=wall_time,
+        final_granted_time=final_granted_time,
+        sim_throughput=sim_throughput,
+        federates=federates,
+    )
@@ -0,0 +1,297 @@
+"""Native asyncio runner for `RunnerConfig` federations.
+
+`helics run` starts every federate and waits for all of them, so one
+crashed federate leaves the others blocked on time requests until they
+are killed by hand. `run_federation` starts the federates concurrently
+as asyncio subprocesses and supervises them:
+
+- stdout and stderr of every federate are streamed line by line, tagged
+  with the federate name, and also written to ``<name>.log`` next to the
+  runner config like `helics run` does. Pipes are read in fixed size
+  chunks, so lines of any length are passed through and a federate is
+  never blocked on a full pipe,
+- as soon as a federate exits with a non-zero code, or the wall-clock
+  timeout expires, every other federate is terminated, and killed if it
+  has not exited after `grace_period` seconds,
+- the start latency, wall time and exit code of every federate are
+  returned in a `RunResult`.
+
+On POSIX each federate runs in its own process group, so the shell
+scripts and child processes it starts are torn down with it. Elsewhere,
+such as on Windows, only the federate process itself is stopped.
+
+Examples
+--------
+>>> result = run_runner_config("build/system_runner.json", timeout=600)
+>>> result.ok
+True
+>>> print(result.report())
+"""
+
+import asyncio
+import json
+import os
+import shlex
+import signal
+import sys
+from typing import TextIO
+
+from pydantic import BaseModel
+
+from oedisi.componentframework.system_configuration import Federate, RunnerConfig
+
+_CHUNK_SIZE = 64 * 1024
+
+
+class FederateResult(BaseModel):
+    """Outcome of one federate process."""
+
+    name: str
+    returncode: int | None = None
+    "Exit code, negative for a signal, None if the process never started"
+    start_latency: float | None = None
+    "Seconds from the start of the run until the process was started"
+    wall_time: float | None = None
+    "Seconds from process start until exit"
+    terminated: bool = False
+    "Whether the supervisor stopped the federate"
+
+
+class RunResult(BaseModel):
+    """Outcome of a supervised federation run."""
+
+    name: str
+    federates: list[FederateResult]
+    wall_time: float
+    timed_out: bool = False
+    failed: list[str] = []
+    "Federates which failed on their own, in the order they exited"
+
+    @property
+    def ok(self) -> bool:
+        """Whether every federate exited successfully within the timeout."""
+        return not self.timed_out and all(
+            federate.returncode == 0 for federate in self.federates
+        )
+
+    def report(self) -> str:
+        """Table of exit codes and timings of every federate."""
+        lines = [
+            f"{'federate':<24} {'exit':>6} {'start (ms)':>11} {'wall (s)':>9}",
+        ]
+        for federate in self.federates:
+            code = "-" if federate.returncode is None else str(federate.returncode)
+            if federate.terminated:
+                code += "*"
+            latency = (
+                "-"
+                if federate.start_latency is None
+                else f"{federate.start_latency * 1e3:.1f}"
+            )
+            wall = "-" if federate.wall_time is None else f"{federate.wall_time:.2f}"
+            lines.append(f"{federate.name:<24} {code:>6} {latency:>11} {wall:>9}")
+        status = "timed out" if self.timed_out else "ok" if self.ok else "failed"
+        lines.append(f"Federation {self.name} {status} after {self.wall_time:.2f} s")
+        if any(federate.terminated for federate in self.federates):
+            lines.append("* terminated by the supervisor")
+        return "\n".join(lines)
+
+
+def _write_line(line: bytes, tag: str, output: TextIO | None, log):
+    text = line.decode(errors="replace")
+    log.write(text)
+    log.flush()
+    if output is not None:
+        output.write(f"[{tag}] {text}" if text.endswith("\n") else f"[{tag}] {text}\n")
+        output.flush()
+
+
+async def _pump(stream: asyncio.StreamReader, tag: str, output: TextIO | None, log):
+    """Copy lines from a process stream to the log file and tagged output.
+
+    The stream is drained to the end even if writing fails, so the
+    federate can always exit.
+    """
+    partial = b""
+    writing = True
+    while chunk := await stream.read(_CHUNK_SIZE):
+        if not writing:
+            continue
+        *lines, partial = (partial + chunk).split(b"\n")
+        try:
+            for line in lines:
+                _write_line(line + b"\n", tag, output, log)
+        except (OSError, ValueError):
+            writing = False
+    if partial and writing:
+        try:
+            _write_line(partial, tag, output, log)
+        except (OSError, ValueError):
+            pass
+
+
+def _signal_group(process: asyncio.subprocess.Process, kill: bool = False):
+    """Terminate or kill a federate, with its process group where supported."""
+    try:
+        if hasattr(os, "killpg"):
+            os.killpg(process.pid, signal.SIGKILL if kill else signal.SIGTERM)
+        elif kill:
+            process.kill()
+        else:
+            process.terminate()
+    except (ProcessLookupError, PermissionError):
+        pass
+
+
+async def _stop(
+    processes: dict[str, asyncio.subprocess.Process],
+    results: dict[str, FederateResult],
+    grace_period: float,
+):
+    """Terminate every running federate, killing those which do not exit."""
+    running = {
+        name: process for name, process in processes.items() if process.returncode is None
+    }
+    for name, process in running.items():
+        results[name].terminated = True
+        _signal_group(process)
+    if not running:
+        return
+    _, pending = await asyncio.wait(
+        [asyncio.ensure_future(process.wait()) for process in running.values()],
+        timeout=grace_period,
+    )
+    if pending:
+        for process in running.values():
+            if process.returncode is None:
+                _signal_group(process, kill=True)
+        await asyncio.wait(pending)
+
+
+async def run_federation(
+    runner_config: RunnerConfig,
+    base_directory=".",
+    timeout: float | None = None,
+    grace_period: float = 5.0,
+    output: TextIO | None = sys.stdout,
+) -> RunResult:
+    """Run every federate of `runner_config` and supervise them.
+
+    Parameters
+    ----------
+    runner_config : RunnerConfig
+        Federates to run.
+    base_directory : str | Path
+        Directory federate directories are relative to, usually the
+        directory of system_runner.json. Logs are written here.
+    timeout : float, optional
+        Wall-clock limit in seconds for the whole federation.
+    grace_period : float
+        Seconds between terminating and killing federates on teardown.
+    output : TextIO, optional
+        Stream for tagged federate output, None to only write log files.
+
+    Returns
+    -------
+    RunResult
+        Exit codes and timings of every federate.
+    """
+    loop = asyncio.get_running_loop()
+    start = loop.time()
+    results = {
+        federate.name: FederateResult(name=federate.name)
+        for federate in runner_config.federates
+    }
+    processes: dict[str, asyncio.subprocess.Process] = {}
+    logs = {}
+    pumps = []
+
+    async def launch(federate: Federate):
+        log = open(os.path.join(base_directory, f"{federate.name}.log"), "w")
+        logs[federate.name] = log
+        try:
+            process = await asyncio.create_subprocess_exec(
+                *shlex.split(federate.exec),
+                cwd=os.path.join(base_directory, federate.directory),
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE,
+                start_new_session=True,
+            )
+        except OSError as e:
+            log.write(f"Could not start {federate.exec}: {e}\n")
+            raise
+        started = loop.time() - start
+        results[federate.name].start_latency = started
+        processes[federate.name] = process
+        assert process.stdout is not None and process.stderr is not None
+        for stream in (process.stdout, process.stderr):
+            pumps.append(asyncio.ensure_future(_pump(stream, federate.name, output, log)))
+        return started
+
+    async def wait(name: str, started: float) -> str:
+        returncode = await processes[name].wait()
+        result = results[name]
+        result.returncode = returncode
+        result.wall_time = loop.time() - start - started
+        return name
+
+    failed = []
+    timed_out = False
+    try:
+        launches = await asyncio.gather(
+            *(launch(federate) for federate in runner_config.federates),
+            return_exceptions=True,
+        )
+        pending = set()
+        for federate, launched in zip(runner_config.federates, launches):
+            if isinstance(launched, BaseException):
+                failed.append(federate.name)
+            else:
+                pending.add(asyncio.ensure_future(wait(federate.name, launched)))
+        deadline = None if timeout is None else start + timeout
+        while pending and not failed:
+            remaining = None if deadline is None else max(deadline - loop.time(), 0)
+            done, pending = await asyncio.wait(
+                pending, timeout=remaining, return_when=asyncio.FIRST_COMPLETED
+            )
+            if not done:
+                timed_out = True
+                break
+            for task in done:
+                name = task.result()
+                if results[name].returncode != 0:
+                    failed.append(name)
+        await _stop(processes, results, grace_period)
+        for task in pending:
+            await task
+        # Output of children that outlive their federate is not waited for.
+        if pumps:
+            _, unfinished = await asyncio.wait(pumps, timeout=grace_period)
+            for pump in unfinished:
+                pump.cancel()
+    finally:
+        for process in processes.values():
+            if process.returncode is None:
+                _signal_group(process, kill=True)
+        for log in logs.values():
+            log.close()
+
+    return RunResult(
+        name=runner_config.name,
+        federates=list(results.values()),
+        wall_time=loop.time() - start,
+        timed_out=timed_out,
+        failed=failed,
+    )
+
+
+def run_runner_config(runner_path, **kwargs) -> RunResult:
+    """Load a runner config JSON file and run it with `run_federation`.
+
+    Federate directories and logs are relative to the file's directory,
+    as with ``helics run --path``.
+    """
+    with open(runner_path) as f:
+        runner_config = RunnerConfig.model_validate(json.load(f))
+    base_directory = os.path.dirname(os.path.abspath(runner_path))
+    return asyncio.run(run_federation(runner_config, base_directory, **kwargs))
@@ -0,0 +1,179 @@
+"""Reorder measurement arrays into a fixed id order.
+
+Components usually need incoming values in the order of their own
+configured ids, e.g. `node_ids` in static_inputs.json, while the
+publisher decides which ids it sends and in what order. Instead of
+building a `dict(zip(ids, values))` on every time step, `IdAligner`
+computes the permutation from the incoming ids to the target ids once,
+caches it, and applies it as a single NumPy gather.
+
+The permutation is looked up first by identity of the incoming `ids`
+list, then by its contents in a small least-recently-used cache, so
+publishers alternating between a few id layouts stay cheap. Incoming id
+lists must therefore not be mutated in place after they were aligned.
+
+Examples
+--------
+>>> aligner = IdAligner(config.node_ids)
+>>> voltages = VoltagesMagnitude.model_validate(sub.json)
+>>> node_voltages = aligner.align(voltages)
+
+For `EquipmentNodeArray` types, pass both keys:
+
+>>> aligner = IdAligner(node_ids, equipment_ids=equipment_ids, fill_value=0.0)
+>>> powers = aligner.align(PowersReal.model_validate(sub.json))
+"""
+
+from __future__ import annotations
+
+from collections import OrderedDict
+
+from .common import IdentifiedValues
+
+try:
+    import numpy as np
+except ImportError:
+    _has_dependencies = False
+else:
+    _has_dependencies = True
+
+
+class IdAligner:
+    """Gather values into the order of `target_ids`.
+
+    Parameters
+    ----------
+    target_ids : list[str]
+        Ids in the order the component wants its values.
+    equipment_ids : list[str], optional
+        Equipment ids paired with `target_ids`. If given, incoming arrays
+        are matched on (ids, equipment_ids), as for `EquipmentNodeArray`.
+    fill_value : float, optional
+        Value for target ids missing from the incoming array. By default a
+        missing id raises ValueError.
+    cache_size : int
+        Number of incoming id layouts to keep permutations for.
+    """
+
+    def __init__(
+        self,
+        target_ids: list[str],
+        equipment_ids: list[str] | None = None,
+        fill_value: float | None = None,
+        cache_size: int = 8,
+    ):
+        """Create an aligner for a fixed target order."""
+        if not _has_dependencies:
+            raise ImportError("numpy is required to do this.")
+        if equipment_ids is not None and len(equipment_ids) != len(target_ids):
+            raise ValueError(
+                f"equipment_ids has {len(equipment_ids)} entries, "
+                f"expected {len(target_ids)}"
+            )
+        self.target_ids = list(target_ids)
+        self.equipment_ids = None if equipment_ids is None else list(equipment_ids)
+        self.fill_value = fill_value
+        self.cache_size = cache_size
+        self._last_ids = None
+        self._last_equipment_ids = None
+        self._last_permutation = None
+        self._cache: OrderedDict = OrderedDict()
+
+    def _targets(self):
+        if self.equipment_ids is None:
+            return self.target_ids
+        return list(zip(self.target_ids, self.equipment_ids))
+
+    def _compute(self, ids: list[str], equipment_ids: list[str] | None):
+        """Compute (indices, missing mask) of the target ids in `ids`."""
+        if self.equipment_ids is None:
+            keys = ids
+        else:
+            if equipment_ids is None:
+                raise ValueError("equipment_ids are required to align this array")
+            keys = zip(ids, equipment_ids, strict=True)
+        index = {key: i for i, key in enumerate(keys)}
+        indices = np.fromiter(
+            (index.get(key, -1) for key in self._targets()),
+            dtype=np.intp,
+            count=len(self.target_ids),
+        )
+        missing = indices < 0
+        if missing.any():
+            if self.fill_value is None:
+                absent = [key for key, m in zip(self._targets(), missing) if m]
+                raise ValueError(f"Ids {absent[:5]} are missing from the incoming array")
+            indices[missing] = 0
+        else:
+            missing = None
+        return indices, missing
+
+    def permutation(self, ids: list[str], equipment_ids: list[str] | None = None):
+        """Return the cached (indices, missing mask) for an incoming id layout.
+
+        The missing mask is None when every target id is present.
+        """
+        if ids is self._last_ids and equipment_ids is self._last_equipment_ids:
+            return self._last_permutation
+        key = (tuple(ids), None if equipment_ids is None else tuple(equipment_ids))
+        permutation = self._cache.get(key)
+        if permutation is None:
+            permutation = self._compute(ids, equipment_ids)
+            self._cache[key] = permutation
+            if len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+        else:
+            self._cache.move_to_end(key)
+        self._last_ids = ids
+        self._last_equipment_ids = equipment_ids
+        self._last_permutation = permutation
+        return permutation
+
+    def align_values(self, values, ids: list[str], equipment_ids: list[str] | None = None):
+        """Gather `values` with incoming `ids` into the target order.
+
+        Parameters
+        ----------
+        values : array_like
+            Incoming values with ids along the last axis, so the time x id
+            matrix of a `MeasurementTimeSeries` is aligned row by row.
+        ids : list[str]
+            Ids of the incoming values.
+        equipment_ids : list[str], optional
+            Equipment ids of the incoming values.
+
+        Returns
+        -------
+        numpy.ndarray
+            Values in the order of `target_ids`.
+        """
+        indices, missing = self.permutation(ids, equipment_ids)
+        values = np.asarray(values)
+        if values.shape[-1] != len(ids):
+            raise ValueError(f"Got {values.shape[-1]} values for {len(ids)} ids")
+        if len(ids) == 0:
+            return np.full((*values.shape[:-1], len(indices)), self.fill_value)
+        aligned = np.take(values, indices, axis=-1)
+        if missing is not None:
+            aligned = aligned.astype(np.result_type(aligned, self.fill_value))
+            aligned[..., missing] = self.fill_value
+        return aligned
+
+    def align(self, model: IdentifiedValues):
+        """Gather `model.values` into the target order.
+
+        Parameters
+        ----------
+        model : IdentifiedValues
+            Model with `values` and `ids` (and `equipment_ids` when aligning
+            on both), e.g. a `MeasurementArray`, `StateArray` or
+            `MeasurementTimeSeries`.
+
+        Returns
+        -------
+        numpy.ndarray
+            Values in the order of `target_ids`.
+        """
+        return self.align_values(
+            model.values, model.ids, getattr(model, "equipment_ids", None)
+        )
@@ -0,0 +1,264 @@
+"""Binary wire codec for OEDISI data types.
+
+Large `MeasurementArray` publications spend most of their time in JSON
+encoding and decoding. This module provides a compact binary encoding
+which stores list fields as raw buffers:
+
+- `list[float]` fields as little-endian float64,
+- `list[int]` fields as little-endian int32,
+- `list[str]` fields as a NUL separated UTF-8 string table.
+
+All other fields (units, time, nested models) are kept in a small JSON
+section, so any Pydantic model can be encoded.
+
+Layout::
+
+    magic b"OEDB" | version u16 | field count u16 | meta length u32
+    meta JSON
+    for each array field:
+        kind u8 | name length u16 | item count u32 | byte length u32 | name
+        padding to 8 bytes | buffer
+
+Examples
+--------
+Publishing and subscribing with HELICS bytes::
+
+    pub = fed.register_publication("voltages", h.HELICS_DATA_TYPE_BYTES, "")
+    pub.publish(encode(voltages))
+
+    voltages = decode(sub.bytes, VoltagesReal)
+
+Float fields are decoded as read-only NumPy views of the received buffer,
+so `MeasurementArray` subclasses are reconstructed without copying values.
+
+`encode_with` and `decode_with` dispatch on the `Encoding` that
+`oedisi build` negotiated for each port (see the "encodings" entry in
+static_inputs.json).
+"""
+
+from __future__ import annotations
+
+import json
+import struct
+import types
+from functools import cache
+from typing import Annotated, TypeVar, Union, get_args, get_origin
+
+from pydantic import BaseModel
+
+from oedisi.types.common import Encoding
+
+try:
+    import numpy as np
+except ImportError:
+    _has_dependencies = False
+else:
+    _has_dependencies = True
+
+MAGIC = b"OEDB"
+"Magic bytes at the start of every binary message"
+VERSION = 1
+"Version of the binary layout"
+
+_HEADER = struct.Struct("<4sHHI")
+_FIELD = struct.Struct("<BHII")
+_ALIGNMENT = 8
+
+_FLOAT64 = 0
+_INT32 = 1
+_STRING = 2
+_KINDS = {float: _FLOAT64, int: _INT32, str: _STRING}
+_SEPARATOR = "\x00"
+
+ModelType = TypeVar("ModelType", bound=BaseModel)
+
+
+def _array_kind(annotation) -> int | None:
+    """Return buffer kind of a list[float], list[int] or list[str] annotation."""
+    if get_origin(annotation) in (Union, types.UnionType):
+        args = [arg for arg in get_args(annotation) if arg is not type(None)]
+        if len(args) != 1:
+            return None
+        annotation = args[0]
+    if get_origin(annotation) is Annotated:
+        annotation = get_args(annotation)[0]
+    if get_origin(annotation) is not list:
+        return None
+    (item_type,) = get_args(annotation)
+    return _KINDS.get(item_type)
+
+
+@cache
+def _array_fields(cls: type[BaseModel]) -> dict[str, int]:
+    """Map field names of `cls` which can be stored as buffers to their kind."""
+    fields = {}
+    for name, field in cls.model_fields.items():
+        kind = _array_kind(field.annotation)
+        if kind is not None:
+            fields[name] = kind
+    return fields
+
+
+def _padding(offset: int) -> int:
+    return -offset % _ALIGNMENT
+
+
+def _encode_buffer(name: str, kind: int, value) -> tuple[int, bytes]:
+    """Encode a list field into (item count, buffer)."""
+    if kind == _FLOAT64:
+        array = np.asarray(value, dtype="<f8")
+        if array.ndim != 1:
+            raise ValueError(f"{name} must be 1-D to be encoded, got {array.shape}")
+        return len(array), array.tobytes()
+    if kind == _INT32:
+        array = np.asarray(value, dtype=np.int64)
+        if array.ndim != 1:
+            raise ValueError(f"{name} must be 1-D to be encoded, got {array.shape}")
+        if len(array) and (
+            array.min() < np.iinfo(np.int32).min or array.max() > np.iinfo(np.int32).max
+        ):
+            raise ValueError(f"{name} does not fit into int32")
+        return len(array), array.astype("<i4").tobytes()
+    joined = _SEPARATOR.join(value)
+    if len(value) and joined.count(_SEPARATOR) != len(value) - 1:
+        raise ValueError(f"{name} contains NUL characters and cannot be encoded")
+    return len(value), joined.encode("utf-8")
+
+
+def encode(model: BaseModel) -> bytes:
+    """Encode a Pydantic model into the OEDISI binary format.
+
+    Parameters
+    ----------
+    model : BaseModel
+        Model to encode, typically a `MeasurementArray` or `StateArray`.
+
+    Returns
+    -------
+    bytes
+        Message suitable for a `HELICS_DATA_TYPE_BYTES` publication.
+    """
+    if not _has_dependencies:
+        raise ImportError("numpy is required to do this.")
+    array_fields = {
+        name: kind
+        for name, kind in _array_fields(type(model)).items()
+        if getattr(model, name) is not None
+    }
+    meta = model.model_dump_json(exclude=set(array_fields)).encode("utf-8")
+
+    chunks = [_HEADER.pack(MAGIC, VERSION, len(array_fields), len(meta)), meta]
+    offset = _HEADER.size + len(meta)
+    for name, kind in array_fields.items():
+        count, buffer = _encode_buffer(name, kind, getattr(model, name))
+        encoded_name = name.encode("utf-8")
+        descriptor = _FIELD.pack(kind, len(encoded_name), count, len(buffer))
+        offset += len(descriptor) + len(encoded_name)
+        padding = b"\x00" * _padding(offset)
+        offset += len(padding) + len(buffer)
+        chunks.extend((descriptor, encoded_name, padding, buffer))
+    return b"".join(chunks)
+
+
+def is_encoded(data: bytes) -> bool:
+    """Check whether `data` starts with the binary codec magic bytes."""
+    return bytes(data[: len(MAGIC)]) == MAGIC
+
+
+def decode(data: bytes, cls: type[ModelType]) -> ModelType:
+    """Decode a message created with `encode` into a model of type `cls`.
+
+    Parameters
+    ----------
+    data : bytes
+        Binary message, e.g. `subscription.bytes`.
+    cls : type[BaseModel]
+        Model class to validate into.
+
+    Returns
+    -------
+    BaseModel
+        Instance of `cls`. Float fields are read-only NumPy views of `data`.
+    """
+    if not _has_dependencies:
+        raise ImportError("numpy is required to do this.")
+    if not is_encoded(data):
+        raise ValueError("Data is not an OEDISI binary message")
+    _, version, field_count, meta_length = _HEADER.unpack_from(data, 0)
+    if version != VERSION:
+        raise ValueError(f"Unsupported binary message version {version}")
+    offset = _HEADER.size
+    fields = json.loads(bytes(data[offset : offset + meta_length]))
+    offset += meta_length
+
+    for _ in range(field_count):
+        kind, name_length, count, byte_length = _FIELD.unpack_from(data, offset)
+        offset += _FIELD.size
+        name = bytes(data[offset : offset + name_length]).decode("utf-8")
+        offset += name_length
+        offset += _padding(offset)
+        if kind == _FLOAT64:
+            fields[name] = np.frombuffer(data, dtype="<f8", count=count, offset=offset)
+        elif kind == _INT32:
+            fields[name] = np.frombuffer(
+                data, dtype="<i4", count=count, offset=offset
+            ).tolist()
+        elif kind == _STRING:
+            text = bytes(data[offset : offset + byte_length]).decode("utf-8")
+            fields[name] = text.split(_SEPARATOR) if count else []
+        else:
+            raise ValueError(f"Unknown buffer kind {kind} for field {name}")
+        offset += byte_length
+    return cls.model_validate(fields)
+
+
+def encode_with(model: BaseModel, encoding: Encoding | str) -> str | bytes:
+    """Encode `model` with a negotiated encoding.
+
+    Parameters
+    ----------
+    model : BaseModel
+        Model to publish.
+    encoding : Encoding | str
+        Encoding from the "encodings" entry of static_inputs.json.
+
+    Returns
+    -------
+    str | bytes
+        JSON string for `Encoding.JSON`, bytes for `Encoding.BINARY`.
+    """
+    encoding = Encoding(encoding)
+    if encoding == Encoding.JSON:
+        return model.model_dump_json()
+    if encoding == Encoding.BINARY:
+        return encode(model)
+    raise NotImplementedError(f"oedisi does not implement the {encoding.value} encoding")
+
+
+def decode_with(
+    data: str | bytes, cls: type[ModelType], encoding: Encoding | str
+) -> ModelType:
+    """Decode `data` into `cls` with a negotiated encoding.
+
+    Parameters
+    ----------
+    data : str | bytes
+        Received value, e.g. `subscription.bytes`.
+    cls : type[BaseModel]
+        Model class to validate into.
+    encoding : Encoding | str
+        Encoding from the "encodings" entry of static_inputs.json.
+
+    Returns
+    -------
+    BaseModel
+        Instance of `cls`.
+    """
+    encoding = Encoding(encoding)
+    if encoding == Encoding.JSON:
+        return cls.model_validate_json(data)
+    if encoding == Encoding.BINARY:
+        if isinstance(data, str):
+            raise TypeError("Binary messages must be read as bytes, see subscription.bytes")
+        return decode(data, cls)
+    raise NotImplementedError(f"oedisi does not implement the {encoding.value} encoding")
@@ -2,6 +2,7 @@
 
 from pydantic import BaseModel
 from enum import Enum
+from typing import Any, Protocol
 import warnings
 
 BASE_DOCKER_IMAGE = "python:3.10.6-slim-bullseye"
@@ -24,6 +25,44 @@ class DefaultFileNames(str, Enum):
     "File path for configuration of the component."
 
 
+class Encoding(str, Enum):
+    """Wire encodings a component port can publish or subscribe with.
+
+    `oedisi build` chooses the first encoding in `ENCODING_PREFERENCE`
+    supported by both ends of every link. Ports may already declare
+    MessagePack and Arrow, but they are not negotiated until
+    `oedisi.types.codec` implements them.
+    """
+
+    JSON = "json"
+    "JSON string from `model_dump_json`"
+    MSGPACK = "msgpack"
+    "MessagePack bytes"
+    ARROW = "arrow"
+    "Apache Arrow IPC bytes"
+    BINARY = "binary"
+    "Raw buffers from `oedisi.types.codec`"
+
+
+ENCODING_PREFERENCE = [Encoding.BINARY, Encoding.JSON]
+"Implemented encodings from fastest to slowest"
+
+
+class IdentifiedValues(Protocol):
+    """Data type with `values` labelled by `ids`, e.g. a `MeasurementArray`.
+
+    Helpers which only rely on these fields, such as the id table handshake,
+    accept any model with them.
+    """
+
+    values: Any
+    ids: list[str]
+
+    def model_dump_json(self, *, exclude: Any = None) -> str:
+        """Serialize the model to JSON, see `pydantic.BaseModel.model_dump_json`."""
+        ...
+
+
 class BrokerConfig(BaseModel):
     """Configuration for HELICS broker connection.
 
@@ -0,0 +1,151 @@
+"""Transparent compression of large data type payloads.
+
+`Topology` messages on large feeders run to tens of MB of JSON. `compress`
+wraps a payload (JSON string or `oedisi.types.codec` bytes) in a small
+self-describing header when it is larger than a threshold, and
+`decompress` passes uncompressed payloads through unchanged, so
+publishers can enable compression without coordinating with subscribers
+that also use `decompress`.
+
+Layout of compressed payloads::
+
+    magic b"OEDZ" | codec u8 | original length u64 | compressed data
+
+zstd (`zstandard`) or lz4 (`lz4`) are used when installed, otherwise the
+standard library zlib. Decompression stops one byte past the length in
+the header, so malformed payloads cannot expand without bound.
+
+Examples
+--------
+>>> pub.publish(compress(topology.model_dump_json()))
+
+>>> topology = Topology.model_validate_json(decompress(sub.bytes))
+"""
+
+from __future__ import annotations
+
+import struct
+import zlib
+
+try:
+    import zstandard
+except ImportError:
+    _has_zstd = False
+else:
+    _has_zstd = True
+
+try:
+    import lz4.frame
+except ImportError:
+    _has_lz4 = False
+else:
+    _has_lz4 = True
+
+MAGIC = b"OEDZ"
+"Magic bytes at the start of every compressed payload"
+DEFAULT_THRESHOLD = 1 << 20
+"Payloads smaller than this (1 MiB) are not compressed by default"
+
+_HEADER = struct.Struct("<4sBQ")
+
+ZLIB = "zlib"
+ZSTD = "zstd"
+LZ4 = "lz4"
+_CODEC_IDS = {ZLIB: 0, ZSTD: 1, LZ4: 2}
+_CODEC_NAMES = {value: key for key, value in _CODEC_IDS.items()}
+
+
+def available_codecs() -> list[str]:
+    """Compression codecs usable in this environment, preferred first."""
+    codecs = []
+    if _has_zstd:
+        codecs.append(ZSTD)
+    if _has_lz4:
+        codecs.append(LZ4)
+    codecs.append(ZLIB)
+    return codecs
+
+
+def _compress(data: bytes, codec: str) -> bytes:
+    if codec == ZSTD:
+        return zstandard.ZstdCompressor(level=3).compress(data)
+    if codec == LZ4:
+        return lz4.frame.compress(data)
+    return zlib.compress(data, level=1)
+
+
+def _decompress(data: bytes, codec: str, length: int) -> bytes:
+    """Decompress at most one byte more than `length`, to detect longer payloads."""
+    if codec == ZSTD:
+        with zstandard.ZstdDecompressor().stream_reader(data) as reader:
+            return reader.read(length + 1)
+    if codec == LZ4:
+        return lz4.frame.LZ4FrameDecompressor().decompress(data, max_length=length + 1)
+    return zlib.decompressobj().decompress(data, length + 1)
+
+
+def is_compressed(data: bytes) -> bool:
+    """Check whether `data` starts with the compression magic bytes."""
+    return bytes(data[: len(MAGIC)]) == MAGIC
+
+
+def compress(
+    data: str | bytes, threshold: int = DEFAULT_THRESHOLD, codec: str | None = None
+) -> bytes:
+    """Compress `data` if it is at least `threshold` bytes long.
+
+    Parameters
+    ----------
+    data : str | bytes
+        Payload. Strings are encoded as UTF-8.
+    threshold : int
+        Minimum size in bytes to compress. Smaller payloads are returned
+        unchanged (as bytes).
+    codec : str, optional
+        One of "zstd", "lz4" or "zlib". Defaults to the first of
+        `available_codecs()`.
+
+    Returns
+    -------
+    bytes
+        Compressed payload with header, or the original payload.
+    """
+    if isinstance(data, str):
+        data = data.encode("utf-8")
+    if len(data) < threshold:
+        return data
+    if codec is None:
+        codec = available_codecs()[0]
+    elif codec not in available_codecs():
+        raise ValueError(f"Compression codec {codec} is not available")
+    header = _HEADER.pack(MAGIC, _CODEC_IDS[codec], len(data))
+    return header + _compress(data, codec)
+
+
+def decompress(data: bytes) -> bytes:
+    """Decompress a payload from `compress`, passing other payloads through.
+
+    Parameters
+    ----------
+    data : bytes
+        Possibly compressed payload, e.g. `subscription.bytes`.
+
+    Returns
+    -------
+    bytes
+        Original payload.
+    """
+    if not is_compressed(data):
+        return bytes(data)
+    _, codec_id, length = _HEADER.unpack_from(data, 0)
+    if codec_id not in _CODEC_NAMES:
+        raise ValueError(f"Unknown compression codec id {codec_id}")
+    codec = _CODEC_NAMES[codec_id]
+    if codec not in available_codecs():
+        raise ImportError(f"{codec} is required to decompress this payload.")
+    payload = _decompress(bytes(data[_HEADER.size :]), codec, length)
+    if len(payload) != length:
+        raise ValueError(
+            f"Decompressed payload has {len(payload)} bytes, expected {length}"
+        )
+    return payload
@@ -1,15 +1,207 @@
 """Power system data types for OEDISI measurements and control."""
 
 from __future__ import annotations
+import base64
 import datetime
+import math
 from enum import Enum
-from pydantic import model_validator, BaseModel, RootModel, Field
+from typing import Annotated, Any, ClassVar
+from pydantic import (
+    model_validator,
+    BaseModel,
+    RootModel,
+    Field,
+    PrivateAttr,
+    WrapSerializer,
+    WrapValidator,
+)
+
+try:
+    import numpy as np
+except ImportError:
+    _has_numpy = False
+else:
+    _has_numpy = True
 
 ### Supporting Functions ###
 
 Complex = tuple[float, float]
 
 
+def _readonly_float64(value):
+    """Convert a 1-D real array to a read-only contiguous float64 view.
+
+    No copy is made if `value` is already a contiguous float64 array.
+    """
+    if not _has_numpy:
+        raise ImportError("numpy is required to do this.")
+    array = np.asarray(value)
+    if array.ndim != 1:
+        raise ValueError(f"Expected a 1-D array, got shape {array.shape}")
+    if not (
+        np.issubdtype(array.dtype, np.floating) or np.issubdtype(array.dtype, np.integer)
+    ):
+        raise ValueError(f"Expected a real numeric array, got dtype {array.dtype}")
+    view = np.ascontiguousarray(array, dtype=np.float64).view()
+    view.flags.writeable = False
+    return view
+
+
+def _validate_float_array(value, handler):
+    """Keep NumPy arrays as float64 buffers, otherwise validate as list[float]."""
+    if _has_numpy and isinstance(value, np.ndarray):
+        return _readonly_float64(value)
+    return handler(value)
+
+
+def _serialize_float_array(value, handler):
+    """Serialize NumPy buffers as plain lists so JSON output is unchanged."""
+    if _has_numpy and isinstance(value, np.ndarray):
+        return value.tolist()
+    return handler(value)
+
+
+def _readonly_float64_matrix(value):
+    """Convert a 2-D real array to a read-only contiguous float64 view."""
+    if not _has_numpy:
+        raise ImportError("numpy is required to do this.")
+    array = np.asarray(value, dtype=np.float64)
+    if array.size == 0 and array.ndim == 1:
+        array = array.reshape(0, 0)
+    if array.ndim != 2:
+        raise ValueError(f"Expected a 2-D array, got shape {array.shape}")
+    view = np.ascontiguousarray(array).view()
+    view.flags.writeable = False
+    return view
+
+
+def _validate_float_matrix(value, handler):
+    """Store 2-D float data as a float64 buffer, otherwise list[list[float]]."""
+    if not _has_numpy:
+        return handler(value)
+    return _readonly_float64_matrix(value)
+
+
+def _to_complex128(value, ndim: int):
+    """Convert complex data to a read-only contiguous complex128 array.
+
+    Accepts complex arrays, real arrays of [re, im] pairs or interleaved
+    re, im values, nested [re, im] lists and base64 encoded little-endian
+    interleaved float64 buffers. Contiguous complex128 or float64 arrays
+    are not copied.
+    """
+    if not _has_numpy:
+        raise ImportError("numpy is required to do this.")
+    if isinstance(value, (str, bytes)):
+        buffer = np.frombuffer(base64.b64decode(value, validate=True), dtype="<c16")
+        if ndim == 2:
+            size = math.isqrt(len(buffer))
+            if size * size != len(buffer):
+                raise ValueError("Base64 complex matrix must be square")
+            buffer = buffer.reshape(size, size)
+        array = buffer.astype(np.complex128, copy=False)
+    else:
+        array = np.asarray(value)
+        if array.size == 0:
+            array = np.zeros((0,) * ndim, dtype=np.complex128)
+        elif np.issubdtype(array.dtype, np.complexfloating):
+            array = np.ascontiguousarray(array, dtype=np.complex128)
+        else:
+            if array.ndim == ndim + 1 and array.shape[-1] == 2:
+                shape = array.shape[:-1]
+            elif array.ndim == ndim and array.shape[-1] % 2 == 0:
+                shape = (*array.shape[:-1], array.shape[-1] // 2)
+            else:
+                raise ValueError(
+                    f"Expected [re, im] pairs or interleaved values with {ndim} "
+                    f"dimensions, got shape {array.shape}"
+                )
+            real = np.ascontiguousarray(array, dtype=np.float64)
+            array = real.view(np.complex128).reshape(shape)
+    if array.ndim != ndim:
+        raise ValueError(f"Expected {ndim} dimensions, got shape {array.shape}")
+    view = array.view()
+    view.flags.writeable = False
+    return view
+
+
+def _complex_validator(ndim: int):
+    def validate(value, handler):
+        if not _has_numpy:
+            return handler(value)
+        return _to_complex128(value, ndim)
+
+    return validate
+
+
+def _serialize_complex_array(value, handler):
+    """Serialize complex128 arrays as nested [re, im] lists."""
+    if _has_numpy and isinstance(value, np.ndarray):
+        return np.stack([value.real, value.imag], axis=-1).tolist()
+    return handler(value)
+
+
+def _eq_with_arrays(self, other) -> bool:
+    """Compare models field by field, comparing NumPy arrays by value."""
+    if not isinstance(other, BaseModel):
+        return NotImplemented
+    if type(self) is not type(other):
+        return False
+    for name in type(self).model_fields:
+        a, b = getattr(self, name), getattr(other, name)
+        if _has_numpy and (isinstance(a, np.ndarray) or isinstance(b, np.ndarray)):
+            if a is None or b is None or not np.array_equal(a, b):
+                return False
+        elif a != b:
+            return False
+    return True
+
+
+def _bus_indices(buses: list[str], index: dict[str, int]):
+    """Vectorized lookup of bus positions in `index`."""
+    try:
+        return np.fromiter(map(index.__getitem__, buses), dtype=np.intp, count=len(buses))
+    except KeyError as e:
+        raise ValueError(f"Bus {e.args[0]} is not in ids") from e
+
+
+FloatArray = Annotated[
+    list[float],
+    WrapValidator(_validate_float_array),
+    WrapSerializer(_serialize_float_array),
+]
+"""list[float] which may also hold a read-only float64 NumPy array.
+
+The JSON schema and JSON output are identical to list[float].
+"""
+
+FloatMatrix = Annotated[
+    list[list[float]],
+    WrapValidator(_validate_float_matrix),
+    WrapSerializer(_serialize_float_array),
+]
+"""list[list[float]] stored as a single read-only 2-D float64 NumPy array."""
+
+ComplexArray = Annotated[
+    list[Complex],
+    WrapValidator(_complex_validator(ndim=1)),
+    WrapSerializer(_serialize_complex_array),
+]
+"""list[Complex] packed into a single read-only complex128 NumPy array.
+
+Validates from [re, im] pairs (the JSON form), complex or interleaved
+float arrays and base64 buffers. JSON output is the [re, im] form.
+Without numpy this is a plain list[Complex].
+"""
+
+ComplexMatrix = Annotated[
+    list[list[Complex]],
+    WrapValidator(_complex_validator(ndim=2)),
+    WrapSerializer(_serialize_complex_array),
+]
+"""list[list[Complex]] packed into a single read-only 2-D complex128 NumPy array."""
+
+
 class StateArray(BaseModel):
     """Base class for power system equipment state arrays.
 
@@ -107,19 +299,89 @@ class MeasurementArray(BaseModel):
         "EquipmentNodeArray".
     """
 
-    values: list[float]
+    values: FloatArray
     "List of values"
     ids: list[str]
     "List of ids which values applies to"
     units: str
     "Unit of each float"
-    accuracy: list[float] | None = None
+    accuracy: FloatArray | None = None
     "Estimated or known std error at each location"
-    bad_data_threshold: list[float] | None = None
+    bad_data_threshold: FloatArray | None = None
     "Threshold after which value should be considered junk"
     time: datetime.datetime | None = None
     "Time of original measurement"
 
+    __eq__ = _eq_with_arrays
+
+    @classmethod
+    def from_numpy(
+        cls,
+        values,
+        ids: list[str],
+        accuracy=None,
+        bad_data_threshold=None,
+        **kwargs,
+    ):
+        """Create an array-backed measurement from NumPy arrays.
+
+        Arrays are validated once for dtype and shape and stored as read-only
+        float64 buffers. Contiguous float64 input is not copied, so the
+        arrays should not be modified afterwards.
+
+        Parameters
+        ----------
+        values : array_like
+            1-D array of values, one per id.
+        ids : list[str]
+            List of ids which values applies to.
+        accuracy : array_like, optional
+            1-D array of std errors, one per id.
+        bad_data_threshold : array_like, optional
+            1-D array of thresholds, one per id.
+        **kwargs :
+            Other fields such as `units`, `time` or `equipment_ids`.
+
+        Returns
+        -------
+        MeasurementArray
+            Instance of `cls` with NumPy arrays as `values`, `accuracy` and
+            `bad_data_threshold`.
+        """
+        arrays = {"values": _readonly_float64(values)}
+        if accuracy is not None:
+            arrays["accuracy"] = _readonly_float64(accuracy)
+        if bad_data_threshold is not None:
+            arrays["bad_data_threshold"] = _readonly_float64(bad_data_threshold)
+        for name, array in arrays.items():
+            if len(array) != len(ids):
+                raise ValueError(
+                    f"{name} has length {len(array)} but there are {len(ids)} ids"
+                )
+        return cls(ids=ids, **arrays, **kwargs)
+
+    @property
+    def values_array(self):
+        """Read-only float64 NumPy view of values.
+
+        No copy is made if the instance was created with `from_numpy`.
+        """
+        return _readonly_float64(self.values)
+
+    @property
+    def accuracy_array(self):
+        """Read-only float64 NumPy view of accuracy or None."""
+        if self.accuracy is None:
+            return None
+        return _readonly_float64(self.accuracy)
+
+    @property
+    def bad_data_threshold_array(self):
+        """Read-only float64 NumPy view of bad_data_threshold or None."""
+        if self.bad_data_threshold is None:
+            return None
+        return _readonly_float64(self.bad_data_threshold)
+
 
 class BusArray(MeasurementArray):
     """Measurements for or at power system buses (primarily voltages)."""
@@ -285,6 +547,321 @@ class StatesOfCharge(EquipmentArray):
     "Dimensionless unit"
 
 
+class MeasurementTimeSeries(BaseModel):
+    """Base class for measurement arrays over a window of time.
+
+    `values[i][j]` is the measurement at `times[i]` for `ids[j]`. Values are
+    stored as a single 2-D float64 array which grows with amortized doubling
+    in `append`, so a federate can publish a batch of timesteps in one
+    message. Accuracy and bad data thresholds are not carried.
+
+    Extended by classes such as "VoltagesMagnitudeSeries" whose
+    `measurement_type` is the corresponding single timestamp model.
+    """
+
+    values: FloatMatrix
+    "Matrix of values in time x id order"
+    ids: list[str]
+    "List of ids which each column applies to"
+    units: str
+    "Unit of each float"
+    times: list[datetime.datetime] = []
+    "Time of each row of values"
+
+    measurement_type: ClassVar[type[MeasurementArray]] = MeasurementArray
+    _buffer: Any = PrivateAttr(default=None)
+
+    __eq__ = _eq_with_arrays
+
+    @model_validator(mode="after")
+    def check_shape(self):
+        """Check values has one row per time and one column per id."""
+        if _has_numpy and isinstance(self.values, np.ndarray):
+            if self.values.size == 0:
+                self.values = _readonly_float64_matrix(np.empty((0, len(self.ids))))
+            if self.values.shape != (len(self.times), len(self.ids)):
+                raise ValueError(
+                    f"values has shape {self.values.shape}, expected "
+                    f"({len(self.times)}, {len(self.ids)}) for times x ids"
+                )
+        return self
+
+    def _key_fields(self) -> dict[str, Any]:
+        """Fields shared by every row (ids, units and equipment_ids)."""
+        return {"ids": self.ids, "units": self.units}
+
+    @classmethod
+    def from_measurements(cls, measurements: list[MeasurementArray], **kwargs):
+        """Stack single timestamp measurements sharing ids into a series.
+
+        Parameters
+        ----------
+        measurements : list[MeasurementArray]
+            Measurements with the same ids and a time.
+        **kwargs :
+            Fields used if `measurements` is empty, such as `ids`.
+
+        Returns
+        -------
+        MeasurementTimeSeries
+        """
+        if len(measurements) == 0:
+            return cls(values=[], **kwargs)
+        if not _has_numpy:
+            raise ImportError("numpy is required to do this.")
+        first = measurements[0]
+        fields = {
+            name: getattr(first, name)
+            for name in cls.model_fields
+            if name not in ("values", "times")
+        }
+        series = cls(values=np.empty((0, len(first.ids))), **fields | kwargs)
+        series.extend(measurements)
+        return series
+
+    def _reserve(self, rows: int):
+        """Make room for `rows` more rows, doubling the buffer if needed."""
+        if not _has_numpy:
+            raise ImportError("numpy is required to do this.")
+        length = len(self.times)
+        if self._buffer is None or len(self._buffer) < length + rows:
+            capacity = max(length + rows, 2 * length, 16)
+            buffer = np.empty((capacity, len(self.ids)), dtype=np.float64)
+            buffer[:length] = self.values
+            self._buffer = buffer
+
+    def _set_length(self, length: int):
+        self.values = _readonly_float64_matrix(self._buffer[:length])
+
+    def _check_compatible(self, measurement: MeasurementArray) -> datetime.datetime:
+        """Time of a measurement which can be added to the series."""
+        for name, value in self._key_fields().items():
+            if getattr(measurement, name, None) != value:
+                raise ValueError(f"Measurement {name} does not match the series")
+        if measurement.time is None:
+            raise ValueError("Measurement must have a time to be added to a series")
+        return measurement.time
+
+    def append(self, measurement: MeasurementArray):
+        """Add a single timestamp measurement with the same ids as a new row."""
+        self.extend([measurement])
+
+    def extend(self, measurements: list[MeasurementArray]):
+        """Add single timestamp measurements with the same ids as new rows."""
+        times = [self._check_compatible(measurement) for measurement in measurements]
+        length = len(self.times)
+        self._reserve(len(measurements))
+        for i, measurement in enumerate(measurements):
+            self._buffer[length + i] = measurement.values_array
+        self.times.extend(times)
+        self._set_length(len(self.times))
+
+    def to_measurements(self) -> list[MeasurementArray]:
+        """Split into single timestamp measurements whose values are row views."""
+        return [
+            self.measurement_type.from_numpy(row, time=time, **self._key_fields())
+            for row, time in zip(self.values, self.times, strict=True)
+        ]
+
+    def _subset(self, rows, columns):
+        fields = self._key_fields()
+        for name, value in fields.items():
+            if isinstance(value, list) and columns is not None:
+                fields[name] = [value[i] for i in columns]
+        values = np.asarray(self.values)
+        if rows is not None:
+            values = values[rows]
+        if columns is not None:
+            values = values[:, columns]
+        times = self.times if rows is None else [self.times[i] for i in rows]
+        return type(self)(values=values, times=times, **fields)
+
+    def window(
+        self,
+        start: datetime.datetime | None = None,
+        end: datetime.datetime | None = None,
+    ):
+        """Rows with `start <= time < end` as a new series."""
+        rows = [
+            i
+            for i, time in enumerate(self.times)
+            if (start is None or time >= start) and (end is None or time < end)
+        ]
+        return self._subset(np.asarray(rows, dtype=np.intp), None)
+
+    def select(self, ids: list[str]):
+        """Columns for `ids` (in that order) as a new series."""
+        index = {id: i for i, id in enumerate(self.ids)}
+        return self._subset(None, _bus_indices(ids, index))
+
+
+class EquipmentNodeTimeSeries(MeasurementTimeSeries):
+    """Series of `EquipmentNodeArray` with primary key ids + equipment_ids."""
+
+    equipment_ids: list[str]
+    "Unique ID for values such as 'PVSystem.113'"
+
+    measurement_type: ClassVar[type[MeasurementArray]] = EquipmentNodeArray
+
+    def _key_fields(self) -> dict[str, Any]:
+        return super()._key_fields() | {"equipment_ids": self.equipment_ids}
+
+    def select(self, ids: list[str], equipment_ids: list[str] | None = None):
+        """Columns for `ids` (and `equipment_ids` if given) as a new series."""
+        if equipment_ids is None:
+            return super().select(ids)
+        index = {key: i for i, key in enumerate(zip(self.ids, self.equipment_ids))}
+        try:
+            columns = [index[key] for key in zip(ids, equipment_ids, strict=True)]
+        except KeyError as e:
+            raise ValueError(f"{e.args[0]} is not in ids and equipment_ids") from e
+        return self._subset(None, np.asarray(columns, dtype=np.intp))
+
+
+class VoltagesMagnitudeSeries(MeasurementTimeSeries):
+    """Voltage magnitude measurements at buses over time."""
+
+    units: str = "V"
+    "Unit for voltage"
+
+    measurement_type: ClassVar[type[MeasurementArray]] = VoltagesMagnitude
+
+
+class VoltagesAngleSeries(MeasurementTimeSeries):
+    """Voltage angle measurements at buses over time."""
+
+    units: str = "radians"
+    "Unit for angle"
+
+    measurement_type: ClassVar[type[MeasurementArray]] = VoltagesAngle
+
+
+class VoltagesRealSeries(MeasurementTimeSeries):
+    """Real component of voltage measurements at buses over time."""
+
+    units: str = "V"
+    "Unit for voltage"
+
+    measurement_type: ClassVar[type[MeasurementArray]] = VoltagesReal
+
+
+class VoltagesImaginarySeries(MeasurementTimeSeries):
+    """Imaginary component of voltage measurements at buses over time."""
+
+    units: str = "V"
+    "Unit for voltage"
+
+    measurement_type: ClassVar[type[MeasurementArray]] = VoltagesImaginary
+
+
+class CurrentsMagnitudeSeries(MeasurementTimeSeries):
+    """Current magnitude measurements at equipment over time."""
+
+    units: str = "A"
+    "Unit for current"
+
+    measurement_type: ClassVar[type[MeasurementArray]] = CurrentsMagnitude
+
+
+class CurrentsAngleSeries(MeasurementTimeSeries):
+    """Current angle measurements at equipment over time."""
+
+    units: str = "radians"
+    "Unit for angle"
+
+    measurement_type: ClassVar[type[MeasurementArray]] = CurrentsAngle
+
+
+class CurrentsRealSeries(MeasurementTimeSeries):
+    """Real component of current measurements at equipment over time."""
+
+    units: str = "A"
+    "Unit for current"
+
+    measurement_type: ClassVar[type[MeasurementArray]] = CurrentsReal
+
+
+class CurrentsImaginarySeries(MeasurementTimeSeries):
+    """Imaginary component of current measurements at equipment over time."""
+
+    units: str = "A"
+    "Unit for current"
+
+    measurement_type: ClassVar[type[MeasurementArray]] = CurrentsImaginary
+
+
+class PowersMagnitudeSeries(EquipmentNodeTimeSeries):
+    """Power magnitude measurements at equipment nodes over time."""
+
+    units: str = "kVA"
+    "Unit for power"
+
+    measurement_type: ClassVar[type[MeasurementArray]] = PowersMagnitude
+
+
+class PowersAngleSeries(EquipmentNodeTimeSeries):
+    """Power angle measurements at equipment nodes over time."""
+
+    units: str = "radians"
+    "Unit for angle"
+
+    measurement_type: ClassVar[type[MeasurementArray]] = PowersAngle
+
+
+class PowersRealSeries(EquipmentNodeTimeSeries):
+    """Real power measurements at equipment nodes over time."""
+
+    units: str = "kW"
+    "Unit for power"
+
+    measurement_type: ClassVar[type[MeasurementArray]] = PowersReal
+
+
+class PowersImaginarySeries(EquipmentNodeTimeSeries):
+    """Reactive power measurements at equipment nodes over time."""
+
+    units: str = "kVAR"
+    "Unit for power"
+
+    measurement_type: ClassVar[type[MeasurementArray]] = PowersImaginary
+
+
+class SolarIrradiancesSeries(MeasurementTimeSeries):
+    """Solar irradiance measurements at equipment over time."""
+
+    units: str = "kW/m^2"
+    "Unit for power per area"
+
+    measurement_type: ClassVar[type[MeasurementArray]] = SolarIrradiances
+
+
+class TemperaturesSeries(MeasurementTimeSeries):
+    """Temperature measurements at equipment over time."""
+
+    units: str = "C"
+    "Unit for temperature"
+
+    measurement_type: ClassVar[type[MeasurementArray]] = Temperatures
+
+
+class WindSpeedsSeries(MeasurementTimeSeries):
+    """Wind speed measurements at equipment over time."""
+
+    units: str = "m/s"
+    "Unit for speed"
+
+    measurement_type: ClassVar[type[MeasurementArray]] = WindSpeeds
+
+
+class StatesOfChargeSeries(MeasurementTimeSeries):
+    """State of charge measurements for energy storage over time."""
+
+    units: str = "percent"
+    "Dimensionless unit"
+
+    measurement_type: ClassVar[type[MeasurementArray]] = StatesOfCharge
+
+
 class Topology(BaseModel):
     """Power system network topology with admittance and injection data."""
 
@@ -327,22 +904,132 @@ class IncidenceList(Incidence):
 class AdmittanceSparse(Incidence):
     """Sparse representation of network admittance matrix."""
 
-    admittance_list: list[Complex]
+    admittance_list: ComplexArray
     "Sparse admittance values with incidence connections"
     units: str = "S"
     "Unit for admittance"
 
+    __eq__ = _eq_with_arrays
+
+    def to_scipy(self, ids: list[str] | None = None, format: str = "csr"):
+        """Convert to a complex128 SciPy sparse matrix.
+
+        Repeated (from, to) entries are summed.
+
+        Parameters
+        ----------
+        ids : list[str], optional
+            Bus order of rows and columns. Defaults to buses in order of
+            first appearance in from_equipment, then to_equipment.
+        format : str
+            SciPy sparse format such as "csr" or "csc".
+
+        Returns
+        -------
+        tuple[scipy.sparse.spmatrix, list[str]]
+            Sparse admittance matrix and the bus id of each row/column.
+        """
+        from scipy.sparse import coo_matrix
+
+        if ids is None:
+            ids = list(dict.fromkeys(self.from_equipment + self.to_equipment))
+        index = {bus: i for i, bus in enumerate(ids)}
+        rows = _bus_indices(self.from_equipment, index)
+        cols = _bus_indices(self.to_equipment, index)
+        data = _to_complex128(self.admittance_list, ndim=1)
+        matrix = coo_matrix((data, (rows, cols)), shape=(len(ids), len(ids)))
+        return matrix.asformat(format), ids
+
+    @classmethod
+    def from_scipy(cls, matrix, ids: list[str], **kwargs):
+        """Create from a SciPy sparse (or dense NumPy) admittance matrix.
+
+        Parameters
+        ----------
+        matrix : scipy.sparse.spmatrix | numpy.ndarray
+            Square complex admittance matrix.
+        ids : list[str]
+            Bus id of each row/column.
+        **kwargs :
+            Other fields such as `units` or `equipment_type`.
+
+        Returns
+        -------
+        AdmittanceSparse
+        """
+        from scipy.sparse import coo_matrix
+
+        coo = coo_matrix(matrix)
+        if coo.shape != (len(ids), len(ids)):
+            raise ValueError(f"Matrix shape {coo.shape} does not match {len(ids)} ids")
+        bus_ids = np.asarray(ids, dtype=object)
+        return cls(
+            from_equipment=bus_ids[coo.row].tolist(),
+            to_equipment=bus_ids[coo.col].tolist(),
+            admittance_list=coo.data.astype(np.complex128),
+            **kwargs,
+        )
+
 
 class AdmittanceMatrix(BaseModel):
     """Dense representation of network admittance matrix."""
 
-    admittance_matrix: list[list[Complex]]
+    admittance_matrix: ComplexMatrix
     "Dense matrix for admittance"
     ids: list[str]
     "Row and column bus IDs"
     units: str = "S"
     "Unit for admittance"
 
+    __eq__ = _eq_with_arrays
+
+    def to_numpy(self):
+        """Read-only dense complex128 NumPy array ordered by ids (no copy)."""
+        return _to_complex128(self.admittance_matrix, ndim=2)
+
+    def to_scipy(self, format: str = "csr"):
+        """Convert to a complex128 SciPy sparse matrix.
+
+        Parameters
+        ----------
+        format : str
+            SciPy sparse format such as "csr" or "csc".
+
+        Returns
+        -------
+        tuple[scipy.sparse.spmatrix, list[str]]
+            Sparse admittance matrix and the bus id of each row/column.
+        """
+        from scipy.sparse import coo_matrix
+
+        return coo_matrix(self.to_numpy()).asformat(format), self.ids
+
+    @classmethod
+    def from_numpy(cls, matrix, ids: list[str], **kwargs):
+        """Create from a square complex NumPy array or SciPy sparse matrix.
+
+        Parameters
+        ----------
+        matrix : numpy.ndarray | scipy.sparse.spmatrix
+            Square complex admittance matrix.
+        ids : list[str]
+            Bus id of each row/column.
+        **kwargs :
+            Other fields such as `units`.
+
+        Returns
+        -------
+        AdmittanceMatrix
+        """
+        if hasattr(matrix, "toarray"):
+            matrix = matrix.toarray()
+        matrix = np.asarray(matrix, dtype=np.complex128)
+        if matrix.shape != (len(ids), len(ids)):
+            raise ValueError(f"Matrix shape {matrix.shape} does not match {len(ids)} ids")
+        return cls(admittance_matrix=matrix, ids=ids, **kwargs)
+
+    from_scipy = from_numpy
+
 
 class Injection(BaseModel):
     """Current and power injections at network nodes."""
@@ -0,0 +1,211 @@
+"""Delta-encoded publications for slowly changing arrays.
+
+Links such as `SwitchStates`, `CapacitorStates`, `RegulatorStates` or
+`Temperatures` barely change between time steps. `DeltaEncoder` sends only
+the indices of `values` which changed by more than a threshold since the
+last message, plus a full keyframe every `keyframe_interval` messages or
+whenever the ids change. `DeltaDecoder` keeps the last full state and
+rebuilds complete models.
+
+Messages are JSON strings::
+
+    {"keyframe": true, "sequence": 0, "data": {...full model...}}
+    {"keyframe": false, "sequence": 1, "indices": [3], "values": [1.02],
+     "data": {...other fields such as time...}}
+
+HELICS value subscriptions only keep the latest value, so every delta has
+a sequence number. If the decoder sees a gap it returns None until the
+next keyframe. Reading the same message again returns the last model.
+
+Examples
+--------
+>>> encoder = DeltaEncoder(absolute_threshold=0.1, keyframe_interval=96)
+>>> pub.publish(encoder.encode(temperatures))
+
+>>> decoder = DeltaDecoder()
+>>> temperatures = decoder.decode(sub.string, Temperatures)
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+from typing import TypeVar
+
+from pydantic import BaseModel
+
+from .common import IdentifiedValues
+
+try:
+    import numpy as np
+except ImportError:
+    _has_dependencies = False
+else:
+    _has_dependencies = True
+
+logger = logging.getLogger(__name__)
+
+ModelType = TypeVar("ModelType", bound=BaseModel)
+
+_ID_FIELDS = ("ids", "equipment_ids")
+
+
+def _exclude(model: IdentifiedValues) -> set[str]:
+    return {"values", *(name for name in _ID_FIELDS if hasattr(model, name))}
+
+
+class DeltaEncoder:
+    """Encode `StateArray` or `MeasurementArray` publications as deltas.
+
+    A value is sent if ``|new - last| > absolute_threshold +
+    relative_threshold * |last|`` where `last` is the value the subscriber
+    currently holds. With the default thresholds every change is sent.
+
+    Parameters
+    ----------
+    absolute_threshold : float
+        Absolute change below which a value is not sent.
+    relative_threshold : float
+        Change relative to the last sent value below which a value is not sent.
+    keyframe_interval : int
+        Send a full keyframe every this many messages.
+    """
+
+    def __init__(
+        self,
+        absolute_threshold: float = 0.0,
+        relative_threshold: float = 0.0,
+        keyframe_interval: int = 100,
+    ):
+        """Create encoder state for a single publication."""
+        if not _has_dependencies:
+            raise ImportError("numpy is required to do this.")
+        self.absolute_threshold = absolute_threshold
+        self.relative_threshold = relative_threshold
+        self.keyframe_interval = keyframe_interval
+        self._sequence = 0
+        self._since_keyframe = 0
+        self._ids: tuple[list[str], list[str] | None] | None = None
+        self._state = None
+
+    def _changed(self, values, state):
+        """Boolean mask of values which moved past the thresholds."""
+        difference = np.abs(values - state)
+        tolerance = self.absolute_threshold + self.relative_threshold * np.abs(state)
+        both_nan = np.isnan(values) & np.isnan(state)
+        return ~(difference <= tolerance) & ~both_nan
+
+    def encode(self, model: IdentifiedValues) -> str:
+        """Encode `model` as a keyframe or a delta.
+
+        Parameters
+        ----------
+        model : IdentifiedValues
+            Model with `values` and `ids`, e.g. `SwitchStates`.
+
+        Returns
+        -------
+        str
+            JSON message for a string publication.
+        """
+        values = np.asarray(model.values)
+        ids = (model.ids, getattr(model, "equipment_ids", None))
+        state = self._state
+        if (
+            state is None
+            or self._since_keyframe >= self.keyframe_interval
+            or ids != self._ids
+        ):
+            self._ids = (list(ids[0]), None if ids[1] is None else list(ids[1]))
+            self._state = values.copy()
+            self._since_keyframe = 0
+            message = (
+                f'{{"keyframe":true,"sequence":{self._sequence},'
+                f'"data":{model.model_dump_json()}}}'
+            )
+        else:
+            indices = np.flatnonzero(self._changed(values, state))
+            state[indices] = values[indices]
+            message = json.dumps(
+                {
+                    "keyframe": False,
+                    "sequence": self._sequence,
+                    "indices": indices.tolist(),
+                    "values": values[indices].tolist(),
+                }
+            )
+            data = model.model_dump_json(exclude=_exclude(model))
+            message = f'{message[:-1]},"data":{data}}}'
+
+        self._sequence += 1
+        self._since_keyframe += 1
+        return message
+
+
+class DeltaDecoder:
+    """Rebuild full models from `DeltaEncoder` messages."""
+
+    def __init__(self):
+        """Create decoder state for a single subscription."""
+        if not _has_dependencies:
+            raise ImportError("numpy is required to do this.")
+        self._sequence: int | None = None
+        self._keyframe: dict | None = None
+        self._state = None
+        self._model: BaseModel | None = None
+
+    def decode(self, data: str | bytes, cls: type[ModelType]) -> ModelType | None:
+        """Apply a keyframe or delta message and return the full model.
+
+        Parameters
+        ----------
+        data : str | bytes
+            Message from `DeltaEncoder.encode`.
+        cls : type[BaseModel]
+            Model class to validate into.
+
+        Returns
+        -------
+        BaseModel | None
+            Full instance of `cls`, or None while waiting for a keyframe
+            after a missed message.
+        """
+        message = json.loads(data)
+        sequence = message["sequence"]
+        if sequence == self._sequence and isinstance(self._model, cls):
+            # The same publication read again without a new update.
+            return self._model
+        if message["keyframe"]:
+            self._keyframe = message["data"]
+            self._state = np.asarray(message["data"]["values"])
+            self._sequence = sequence
+            model = cls.model_validate(message["data"])
+            self._model = model
+            return model
+
+        if self._sequence is None or sequence != self._sequence + 1:
+            if self._sequence is not None:
+                logger.warning(
+                    f"Missed delta messages {self._sequence + 1} to {sequence - 1}, "
+                    "waiting for the next keyframe"
+                )
+            self._sequence = None
+            self._model = None
+            return None
+
+        # A delta only follows a keyframe, which sets the state.
+        state, keyframe = self._state, self._keyframe
+        assert state is not None and keyframe is not None
+        self._sequence = sequence
+        state[message["indices"]] = message["values"]
+        fields = message["data"]
+        for name in _ID_FIELDS:
+            if name in keyframe:
+                fields[name] = keyframe[name]
+        if np.issubdtype(state.dtype, np.floating):
+            fields["values"] = state.copy()
+        else:
+            fields["values"] = state.tolist()
+        model = cls.model_validate(fields)
+        self._model = model
+        return model
@@ -34,6 +34,24 @@ all_classes = [
     Temperatures,
     WindSpeeds,
     StatesOfCharge,
+    MeasurementTimeSeries,
+    EquipmentNodeTimeSeries,
+    VoltagesMagnitudeSeries,
+    VoltagesAngleSeries,
+    VoltagesRealSeries,
+    VoltagesImaginarySeries,
+    CurrentsMagnitudeSeries,
+    CurrentsAngleSeries,
+    CurrentsRealSeries,
+    CurrentsImaginarySeries,
+    PowersMagnitudeSeries,
+    PowersAngleSeries,
+    PowersRealSeries,
+    PowersImaginarySeries,
+    SolarIrradiancesSeries,
+    TemperaturesSeries,
+    WindSpeedsSeries,
+    StatesOfChargeSeries,
     Topology,
     AdmittanceSparse,
     AdmittanceMatrix,
@@ -0,0 +1,185 @@
+"""ID-dictionary handshake for measurement publications.
+
+Every `MeasurementArray` publication normally carries its full `ids` list
+(and `equipment_ids` for `EquipmentNodeArray`), even though these rarely
+change during a simulation. With this opt-in protocol the publisher sends
+the id table (`IdSchema`) once, or whenever it changes, and later messages
+only carry the remaining fields plus the schema hash.
+
+Messages are JSON strings, so they can be published on the same
+`HELICS_DATA_TYPE_STRING` publications::
+
+    {"schema_hash": "...", "id_schema": {...}, "data": {"values": [...], ...}}
+
+`id_schema` is only present in full messages.
+
+Falling back to full messages:
+
+- `IdTablePublisher` re-sends the full message every
+  `full_message_interval` publications, so a subscriber which missed the
+  handshake recovers.
+- `IdTableSubscriber.decode` returns None for an unknown schema hash
+  until the next full message arrives.
+- `IdTableSubscriber.decode` also accepts ordinary `model_dump_json`
+  messages, so a publisher can switch back to plain JSON at any time.
+
+Examples
+--------
+>>> publisher = IdTablePublisher(full_message_interval=96)
+>>> pub.publish(publisher.encode(voltages))
+
+>>> subscriber = IdTableSubscriber()
+>>> voltages = subscriber.decode(sub.string, VoltagesMagnitude)
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+from typing import TypeVar
+
+from pydantic import BaseModel
+
+from .common import IdentifiedValues
+
+logger = logging.getLogger(__name__)
+
+ModelType = TypeVar("ModelType", bound=BaseModel)
+
+_ID_FIELDS = ("ids", "equipment_ids")
+
+
+def id_schema_hash(ids: list[str], equipment_ids: list[str] | None = None) -> str:
+    """Hash an id table (and optional equipment id table) to a short hex string."""
+    digest = hashlib.blake2b(digest_size=8)
+    digest.update("\x1f".join(ids).encode("utf-8"))
+    if equipment_ids is not None:
+        digest.update(b"\x1e")
+        digest.update("\x1f".join(equipment_ids).encode("utf-8"))
+    return digest.hexdigest()
+
+
+class IdSchema(BaseModel):
+    """Versioned id table shared between a publisher and its subscribers."""
+
+    hash: str
+    "Hash of ids and equipment_ids from `id_schema_hash`"
+    version: int
+    "Incremented by the publisher every time the id table changes"
+    ids: list[str]
+    "List of ids which values applies to"
+    equipment_ids: list[str] | None = None
+    "Equipment ids for `EquipmentNodeArray` publications"
+
+
+def _id_fields(model: IdentifiedValues) -> set[str]:
+    return {name for name in _ID_FIELDS if hasattr(model, name)}
+
+
+class IdTablePublisher:
+    """Encode publications of one port with the id table handshake.
+
+    Parameters
+    ----------
+    full_message_interval : int, optional
+        Send the full message with the id table every this many
+        publications. By default the table is only sent when it changes.
+    """
+
+    def __init__(self, full_message_interval: int | None = None):
+        """Create publisher state for a single publication."""
+        self.full_message_interval = full_message_interval
+        self.schema: IdSchema | None = None
+        self._since_full_message = 0
+
+    def encode(self, model: IdentifiedValues) -> str:
+        """Encode `model`, including the id table only if needed.
+
+        Parameters
+        ----------
+        model : IdentifiedValues
+            Model with an `ids` field, e.g. a `MeasurementArray`.
+
+        Returns
+        -------
+        str
+            JSON message for a string publication.
+        """
+        id_fields = _id_fields(model)
+        equipment_ids = getattr(model, "equipment_ids", None)
+        schema_hash = id_schema_hash(model.ids, equipment_ids)
+
+        send_schema = self.schema is None or self.schema.hash != schema_hash
+        if send_schema:
+            version = 0 if self.schema is None else self.schema.version + 1
+            self.schema = IdSchema(
+                hash=schema_hash,
+                version=version,
+                ids=model.ids,
+                equipment_ids=equipment_ids,
+            )
+        elif self.full_message_interval is not None:
+            send_schema = self._since_full_message >= self.full_message_interval
+
+        if send_schema:
+            self._since_full_message = 0
+        self._since_full_message += 1
+
+        data = model.model_dump_json(exclude=id_fields)
+        if send_schema:
+            return (
+                f'{{"schema_hash":"{schema_hash}",'
+                f'"id_schema":{self.schema.model_dump_json()},"data":{data}}}'
+            )
+        return f'{{"schema_hash":"{schema_hash}","data":{data}}}'
+
+
+class IdTableSubscriber:
+    """Reconstruct full models from id table handshake messages.
+
+    Id tables are cached by hash, so one subscriber can decode several
+    publications.
+    """
+
+    def __init__(self):
+        """Create an empty id table cache."""
+        self.schemas: dict[str, IdSchema] = {}
+
+    def decode(self, data: str | bytes, cls: type[ModelType]) -> ModelType | None:
+        """Decode a message into `cls`.
+
+        Parameters
+        ----------
+        data : str | bytes
+            Message from `IdTablePublisher.encode` or a plain
+            `model_dump_json` message.
+        cls : type[BaseModel]
+            Model class to validate into.
+
+        Returns
+        -------
+        BaseModel | None
+            Instance of `cls`, or None if the message refers to an id table
+            which has not been received yet.
+        """
+        message = json.loads(data)
+        if "schema_hash" not in message:
+            return cls.model_validate(message)
+
+        if "id_schema" in message:
+            schema = IdSchema.model_validate(message["id_schema"])
+            self.schemas[schema.hash] = schema
+        schema = self.schemas.get(message["schema_hash"])
+        if schema is None:
+            logger.warning(
+                f"Unknown id schema {message['schema_hash']}, "
+                "waiting for the next full message"
+            )
+            return None
+
+        fields = message["data"]
+        fields["ids"] = schema.ids
+        if schema.equipment_ids is not None:
+            fields["equipment_ids"] = schema.equipment_ids
+        return cls.model_validate(fields)
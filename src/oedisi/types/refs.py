@@ -0,0 +1,137 @@
+"""External parameter references for bulk component data.
+
+Instead of inlining large arrays in the wiring diagram, a component
+parameter can reference a file::
+
+    {"profile": {"$ref": "profiles/load.npy"}}
+    {"profile": {"$ref": "profiles/loads.parquet", "column": "load_1"}}
+
+Only dictionaries with a string ``$ref`` and at most a ``column`` are
+references, other dictionaries with a ``$ref`` key are ordinary
+parameters.
+
+`oedisi build` links the referenced file into the component's `refs/`
+directory and rewrites the reference relative to the component
+directory (see `oedisi.componentframework.parameter_refs`). Federates
+then load references with `load_ref`, or every reference in their
+static inputs with `resolve_refs`, relative to their component
+directory:
+
+- ``.npy`` files are memory-mapped read-only,
+- ``.arrow``, ``.feather`` and ``.ipc`` files are memory-mapped and
+  read with pyarrow,
+- ``.parquet`` files are read with pyarrow.
+
+With a ``column`` the result is a NumPy array of that column, otherwise
+``.npy`` files give an array and table files a `pyarrow.Table`.
+
+Examples
+--------
+>>> with open("static_inputs.json") as f:
+...     parameters = resolve_refs(json.load(f), ".")
+>>> parameters["profile"]  # read-only memory-mapped array
+"""
+
+import os
+from typing import Any
+
+try:
+    import numpy as np
+except ImportError:
+    _has_numpy = False
+else:
+    _has_numpy = True
+
+try:
+    import pyarrow as pa
+    import pyarrow.feather
+    import pyarrow.parquet
+except ImportError:
+    _has_pyarrow = False
+else:
+    _has_pyarrow = True
+
+REF_KEY = "$ref"
+"Key marking a parameter as a reference to an external file"
+COLUMN_KEY = "column"
+"Optional key selecting a table column of a reference"
+
+NUMPY_SUFFIXES = (".npy",)
+ARROW_SUFFIXES = (".arrow", ".feather", ".ipc")
+PARQUET_SUFFIXES = (".parquet",)
+
+
+def is_ref(value: Any) -> bool:
+    """Check whether a parameter value is a `{"$ref": path}` reference.
+
+    The dictionary may only hold a string path and an optional column.
+    """
+    return (
+        isinstance(value, dict)
+        and isinstance(value.get(REF_KEY), str)
+        and set(value) <= {REF_KEY, COLUMN_KEY}
+        and (value.get(COLUMN_KEY) is None or isinstance(value[COLUMN_KEY], str))
+    )
+
+
+def _table_column(table, column: str | None):
+    if column is None:
+        return table
+    if column not in table.column_names:
+        raise ValueError(f"Column {column} is not in {table.column_names}")
+    return table.column(column).to_numpy()
+
+
+def load_ref(ref: dict, base_directory) -> Any:
+    """Load the data a reference points to.
+
+    Parameters
+    ----------
+    ref : dict
+        Reference with a "$ref" path and an optional "column".
+    base_directory : str | Path
+        Directory relative paths are resolved against, the component
+        directory. Packed federates share a working directory, so this is
+        not the working directory in general.
+
+    Returns
+    -------
+    numpy.ndarray | pyarrow.Table
+        Read-only memory-mapped array for ``.npy`` files, the column as a
+        NumPy array if "column" is given, otherwise a `pyarrow.Table`.
+    """
+    path = os.path.join(base_directory, ref[REF_KEY])
+    column = ref.get(COLUMN_KEY)
+    suffix = os.path.splitext(path)[1].lower()
+    if suffix in NUMPY_SUFFIXES:
+        if not _has_numpy:
+            raise ImportError("numpy is required to load .npy references.")
+        if column is not None:
+            raise ValueError(f"{path} has no columns, remove 'column' from the reference")
+        return np.load(path, mmap_mode="r")
+    if suffix in ARROW_SUFFIXES + PARQUET_SUFFIXES:
+        if not _has_pyarrow:
+            raise ImportError(f"pyarrow is required to load {suffix} references.")
+        columns = None if column is None else [column]
+        if suffix in PARQUET_SUFFIXES:
+            table = pa.parquet.read_table(path, columns=columns, memory_map=True)
+        else:
+            table = pa.feather.read_table(path, columns=columns, memory_map=True)
+        return _table_column(table, column)
+    raise ValueError(f"Unsupported reference file type {suffix} for {path}")
+
+
+def resolve_refs(parameters: Any, base_directory) -> Any:
+    """Replace every reference nested in `parameters` by its loaded data.
+
+    Relative paths are resolved against `base_directory`, see `load_ref`.
+    """
+    if is_ref(parameters):
+        return load_ref(parameters, base_directory)
+    if isinstance(parameters, dict):
+        return {
+            key: resolve_refs(value, base_directory) for key, value in parameters.items()
+        }
+    if isinstance(parameters, list):
+        return [resolve_refs(value, base_directory) for value in parameters]
+    return parameters
@@ -0,0 +1,62 @@
+import datetime
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from oedisi.types.alignment import IdAligner
+from oedisi.types.data_types import (
+    PowersReal,
+    VoltagesMagnitude,
+    VoltagesMagnitudeSeries,
+)
+
+
+def test_align_reorders_values():
+    aligner = IdAligner(["c", "a"])
+    voltages = VoltagesMagnitude(values=[1.0, 2.0, 3.0], ids=["a", "b", "c"])
+    np.testing.assert_array_equal(aligner.align(voltages), [3.0, 1.0])
+
+
+def test_permutation_cached():
+    aligner = IdAligner(["b", "a"], cache_size=2)
+    ids = ["a", "b"]
+    first = aligner.permutation(ids)
+    assert aligner.permutation(ids) is first
+    assert aligner.permutation(list(ids)) is first
+    aligner.permutation(["b", "a"])
+    aligner.permutation(["a", "b", "c"])
+    assert len(aligner._cache) == 2
+    assert aligner.permutation(["a", "b"]) is not first
+
+
+def test_missing_ids():
+    voltages = VoltagesMagnitude(values=[1.0, 2.0], ids=["a", "b"])
+    with pytest.raises(ValueError, match="missing"):
+        IdAligner(["a", "z"]).align(voltages)
+    aligned = IdAligner(["a", "z"], fill_value=np.nan).align(voltages)
+    assert aligned[0] == 1.0 and np.isnan(aligned[1])
+    empty = VoltagesMagnitude(values=[], ids=[])
+    np.testing.assert_array_equal(IdAligner(["a"], fill_value=0.0).align(empty), [0.0])
+
+
+def test_equipment_node_keys():
+    powers = PowersReal(
+        values=[1.0, 2.0, 3.0],
+        ids=["113.1", "113.1", "114.1"],
+        equipment_ids=["PVSystem.113", "Load.113", "Load.114"],
+    )
+    aligner = IdAligner(["113.1", "114.1"], equipment_ids=["Load.113", "Load.114"])
+    np.testing.assert_array_equal(aligner.align(powers), [2.0, 3.0])
+    with pytest.raises(ValueError):
+        aligner.align(VoltagesMagnitude(values=[1.0], ids=["113.1"]))
+
+
+def test_align_series():
+    start = datetime.datetime(2024, 1, 1)
+    series = VoltagesMagnitudeSeries(
+        values=[[1.0, 2.0], [3.0, 4.0]],
+        ids=["a", "b"],
+        times=[start, start + datetime.timedelta(minutes=15)],
+    )
+    np.testing.assert_array_equal(IdAligner(["b", "a"]).align(series), [[2, 1], [4, 3]])
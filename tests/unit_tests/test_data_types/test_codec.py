@@ -0,0 +1,73 @@
+import datetime
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from oedisi.types.codec import decode, encode, is_encoded
+from oedisi.types.data_types import (
+    AdmittanceSparse,
+    Injection,
+    PowersReal,
+    SwitchStates,
+    Topology,
+    VoltagesReal,
+)
+
+
+def test_round_trip_equipment_node_array():
+    powers = PowersReal(
+        values=[1.0, 2.0, 3.5],
+        ids=["113.1", "113.2", "113.3"],
+        equipment_ids=["PVSystem.113", "PVSystem.113", "Load.é"],
+        accuracy=[0.1, 0.2, 0.3],
+        time=datetime.datetime(2024, 1, 1, 12),
+    )
+    data = encode(powers)
+    assert is_encoded(data)
+
+    restored = decode(data, PowersReal)
+    assert restored.model_dump_json() == powers.model_dump_json()
+    assert isinstance(restored.values, np.ndarray)
+
+
+def test_round_trip_state_array():
+    states = SwitchStates(values=[0, 1, 1], ids=["s1", "s2", "s3"])
+    assert decode(encode(states), SwitchStates) == states
+
+
+def test_round_trip_empty_and_nested():
+    empty = VoltagesReal(values=[], ids=[])
+    assert decode(encode(empty), VoltagesReal).ids == []
+
+    topology = Topology(
+        admittance=AdmittanceSparse(
+            from_equipment=["a"], to_equipment=["b"], admittance_list=[(1.0, 2.0)]
+        ),
+        injections=Injection(),
+        slack_bus=["a", ""],
+    )
+    assert decode(encode(topology), Topology) == topology
+
+
+def test_decode_rejects_json():
+    with pytest.raises(ValueError, match="not an OEDISI binary message"):
+        decode(b'{"values": []}', VoltagesReal)
+
+
+def test_encode_rejects_nul_ids():
+    with pytest.raises(ValueError, match="NUL"):
+        encode(VoltagesReal(values=[1.0], ids=["a\x00b"]))
+
+
+def test_encode_with_negotiated_encoding():
+    from oedisi.types.codec import decode_with, encode_with
+
+    voltages = VoltagesReal(values=[1.0, 2.0], ids=["a", "b"])
+    for encoding in ["json", "binary"]:
+        data = encode_with(voltages, encoding)
+        assert decode_with(data, VoltagesReal, encoding).ids == ["a", "b"]
+    with pytest.raises(NotImplementedError):
+        encode_with(voltages, "arrow")
+    with pytest.raises(TypeError, match="bytes"):
+        decode_with(voltages.model_dump_json(), VoltagesReal, "binary")
@@ -0,0 +1,43 @@
+import pytest
+
+from oedisi.types.compression import (
+    available_codecs,
+    compress,
+    decompress,
+    is_compressed,
+)
+from oedisi.types.data_types import VoltagesMagnitude
+
+
+def test_small_payloads_pass_through():
+    payload = VoltagesMagnitude(values=[1.0], ids=["a"]).model_dump_json()
+    data = compress(payload)
+    assert not is_compressed(data)
+    assert decompress(data) == payload.encode("utf-8")
+
+
+@pytest.mark.parametrize("codec", available_codecs())
+def test_round_trip_above_threshold(codec):
+    voltages = VoltagesMagnitude(values=[1.0] * 1000, ids=[f"bus_{i}" for i in range(1000)])
+    payload = voltages.model_dump_json()
+    data = compress(payload, threshold=100, codec=codec)
+    assert is_compressed(data)
+    assert len(data) < len(payload)
+    assert VoltagesMagnitude.model_validate_json(decompress(data)) == voltages
+
+
+def test_unavailable_codec():
+    with pytest.raises(ValueError, match="not available"):
+        compress(b"x" * 10, threshold=0, codec="brotli")
+
+
+@pytest.mark.parametrize("codec", available_codecs())
+def test_length_mismatch_rejected(codec):
+    data = compress(b"x" * 10_000, threshold=0, codec=codec)
+    # Claim a shorter original payload than the compressed data holds.
+    shorter = data[:5] + (100).to_bytes(8, "little") + data[13:]
+    with pytest.raises(ValueError, match="expected 100"):
+        decompress(shorter)
+    longer = data[:5] + (20_000).to_bytes(8, "little") + data[13:]
+    with pytest.raises(ValueError, match="expected 20000"):
+        decompress(longer)
@@ -0,0 +1,78 @@
+import json
+
+import pytest
+
+pytest.importorskip("numpy")
+
+from oedisi.types.data_types import SwitchStates, Temperatures
+from oedisi.types.delta import DeltaDecoder, DeltaEncoder
+
+
+def temperatures(values, time=None):
+    return Temperatures(values=values, ids=["t1", "t2", "t3"], time=time)
+
+
+def test_only_changes_past_threshold_are_sent():
+    encoder = DeltaEncoder(absolute_threshold=0.5)
+    decoder = DeltaDecoder()
+
+    first = encoder.encode(temperatures([20.0, 21.0, 22.0]))
+    assert json.loads(first)["keyframe"]
+    assert decoder.decode(first, Temperatures).values == [20.0, 21.0, 22.0]
+
+    second = json.loads(encoder.encode(temperatures([20.2, 23.0, 22.0])))
+    assert not second["keyframe"]
+    assert second["indices"] == [1]
+    decoded = decoder.decode(json.dumps(second), Temperatures)
+    assert list(decoded.values) == [20.0, 23.0, 22.0]
+    assert decoded.ids == ["t1", "t2", "t3"]
+
+    # Small drifts accumulate against the last sent value
+    third = json.loads(encoder.encode(temperatures([20.6, 23.0, 22.0])))
+    assert third["indices"] == [0]
+
+
+def test_relative_threshold_and_state_arrays():
+    encoder = DeltaEncoder(relative_threshold=0.1)
+    decoder = DeltaDecoder()
+    states = SwitchStates(values=[0, 1, 10], ids=["s1", "s2", "s3"])
+    decoder.decode(encoder.encode(states), SwitchStates)
+
+    changed = SwitchStates(values=[1, 1, 10], ids=["s1", "s2", "s3"])
+    message = encoder.encode(changed)
+    assert json.loads(message)["indices"] == [0]
+    assert decoder.decode(message, SwitchStates) == changed
+
+
+def test_keyframes_and_missed_messages():
+    encoder = DeltaEncoder(keyframe_interval=3)
+    decoder = DeltaDecoder()
+    messages = [encoder.encode(temperatures([float(i), 0.0, 0.0])) for i in range(4)]
+    assert [json.loads(m)["keyframe"] for m in messages] == [True, False, False, True]
+
+    decoder.decode(messages[0], Temperatures)
+    assert decoder.decode(messages[2], Temperatures) is None
+    assert list(decoder.decode(messages[3], Temperatures).values) == [3.0, 0.0, 0.0]
+
+
+def test_id_change_forces_keyframe():
+    encoder = DeltaEncoder()
+    encoder.encode(temperatures([1.0, 2.0, 3.0]))
+    message = encoder.encode(Temperatures(values=[1.0], ids=["t4"]))
+    assert json.loads(message)["keyframe"]
+
+
+def test_same_delta_read_twice(caplog):
+    encoder = DeltaEncoder()
+    decoder = DeltaDecoder()
+    decoder.decode(encoder.encode(temperatures([1.0, 2.0, 3.0])), Temperatures)
+    delta = encoder.encode(temperatures([1.0, 5.0, 3.0]))
+
+    # Components reading `sub.bytes` every step see the same publication twice.
+    first = decoder.decode(delta, Temperatures)
+    assert decoder.decode(delta, Temperatures) == first
+    assert list(first.values) == [1.0, 5.0, 3.0]
+    assert "Missed" not in caplog.text
+
+    following = encoder.encode(temperatures([1.0, 5.0, 7.0]))
+    assert list(decoder.decode(following, Temperatures).values) == [1.0, 5.0, 7.0]
@@ -0,0 +1,53 @@
+import json
+
+from oedisi.types.data_types import PowersReal, VoltagesMagnitude
+from oedisi.types.id_table import IdTablePublisher, IdTableSubscriber
+
+
+def voltages(values, ids=("a", "b", "c")):
+    return VoltagesMagnitude(values=values, ids=list(ids))
+
+
+def test_ids_sent_once():
+    publisher = IdTablePublisher()
+    subscriber = IdTableSubscriber()
+
+    first = publisher.encode(voltages([1.0, 2.0, 3.0]))
+    second = publisher.encode(voltages([4.0, 5.0, 6.0]))
+    assert "id_schema" in json.loads(first)
+    assert "id_schema" not in json.loads(second)
+    assert '"ids"' not in second
+
+    assert subscriber.decode(first, VoltagesMagnitude) == voltages([1.0, 2.0, 3.0])
+    assert subscriber.decode(second, VoltagesMagnitude) == voltages([4.0, 5.0, 6.0])
+
+
+def test_schema_resent_on_change_with_new_version():
+    publisher = IdTablePublisher()
+    subscriber = IdTableSubscriber()
+    subscriber.decode(publisher.encode(voltages([1.0, 2.0, 3.0])), VoltagesMagnitude)
+
+    message = json.loads(publisher.encode(voltages([1.0, 2.0], ids=("a", "d"))))
+    assert message["id_schema"]["version"] == 1
+    decoded = subscriber.decode(json.dumps(message), VoltagesMagnitude)
+    assert decoded.ids == ["a", "d"]
+
+
+def test_equipment_ids_and_unknown_hash_fallback():
+    powers = PowersReal(
+        values=[1.0, 2.0], ids=["1.1", "1.2"], equipment_ids=["PV.1", "PV.2"]
+    )
+    publisher = IdTablePublisher(full_message_interval=2)
+    late_subscriber = IdTableSubscriber()
+
+    publisher.encode(powers)  # missed by the late subscriber
+    assert late_subscriber.decode(publisher.encode(powers), PowersReal) is None
+    full = publisher.encode(powers)
+    assert "id_schema" in json.loads(full)
+    assert late_subscriber.decode(full, PowersReal) == powers
+
+
+def test_plain_json_accepted():
+    subscriber = IdTableSubscriber()
+    model = voltages([1.0, 2.0, 3.0])
+    assert subscriber.decode(model.model_dump_json(), VoltagesMagnitude) == model
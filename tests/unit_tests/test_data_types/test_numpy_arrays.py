@@ -0,0 +1,53 @@
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from oedisi.types.data_types import (
+    MeasurementArray,
+    PowersReal,
+    VoltagesMagnitude,
+)
+
+
+def test_from_numpy_is_zero_copy():
+    values = np.linspace(0.9, 1.1, 5)
+    voltages = VoltagesMagnitude.from_numpy(values, ids=list("abcde"))
+
+    assert np.shares_memory(voltages.values_array, values)
+    assert not voltages.values_array.flags.writeable
+    with pytest.raises(ValueError):
+        voltages.values_array[0] = 0.0
+
+
+def test_from_numpy_round_trip_json():
+    powers = PowersReal.from_numpy(
+        np.arange(3),
+        ids=["1.1", "1.2", "1.3"],
+        equipment_ids=["PVSystem.1"] * 3,
+        accuracy=np.full(3, 0.01),
+    )
+    assert powers.values_array.dtype == np.float64
+
+    restored = PowersReal.model_validate_json(powers.model_dump_json())
+    assert restored.values == [0.0, 1.0, 2.0]
+    assert restored.accuracy == [0.01, 0.01, 0.01]
+    assert restored.bad_data_threshold_array is None
+    np.testing.assert_array_equal(restored.values_array, powers.values_array)
+
+
+def test_from_numpy_schema_unchanged():
+    schema = MeasurementArray.model_json_schema()
+    assert schema["properties"]["values"] == {
+        "items": {"type": "number"},
+        "title": "Values",
+        "type": "array",
+    }
+
+
+def test_from_numpy_rejects_bad_shapes():
+    with pytest.raises(ValueError, match="1-D"):
+        VoltagesMagnitude.from_numpy(np.ones((2, 2)), ids=["a", "b"])
+    with pytest.raises(ValueError, match="length"):
+        VoltagesMagnitude.from_numpy(np.ones(3), ids=["a", "b"])
+    with pytest.raises(ValueError, match="dtype"):
+        VoltagesMagnitude(values=np.ones(2) * 1j, ids=["a", "b"])
@@ -0,0 +1,61 @@
+import base64
+import json
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from oedisi.types.data_types import AdmittanceMatrix, AdmittanceSparse, Topology, Injection
+
+EXPECTED = np.array([1 + 2j, 3 - 4j])
+
+
+def sparse(admittance_list):
+    return AdmittanceSparse(
+        from_equipment=["a", "b"], to_equipment=["a", "b"], admittance_list=admittance_list
+    )
+
+
+@pytest.mark.parametrize(
+    "admittance_list",
+    [
+        [[1.0, 2.0], [3.0, -4.0]],
+        [(1.0, 2.0), (3.0, -4.0)],
+        EXPECTED,
+        np.array([[1.0, 2.0], [3.0, -4.0]]),
+        np.array([1.0, 2.0, 3.0, -4.0]),
+        base64.b64encode(EXPECTED.astype("<c16").tobytes()).decode(),
+    ],
+)
+def test_packed_complex_inputs(admittance_list):
+    admittance = sparse(admittance_list)
+    assert isinstance(admittance.admittance_list, np.ndarray)
+    assert admittance.admittance_list.dtype == np.complex128
+    np.testing.assert_array_equal(admittance.admittance_list, EXPECTED)
+
+
+def test_packed_complex_json_backwards_compatible():
+    admittance = sparse(EXPECTED)
+    data = json.loads(admittance.model_dump_json())
+    assert data["admittance_list"] == [[1.0, 2.0], [3.0, -4.0]]
+    assert AdmittanceSparse.model_validate(data) == admittance
+
+
+def test_packed_complex_no_copy():
+    pairs = np.array([[1.0, 2.0], [3.0, -4.0]])
+    assert np.shares_memory(sparse(pairs).admittance_list, pairs)
+
+
+def test_packed_complex_matrix():
+    matrix = AdmittanceMatrix(
+        admittance_matrix=[[[1.0, 0.0], [2.0, 1.0]], [[2.0, 1.0], [4.0, 0.0]]],
+        ids=["a", "b"],
+    )
+    assert matrix.admittance_matrix.shape == (2, 2)
+    topology = Topology(admittance=matrix, injections=Injection())
+    assert Topology.model_validate_json(topology.model_dump_json()) == topology
+
+    with pytest.raises(ValueError, match="square"):
+        AdmittanceMatrix(
+            admittance_matrix=base64.b64encode(EXPECTED.tobytes()).decode(), ids=["a"]
+        )
@@ -0,0 +1,54 @@
+import json
+
+import pytest
+
+np = pytest.importorskip("numpy")
+pa = pytest.importorskip("pyarrow")
+
+import pyarrow.feather
+import pyarrow.parquet
+
+from oedisi.types.refs import is_ref, load_ref, resolve_refs
+
+
+@pytest.fixture
+def ref_directory(tmp_path):
+    np.save(tmp_path / "profile.npy", np.arange(10, dtype=float))
+    table = pa.table({"load_1": [1.0, 2.0], "load_2": [3.0, 4.0]})
+    pa.parquet.write_table(table, tmp_path / "loads.parquet")
+    pa.feather.write_feather(table, tmp_path / "loads.arrow")
+    return tmp_path
+
+
+def test_load_npy_memory_mapped(ref_directory):
+    profile = load_ref({"$ref": "profile.npy"}, ref_directory)
+    assert isinstance(profile, np.memmap)
+    assert not profile.flags.writeable
+    np.testing.assert_array_equal(profile, np.arange(10))
+
+
+@pytest.mark.parametrize("name", ["loads.parquet", "loads.arrow"])
+def test_load_table_column(ref_directory, name):
+    column = load_ref({"$ref": name, "column": "load_2"}, ref_directory)
+    np.testing.assert_array_equal(column, [3.0, 4.0])
+    table = load_ref({"$ref": name}, ref_directory)
+    assert table.column_names == ["load_1", "load_2"]
+    with pytest.raises(ValueError):
+        load_ref({"$ref": name, "column": "load_3"}, ref_directory)
+
+
+def test_resolve_refs(ref_directory):
+    parameters = json.loads(
+        '{"name": "load", "profiles": [{"$ref": "profile.npy"}],'
+        ' "peak": {"$ref": "loads.parquet", "column": "load_1"}}'
+    )
+    resolved = resolve_refs(parameters, ref_directory)
+    assert resolved["name"] == "load"
+    assert resolved["profiles"][0][3] == 3.0
+    np.testing.assert_array_equal(resolved["peak"], [1.0, 2.0])
+    assert is_ref(parameters["peak"]) and not is_ref({"$ref": 1})
+    # Other dictionaries with a $ref key are left as user data.
+    schema = {"$ref": "#/definitions/load", "title": "Load"}
+    assert not is_ref(schema) and resolve_refs(schema, ref_directory) == schema
+    with pytest.raises(ValueError):
+        load_ref({"$ref": "profile.csv"}, ref_directory)
@@ -0,0 +1,56 @@
+import pytest
+
+np = pytest.importorskip("numpy")
+sparse = pytest.importorskip("scipy.sparse")
+
+from oedisi.types.data_types import AdmittanceMatrix, AdmittanceSparse
+
+
+@pytest.fixture
+def admittance():
+    return AdmittanceSparse(
+        from_equipment=["a", "a", "b", "b", "c", "a"],
+        to_equipment=["a", "b", "a", "b", "c", "a"],
+        admittance_list=[(1.0, -2.0), (-1.0, 2.0), (-1.0, 2.0), (1.0, -2.0), (3.0, 0.0),
+                         (0.5, 0.0)],
+    )
+
+
+def test_sparse_to_scipy(admittance):
+    matrix, ids = admittance.to_scipy()
+    assert ids == ["a", "b", "c"]
+    assert sparse.issparse(matrix) and matrix.format == "csr"
+    assert matrix.dtype == np.complex128
+    expected = np.array(
+        [[1.5 - 2j, -1 + 2j, 0], [-1 + 2j, 1 - 2j, 0], [0, 0, 3]], dtype=complex
+    )
+    np.testing.assert_array_equal(matrix.toarray(), expected)
+
+    csc, reordered = admittance.to_scipy(ids=["c", "b", "a"], format="csc")
+    assert csc.format == "csc"
+    np.testing.assert_array_equal(csc.toarray(), expected[::-1, ::-1])
+
+    with pytest.raises(ValueError, match="not in ids"):
+        admittance.to_scipy(ids=["a", "b"])
+
+
+def test_sparse_round_trip(admittance):
+    matrix, ids = admittance.to_scipy()
+    restored = AdmittanceSparse.from_scipy(matrix, ids)
+    restored_matrix, restored_ids = restored.to_scipy(ids=ids)
+    assert restored_ids == ids
+    np.testing.assert_array_equal(restored_matrix.toarray(), matrix.toarray())
+
+
+def test_dense_round_trip(admittance):
+    matrix, ids = admittance.to_scipy()
+    dense = AdmittanceMatrix.from_numpy(matrix.toarray(), ids)
+    np.testing.assert_array_equal(dense.to_numpy(), matrix.toarray())
+    assert dense.admittance_matrix[0][1] == -1 + 2j
+
+    from_sparse = AdmittanceMatrix.from_scipy(matrix, ids)
+    csr, _ = from_sparse.to_scipy()
+    assert (csr != matrix).nnz == 0
+
+    with pytest.raises(ValueError, match="does not match"):
+        AdmittanceMatrix.from_numpy(np.eye(2), ids)
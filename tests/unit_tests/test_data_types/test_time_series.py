@@ -0,0 +1,107 @@
+import datetime
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from oedisi.types.data_types import (
+    PowersReal,
+    PowersRealSeries,
+    VoltagesMagnitude,
+    VoltagesMagnitudeSeries,
+)
+
+START = datetime.datetime(2024, 1, 1)
+
+
+def voltages(step, ids=("a", "b", "c")):
+    return VoltagesMagnitude(
+        values=[step + i / 10 for i in range(len(ids))],
+        ids=list(ids),
+        time=START + datetime.timedelta(minutes=15 * step),
+    )
+
+
+def test_round_trip_measurements():
+    measurements = [voltages(step) for step in range(5)]
+    series = VoltagesMagnitudeSeries.from_measurements(measurements)
+    assert series.values.shape == (5, 3)
+    assert series.ids == ["a", "b", "c"]
+    assert series.units == "V"
+    assert series.to_measurements() == measurements
+    assert isinstance(series.to_measurements()[0], VoltagesMagnitude)
+
+
+def test_append_amortized_growth():
+    series = VoltagesMagnitudeSeries(values=[], ids=["a", "b", "c"])
+    assert series.values.shape == (0, 3)
+    buffers = set()
+    for step in range(100):
+        series.append(voltages(step))
+        buffers.add(id(series._buffer))
+    assert series.values.shape == (100, 3)
+    assert len(buffers) < 10
+    np.testing.assert_array_equal(series.values[:, 0], np.arange(100))
+    assert not series.values.flags.writeable
+
+
+def test_append_checks_ids_and_time():
+    series = VoltagesMagnitudeSeries.from_measurements([voltages(0)])
+    with pytest.raises(ValueError):
+        series.append(voltages(1, ids=("a", "c", "b")))
+    with pytest.raises(ValueError):
+        series.append(VoltagesMagnitude(values=[1, 2, 3], ids=["a", "b", "c"]))
+    assert series.values.shape == (1, 3)
+
+
+def test_shape_checked():
+    with pytest.raises(ValueError):
+        VoltagesMagnitudeSeries(values=[[1.0, 2.0]], ids=["a", "b"], times=[])
+
+
+def test_window_and_select():
+    series = VoltagesMagnitudeSeries.from_measurements(
+        [voltages(step) for step in range(8)]
+    )
+    window = series.window(START + datetime.timedelta(hours=1), START + datetime.timedelta(hours=1.5))
+    assert window.times == series.times[4:6]
+    np.testing.assert_array_equal(window.values, series.values[4:6])
+
+    selected = series.select(["c", "a"])
+    assert selected.ids == ["c", "a"]
+    np.testing.assert_array_equal(selected.values, series.values[:, [2, 0]])
+    with pytest.raises(ValueError):
+        series.select(["d"])
+
+
+def test_json_round_trip():
+    series = VoltagesMagnitudeSeries.from_measurements(
+        [voltages(step) for step in range(3)]
+    )
+    assert VoltagesMagnitudeSeries.model_validate_json(series.model_dump_json()) == series
+
+
+def test_equipment_node_series():
+    measurements = [
+        PowersReal(
+            values=[step, -step],
+            ids=["113.1", "113.1"],
+            equipment_ids=["PVSystem.113", "Load.113"],
+            time=START + datetime.timedelta(minutes=step),
+        )
+        for step in range(4)
+    ]
+    series = PowersRealSeries.from_measurements(measurements)
+    assert series.to_measurements() == measurements
+    selected = series.select(["113.1"], equipment_ids=["Load.113"])
+    assert selected.equipment_ids == ["Load.113"]
+    np.testing.assert_array_equal(selected.values[:, 0], -np.arange(4))
+
+
+def test_numpy_required(monkeypatch: pytest.MonkeyPatch):
+    series = VoltagesMagnitudeSeries.from_measurements([voltages(0)])
+    monkeypatch.setattr("oedisi.types.data_types._has_numpy", False)
+    with pytest.raises(ImportError, match="numpy is required"):
+        VoltagesMagnitudeSeries.from_measurements([voltages(1)])
+    with pytest.raises(ImportError, match="numpy is required"):
+        series.append(voltages(1))
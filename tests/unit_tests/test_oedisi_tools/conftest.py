@@ -0,0 +1,92 @@
+"""Shared wiring diagram and component type factories."""
+
+from pathlib import Path
+
+import pytest
+
+from oedisi.componentframework.basic_component import (
+    ComponentDescription,
+    basic_component,
+)
+from oedisi.componentframework.system_configuration import (
+    AnnotatedType,
+    Component,
+    WiringDiagram,
+)
+
+VOLTAGES = AnnotatedType(type="VoltagesReal", port_id="voltages")
+
+
+def make_chain_diagram(n: int, **kwargs) -> WiringDiagram:
+    """Chain of mock components mock0 -> mock1 -> ... linked on port x."""
+    components = [
+        Component(
+            name=f"mock{i}",
+            type="MockComponent",
+            parameters={"inputs": ["x"] if i else [], "outputs": {"x": "double"}},
+        )
+        for i in range(n)
+    ]
+    links = [
+        {"source": f"mock{i}", "source_port": "x", "target": f"mock{i + 1}",
+         "target_port": "x"}
+        for i in range(n - 1)
+    ]
+    return WiringDiagram(name="chain", components=components, links=links, **kwargs)
+
+
+def make_sensor_diagram(n: int, parameters=None, linked: bool = True) -> WiringDiagram:
+    """Sensors sensor0, sensor1, ..., chained on their voltages ports if `linked`."""
+    return WiringDiagram(
+        name="sensors",
+        components=[
+            Component(name=f"sensor{i}", type="Sensor", parameters=dict(parameters or {}))
+            for i in range(n)
+        ],
+        links=[
+            {"source": f"sensor{i}", "source_port": "voltages",
+             "target": f"sensor{i + 1}", "target_port": "voltages"}
+            for i in range(n - 1)
+        ]
+        if linked
+        else [],
+    )
+
+
+@pytest.fixture
+def chain_diagram():
+    """Factory for chains of mock components, see `make_chain_diagram`."""
+    return make_chain_diagram
+
+
+@pytest.fixture
+def sensor_diagram():
+    """Factory for diagrams of Sensor components, see `make_sensor_diagram`."""
+    return make_sensor_diagram
+
+
+@pytest.fixture
+def component_type(tmp_path: Path):
+    """Factory for basic component types with a source directory under tmp_path.
+
+    Called with the component name and its input and output ports, VoltagesReal
+    on ``voltages`` by default, it returns the source directory holding a
+    ``run.py`` and the component type.
+    """
+
+    def make(name: str = "sensor", inputs=(VOLTAGES,), outputs=(VOLTAGES,)):
+        source = tmp_path / "src" / name
+        source.mkdir(parents=True)
+        (source / "run.py").write_text("print('hello')\n")
+        return source, basic_component(
+            ComponentDescription(
+                directory=str(source),
+                execute_function="python run.py",
+                static_inputs=[],
+                dynamic_inputs=list(inputs),
+                dynamic_outputs=list(outputs),
+            ),
+            lambda t, x: True,
+        )
+
+    return make
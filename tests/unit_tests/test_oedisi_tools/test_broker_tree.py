@@ -0,0 +1,126 @@
+"""Unit tests for hierarchical broker topologies."""
+
+import json
+from pathlib import Path
+
+import pytest
+
+from oedisi.componentframework.mock_component import MockComponent
+from oedisi.componentframework.system_configuration import (
+    BrokerTopology,
+    Component,
+    PackingPolicy,
+    WiringDiagram,
+    generate_runner_config,
+)
+from oedisi.types.helics_config import HELICSBrokerConfig, SharedFederateConfig
+
+
+def mock(name: str, inputs: list[str]) -> Component:
+    return Component(
+        name=name,
+        type="MockComponent",
+        parameters={"inputs": inputs, "outputs": {"x": "double"}},
+    )
+
+
+def two_chains(**kwargs) -> WiringDiagram:
+    """Two chains a0->a1->a2 and b0->b1->b2, with interleaved components."""
+    components = []
+    links = []
+    for i in range(3):
+        for chain in "ab":
+            components.append(mock(f"{chain}{i}", ["x"] if i else []))
+            if i:
+                links.append(
+                    {"source": f"{chain}{i - 1}", "source_port": "x",
+                     "target": f"{chain}{i}", "target_port": "x"}
+                )
+    return WiringDiagram(name="chains", components=components, links=links, **kwargs)
+
+
+def read_broker_port(build: Path, name: str) -> int:
+    with open(build / name / "helics_config.json") as f:
+        return json.load(f)["broker"]["port"]
+
+
+def test_broker_tree_follows_links(tmp_path: Path):
+    runner = generate_runner_config(
+        two_chains(shared_helics_config=SharedFederateConfig(core_type="zmq")),
+        {"MockComponent": MockComponent},
+        target_directory=str(tmp_path),
+        brokers=BrokerTopology(max_federates=3, base_port=24000),
+    )
+    federates = {federate.name: federate.exec for federate in runner.federates}
+    assert list(federates)[-3:] == ["broker0", "broker1", "broker"]
+    assert federates["broker"] == (
+        "helics_broker -f 6 -t zmq --port 23404 --minbrokers=2 --loglevel=warning"
+    )
+    assert federates["broker1"] == (
+        "helics_broker -f 3 -t zmq --port 24016 --broker_address=127.0.0.1:23404 "
+        "--loglevel=warning"
+    )
+    assert {name: read_broker_port(tmp_path, name) for name in ["a0", "a1", "a2"]} == {
+        "a0": 24000, "a1": 24000, "a2": 24000
+    }
+    assert read_broker_port(tmp_path, "b2") == 24016
+
+
+def test_broker_tree_keeps_root_settings(tmp_path: Path):
+    shared = SharedFederateConfig(
+        core_type="zmq", broker=HELICSBrokerConfig(port=23700, key="secret")
+    )
+    runner = generate_runner_config(
+        two_chains(shared_helics_config=shared),
+        {"MockComponent": MockComponent},
+        target_directory=str(tmp_path),
+        brokers=BrokerTopology(max_federates=6),
+    )
+    broker0, broker = runner.federates[-2:]
+    assert "--port 23700 --brokerkey secret --minbrokers=1" in broker.exec
+    assert "--broker_address=127.0.0.1:23700 --brokerkey secret" in broker0.exec
+    with open(tmp_path / "b1" / "helics_config.json") as f:
+        assert json.load(f)["broker"] == {"port": 24000, "key": "secret"}
+
+
+def test_broker_tree_keeps_packed_hosts_together(tmp_path: Path):
+    runner = generate_runner_config(
+        two_chains(),
+        {"MockComponent": MockComponent},
+        target_directory=str(tmp_path),
+        packing={"MockComponent": PackingPolicy(max_federates=4)},
+        brokers=BrokerTopology(max_federates=3),
+    )
+    assert [federate.name for federate in runner.federates] == [
+        "MockComponent_host0",
+        "MockComponent_host1",
+        "broker0",
+        "broker1",
+        "broker",
+    ]
+    assert "-f 4 " in runner.federates[2].exec
+    ports = {read_broker_port(tmp_path, f"{c}{i}") for c in "ab" for i in range(2)}
+    assert ports == {24000}
+
+
+def test_broker_tree_validation(tmp_path: Path):
+    with pytest.raises(ValueError, match="network core type"):
+        generate_runner_config(
+            two_chains(shared_helics_config=SharedFederateConfig(core_type="inproc")),
+            {"MockComponent": MockComponent},
+            target_directory=str(tmp_path),
+            brokers=BrokerTopology(),
+        )
+
+    class NoBrokerConfig(MockComponent):
+        _capabilities = MockComponent._capabilities.model_copy(
+            update={"broker_config": False}
+        )
+
+    with pytest.raises(ValueError, match="sub-broker"):
+        generate_runner_config(
+            two_chains(),
+            {"MockComponent": NoBrokerConfig},
+            target_directory=str(tmp_path),
+            brokers=BrokerTopology(),
+        )
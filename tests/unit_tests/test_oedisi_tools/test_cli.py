@@ -19,6 +19,32 @@ def test_build_run(base_path: Path, monkeypatch: pytest.MonkeyPatch):
     assert result.exit_code == 0
     result = runner.invoke(cli, ["run"])
     assert result.exit_code == 0
+    assert not Path("build/helics_profile.txt").exists()
+
+    result = runner.invoke(cli, ["run", "--summary"])
+    assert result.exit_code == 0
+    with open("build/run_summary.json") as f:
+        summary = json.load(f)
+    assert summary["final_granted_time"] == 100
+    assert {federate["name"] for federate in summary["federates"]} == {
+        "comp_abc",
+        "comp_xyz",
+        "broker",
+    }
+    # The profile grows with the run and is removed once summarized.
+    assert not Path("build/helics_profile.txt").exists()
+    assert not Path("build/system_runner_profiled.json").exists()
+
+
+def test_build_run_native(base_path: Path, monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.chdir(base_path)
+
+    runner = CliRunner()
+    result = runner.invoke(cli, ["build"])
+    assert result.exit_code == 0
+    result = runner.invoke(cli, ["run", "--native", "--timeout", "120"])
+    assert result.exit_code == 0, result.output
+    assert "Federation" in result.output and " ok " in result.output
 
 
 def test_debug(base_path: Path, monkeypatch: pytest.MonkeyPatch):
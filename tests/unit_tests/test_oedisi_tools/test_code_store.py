@@ -0,0 +1,73 @@
+"""Unit tests for the content-addressed component code store."""
+
+import json
+import os
+from pathlib import Path
+
+import pytest
+
+from oedisi.componentframework import code_store
+from oedisi.componentframework.system_configuration import generate_runner_config
+
+
+@pytest.fixture
+def sensor(component_type):
+    source, sensor = component_type(inputs=[], outputs=[])
+    (source / "model").mkdir()
+    (source / "model" / "weights.bin").write_bytes(b"\x00" * 1024)
+    (source / "static_inputs.json").write_text("{}")
+    (source / ".git").mkdir()
+    return sensor
+
+
+def test_code_store_build(tmp_path: Path, sensor, sensor_diagram):
+    diagram = sensor_diagram(5, linked=False)
+    for i, component in enumerate(diagram.components):
+        component.parameters = {"index": i}
+    build = tmp_path / "build"
+    generate_runner_config(
+        diagram, {"Sensor": sensor}, target_directory=str(build), code_store=True
+    )
+    store = build / code_store.CODE_STORE_DIRNAME
+    assert os.listdir(store) == [sensor.source_hash()]
+    stored = store / sensor.source_hash()
+    assert not (stored / ".git").exists()
+
+    for i in range(5):
+        directory = build / f"sensor{i}"
+        assert (directory / "run.py").read_text() == "print('hello')\n"
+        assert (directory / "model" / "weights.bin").stat().st_size == 1024
+        with open(directory / "static_inputs.json") as f:
+            assert json.load(f)["index"] == i
+    # The build never writes through links into the store.
+    assert (stored / "static_inputs.json").read_text() == "{}"
+
+    # A plain copy over a linked build replaces links instead of writing into them.
+    generate_runner_config(diagram, {"Sensor": sensor}, target_directory=str(build))
+    (build / "sensor0" / "run.py").write_text("changed")
+    assert (stored / "run.py").read_text() == "print('hello')\n"
+
+
+def test_link_modes_fall_back(tmp_path: Path, monkeypatch):
+    store = tmp_path / "store"
+    store.mkdir()
+    (store / "a.txt").write_text("a")
+    monkeypatch.setattr(code_store, "_link_modes", {})
+
+    def fail(source, destination):
+        raise OSError("not supported")
+
+    monkeypatch.setitem(code_store._LINKERS, code_store.REFLINK, fail)
+    monkeypatch.setitem(code_store._LINKERS, code_store.HARDLINK, fail)
+    code_store.link_tree(str(store), str(tmp_path / "instance"))
+    assert os.path.islink(tmp_path / "instance" / "a.txt")
+    assert (tmp_path / "instance" / "a.txt").read_text() == "a"
+    assert list(code_store._link_modes.values()) == [code_store.SYMLINK]
+
+
+def test_prune_store(tmp_path: Path):
+    store = tmp_path / code_store.CODE_STORE_DIRNAME
+    (store / "old").mkdir(parents=True)
+    (store / "new").mkdir()
+    code_store.prune_store(str(tmp_path), {"new"})
+    assert os.listdir(store) == ["new"]
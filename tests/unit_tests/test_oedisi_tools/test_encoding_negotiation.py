@@ -0,0 +1,86 @@
+"""Unit tests for build-time wire encoding negotiation."""
+
+import json
+from pathlib import Path
+
+import pytest
+
+from oedisi.componentframework.mock_component import MockComponent
+from oedisi.componentframework.system_configuration import (
+    AnnotatedType,
+    Component,
+    WiringDiagram,
+    generate_runner_config,
+    negotiate_encoding,
+)
+from oedisi.types.common import Encoding
+
+
+def test_negotiate_encoding_prefers_fastest_shared():
+    binary = AnnotatedType(type="VoltagesReal", encodings=["json", "msgpack", "binary"])
+    msgpack = AnnotatedType(type="VoltagesReal", encodings=["msgpack", "json"])
+    json_only = AnnotatedType(type="VoltagesReal")
+
+    assert negotiate_encoding(binary, [binary]) == Encoding.BINARY
+    # MessagePack is declared on both ends but not implemented.
+    assert negotiate_encoding(binary, [binary, msgpack]) == Encoding.JSON
+    assert negotiate_encoding(binary, [binary, json_only]) == Encoding.JSON
+
+    with pytest.raises(ValueError, match="No common encoding"):
+        negotiate_encoding(AnnotatedType(type="", encodings=["arrow"]), [json_only])
+    arrow_only = AnnotatedType(type="", encodings=["arrow"])
+    with pytest.raises(ValueError, match="No common encoding"):
+        negotiate_encoding(arrow_only, [arrow_only])
+
+
+def test_encodings_written_to_static_inputs(tmp_path: Path, component_type):
+    fast = ["binary", "json"]
+    _, publisher = component_type(
+        "publisher",
+        inputs=[],
+        outputs=[AnnotatedType(type="VoltagesReal", port_id="voltages", encodings=fast)],
+    )
+    _, subscriber = component_type(
+        "subscriber",
+        inputs=[AnnotatedType(type="VoltagesReal", port_id="voltages", encodings=fast)],
+        outputs=[],
+    )
+    diagram = WiringDiagram(
+        name="test",
+        components=[
+            Component(name="pub", type="Publisher", parameters={}),
+            Component(name="fast_sub", type="Subscriber", parameters={}),
+            Component(
+                name="old_sub",
+                type="MockComponent",
+                parameters={"inputs": [], "outputs": {"voltages": "string"}},
+            ),
+            Component(name="mixed_sub", type="Subscriber", parameters={}),
+        ],
+        links=[
+            {"source": "pub", "source_port": "voltages",
+             "target": "fast_sub", "target_port": "voltages"},
+            {"source": "old_sub", "source_port": "voltages",
+             "target": "mixed_sub", "target_port": "voltages"},
+        ],
+    )
+    build = tmp_path / "build"
+    generate_runner_config(
+        diagram,
+        {"Publisher": publisher, "Subscriber": subscriber, "MockComponent": MockComponent},
+        target_directory=str(build),
+    )
+
+    def static_inputs(name):
+        with open(build / name / "static_inputs.json") as f:
+            return json.load(f)
+
+    assert static_inputs("pub")["encodings"] == {
+        "inputs": {},
+        "outputs": {"voltages": "binary"},
+    }
+    assert static_inputs("fast_sub")["encodings"]["inputs"] == {"voltages": "binary"}
+    assert static_inputs("mixed_sub")["encodings"]["inputs"] == {"voltages": "json"}
+
+    with open(build / "fast_sub" / "input_mapping.json") as f:
+        assert json.load(f) == {"voltages": "pub/voltages"}
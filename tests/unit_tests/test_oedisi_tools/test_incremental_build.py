@@ -0,0 +1,86 @@
+"""Unit tests for incremental builds with build_manifest.json."""
+
+import json
+from pathlib import Path
+
+from oedisi.componentframework.system_configuration import (
+    BuildManifest,
+    generate_runner_config,
+)
+
+
+def test_incremental_build(tmp_path: Path, component_type, sensor_diagram):
+    source, sensor = component_type()
+    types = {"Sensor": sensor}
+    build = tmp_path / "build"
+
+    generate_runner_config(sensor_diagram(3), types, target_directory=str(build))
+    manifest = BuildManifest.load(build)
+    assert manifest.rebuilt == ["sensor0", "sensor1", "sensor2"]
+    assert manifest.components["sensor0"].source_hash == sensor.source_hash()
+
+    # Marker files show whether the code was copied again.
+    for i in range(3):
+        (build / f"sensor{i}" / "marker").write_text("")
+
+    changed = sensor_diagram(3)
+    changed.components[1].parameters = {"gain": 2}
+    generate_runner_config(changed, types, target_directory=str(build), incremental=True)
+    manifest = BuildManifest.load(build)
+    assert manifest.rebuilt == ["sensor1"]
+    assert manifest.reused == ["sensor0", "sensor2"]
+    assert (build / "sensor0" / "marker").exists()
+    assert not (build / "sensor1" / "marker").exists()
+    with open(build / "sensor1" / "static_inputs.json") as f:
+        assert json.load(f)["gain"] == 2
+
+    generate_runner_config(
+        sensor_diagram(2), types, target_directory=str(build), incremental=True
+    )
+    manifest = BuildManifest.load(build)
+    assert manifest.removed == ["sensor2"]
+    assert manifest.rebuilt == ["sensor1"]
+    assert not (build / "sensor2").exists()
+
+    (source / "run.py").write_text("print('changed')\n")
+    generate_runner_config(
+        sensor_diagram(2), types, target_directory=str(build), incremental=True
+    )
+    manifest = BuildManifest.load(build)
+    assert manifest.rebuilt == ["sensor0", "sensor1"]
+    assert (build / "sensor0" / "run.py").read_text() == "print('changed')\n"
+
+
+def test_full_build_ignores_manifest(tmp_path: Path, component_type, sensor_diagram):
+    _, sensor = component_type()
+    build = tmp_path / "build"
+    for _ in range(2):
+        generate_runner_config(
+            sensor_diagram(2), {"Sensor": sensor}, target_directory=str(build)
+        )
+    manifest = BuildManifest.load(build)
+    assert manifest.rebuilt == ["sensor0", "sensor1"]
+    assert manifest.reused == []
+    # Full builds still record the source hashes for the run history.
+    assert manifest.components["sensor0"].source_hash == sensor.source_hash()
+
+
+def test_manifest_diagram_hash(tmp_path: Path, component_type, sensor_diagram):
+    source, sensor = component_type()
+    types = {"Sensor": sensor}
+    build = tmp_path / "build"
+
+    generate_runner_config(sensor_diagram(3), types, target_directory=str(build))
+    first = BuildManifest.load(build)
+
+    # Source changes keep the diagram hash, configuration changes do not.
+    (source / "run.py").write_text("print('changed')\n")
+    generate_runner_config(sensor_diagram(3), types, target_directory=str(build))
+    second = BuildManifest.load(build)
+    assert second.diagram_hash == first.diagram_hash
+    assert second.components["sensor0"].source_hash != first.components[
+        "sensor0"
+    ].source_hash
+
+    generate_runner_config(sensor_diagram(3, {"x": 1}), types, target_directory=str(build))
+    assert BuildManifest.load(build).diagram_hash != first.diagram_hash
@@ -0,0 +1,171 @@
+"""Unit tests for packing several federates into one host process."""
+
+import json
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+from oedisi.componentframework.federate_host import (
+    HOST_CONFIG,
+    FederateHostConfig,
+    load_entry_point,
+)
+from oedisi.componentframework.mock_component import MockComponent, run_federate
+from oedisi.componentframework.system_configuration import (
+    ComponentType,
+    PackingPolicy,
+    generate_runner_config,
+)
+from oedisi.types.helics_config import SharedFederateConfig
+
+
+def test_packing_groups_components(tmp_path: Path, chain_diagram):
+    runner = generate_runner_config(
+        chain_diagram(5),
+        {"MockComponent": MockComponent},
+        target_directory=str(tmp_path),
+        packing={"MockComponent": PackingPolicy(max_federates=2)},
+    )
+    names = [federate.name for federate in runner.federates]
+    assert names == [
+        "MockComponent_host0",
+        "MockComponent_host1",
+        "MockComponent_host2",
+        "broker",
+    ]
+    # The broker waits for every HELICS federate, not every process.
+    assert runner.federates[-1].exec.startswith("helics_broker -f 5")
+    assert runner.federates[0].exec == "python -m oedisi.componentframework.federate_host"
+
+    with open(tmp_path / "MockComponent_host1" / HOST_CONFIG) as f:
+        config = FederateHostConfig.model_validate(json.load(f))
+    assert [member.name for member in config.members] == ["mock2", "mock3"]
+    assert config.members[0].directory == str(Path("..") / "mock2")
+    assert config.members[0].entry_point == MockComponent._entry_point
+
+    with open(tmp_path / "mock3" / "helics_config.json") as f:
+        helics_config = json.load(f)
+    assert helics_config["coreName"] == "MockComponent_host1_core"
+    assert helics_config["coreInitString"] == "--federates=2"
+
+
+def test_packing_leaves_other_types_alone(tmp_path: Path, chain_diagram):
+    class OtherMock(MockComponent):
+        pass
+
+    diagram = chain_diagram(4)
+    diagram.components[0].type = "OtherMock"
+    runner = generate_runner_config(
+        diagram,
+        {"MockComponent": MockComponent, "OtherMock": OtherMock},
+        target_directory=str(tmp_path),
+        packing={"MockComponent": PackingPolicy(group="mocks")},
+    )
+    assert [federate.name for federate in runner.federates] == [
+        "mock0",
+        "mocks_host0",
+        "broker",
+    ]
+    with open(tmp_path / "mock0" / "helics_config.json") as f:
+        assert "coreName" not in json.load(f)
+
+
+def test_packing_validation(tmp_path: Path, chain_diagram):
+    class NoEntryPoint(MockComponent):
+        _entry_point = None
+
+    with pytest.raises(ValueError, match="entry point"):
+        generate_runner_config(
+            chain_diagram(2),
+            {"MockComponent": NoEntryPoint},
+            target_directory=str(tmp_path),
+            packing={"MockComponent": PackingPolicy()},
+        )
+
+    diagram = chain_diagram(2)
+    diagram.components[1].name = "MockComponent_host0"
+    diagram.links[0].target = "MockComponent_host0"
+    with pytest.raises(ValueError, match="clashes"):
+        generate_runner_config(
+            diagram,
+            {"MockComponent": MockComponent},
+            target_directory=str(tmp_path),
+            packing={"MockComponent": PackingPolicy()},
+        )
+
+    assert ComponentType._entry_point is None
+    with pytest.raises(ValueError):
+        PackingPolicy(max_federates=0)
+
+
+def test_packed_federates_run(tmp_path: Path, chain_diagram):
+    diagram = chain_diagram(
+        3, shared_helics_config=SharedFederateConfig(core_type="zmq")
+    )
+    runner = generate_runner_config(
+        diagram,
+        {"MockComponent": MockComponent},
+        target_directory=str(tmp_path),
+        packing={"MockComponent": PackingPolicy()},
+    )
+    broker = runner.federates[-1]
+    with subprocess.Popen(broker.exec.split(), cwd=tmp_path / broker.directory) as p:
+        host = subprocess.run(
+            [sys.executable, "-m", "oedisi.componentframework.federate_host"],
+            cwd=tmp_path / "MockComponent_host0",
+            capture_output=True,
+            text=True,
+            timeout=60,
+        )
+        assert p.wait(timeout=30) == 0
+    assert host.returncode == 0, host.stderr
+    assert "mock2" in host.stderr
+
+
+def test_load_entry_point_by_file(tmp_path: Path):
+    for name in ["a", "b"]:
+        (tmp_path / name).mkdir()
+        (tmp_path / name / "server.py").write_text(
+            f"def run_federate(directory):\n    return {name!r}\n"
+        )
+    # Both members ship a server.py, each runs its own.
+    run_a = load_entry_point("server:run_federate", str(tmp_path / "a"))
+    run_b = load_entry_point("server:run_federate", str(tmp_path / "b"))
+    assert (run_a(""), run_b("")) == ("a", "b")
+    assert load_entry_point(MockComponent._entry_point, str(tmp_path)) is run_federate
+
+
+def test_failing_member_aborts_host(tmp_path: Path, chain_diagram):
+    diagram = chain_diagram(
+        3, shared_helics_config=SharedFederateConfig(core_type="zmq")
+    )
+    runner = generate_runner_config(
+        diagram,
+        {"MockComponent": MockComponent},
+        target_directory=str(tmp_path),
+        packing={"MockComponent": PackingPolicy()},
+    )
+    host_directory = tmp_path / "MockComponent_host0"
+    config_path = host_directory / HOST_CONFIG
+    config = FederateHostConfig.model_validate_json(config_path.read_text())
+    (tmp_path / "mock1" / "broken.py").write_text(
+        "def run_federate(directory):\n    raise RuntimeError('broken')\n"
+    )
+    config.members[1].entry_point = "broken:run_federate"
+    config_path.write_text(config.model_dump_json())
+
+    broker = runner.federates[-1]
+    with subprocess.Popen(broker.exec.split(), cwd=tmp_path / broker.directory) as p:
+        # The other members would otherwise wait for mock1 forever.
+        host = subprocess.run(
+            [sys.executable, "-m", "oedisi.componentframework.federate_host"],
+            cwd=host_directory,
+            capture_output=True,
+            text=True,
+            timeout=60,
+        )
+        p.wait(timeout=30)
+    assert host.returncode == 1
+    assert "Federate mock1 failed" in host.stderr
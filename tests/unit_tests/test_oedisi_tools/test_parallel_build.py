@@ -0,0 +1,56 @@
+"""Unit tests for concurrent component initialization."""
+
+import json
+from pathlib import Path
+
+import pytest
+
+from oedisi.componentframework.mock_component import MockComponent
+from oedisi.componentframework.system_configuration import (
+    ComponentInitializationError,
+    generate_runner_config,
+)
+
+
+def read_build(build: Path) -> dict:
+    return {
+        str(path.relative_to(build)): path.read_text()
+        for path in sorted(build.rglob("*.json"))
+    }
+
+
+def test_concurrent_build_matches_serial(tmp_path: Path, chain_diagram):
+    diagram = chain_diagram(20)
+    types = {"MockComponent": MockComponent}
+    serial = generate_runner_config(diagram, types, target_directory=str(tmp_path / "a"))
+    concurrent = generate_runner_config(
+        diagram, types, target_directory=str(tmp_path / "b"), max_workers=4
+    )
+    assert serial == concurrent
+    assert [f.name for f in concurrent.federates] == [
+        f"mock{i}" for i in range(20)
+    ] + ["broker"]
+    assert read_build(tmp_path / "a") == read_build(tmp_path / "b")
+    with open(tmp_path / "b" / "mock3" / "input_mapping.json") as f:
+        assert json.load(f) == {"x": "mock2/x"}
+
+
+def test_concurrent_build_reports_all_errors(tmp_path: Path, chain_diagram):
+    diagram = chain_diagram(5)
+    diagram.components[1].parameters = {}
+    diagram.components[3].parameters = {"outputs": {}}
+
+    with pytest.raises(ComponentInitializationError) as excinfo:
+        generate_runner_config(
+            diagram,
+            {"MockComponent": MockComponent},
+            target_directory=str(tmp_path),
+            max_workers=2,
+        )
+    assert list(excinfo.value.errors) == ["mock1", "mock3"]
+    assert "2 component(s) failed" in str(excinfo.value)
+
+    with pytest.raises(KeyError):
+        generate_runner_config(
+            diagram, {"MockComponent": MockComponent}, target_directory=str(tmp_path)
+        )
@@ -0,0 +1,86 @@
+"""Unit tests for external parameter references in builds."""
+
+import json
+import os
+from pathlib import Path
+
+import pytest
+
+from oedisi.componentframework.basic_component import (
+    ComponentDescription,
+    basic_component,
+)
+from oedisi.componentframework.parameter_refs import link_parameter_refs
+from oedisi.componentframework.system_configuration import (
+    Component,
+    WiringDiagram,
+    generate_runner_config,
+)
+
+
+def test_link_parameter_refs(tmp_path: Path):
+    data = tmp_path / "data"
+    (data / "profiles").mkdir(parents=True)
+    (data / "profiles" / "load.npy").write_bytes(b"profile")
+    (tmp_path / "outside.npy").write_bytes(b"outside")
+    directory = tmp_path / "build" / "load"
+    directory.mkdir(parents=True)
+
+    parameters = {
+        "profile": {"$ref": "profiles/load.npy"},
+        "nested": [{"$ref": "../outside.npy", "column": None}],
+        "scale": 2,
+    }
+    linked = link_parameter_refs(parameters, str(directory), str(data))
+    assert linked["profile"] == {"$ref": "refs/profiles/load.npy"}
+    assert linked["scale"] == 2
+    outside = linked["nested"][0]["$ref"]
+    assert outside.startswith("refs/") and outside.endswith("-outside.npy")
+    assert (directory / "refs" / "profiles" / "load.npy").read_bytes() == b"profile"
+    assert (directory / outside).read_bytes() == b"outside"
+    assert parameters["profile"] == {"$ref": "profiles/load.npy"}
+
+    with pytest.raises(ValueError, match="does not exist"):
+        link_parameter_refs({"$ref": "missing.npy"}, str(directory), str(data))
+
+
+def test_build_links_refs(tmp_path: Path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    source = tmp_path / "src" / "load"
+    source.mkdir(parents=True)
+    # References are relative to the wiring diagram, not the working directory.
+    scenario = tmp_path / "scenario"
+    (scenario / "profiles").mkdir(parents=True)
+    (scenario / "profiles" / "load.npy").write_bytes(b"\x93NUMPY")
+    schema = {"$ref": "#/definitions/load", "title": "Load"}
+    load = basic_component(
+        ComponentDescription(
+            directory=str(source),
+            execute_function="python run.py",
+            static_inputs=[],
+            dynamic_inputs=[],
+            dynamic_outputs=[],
+        ),
+        lambda t, x: True,
+    )
+    diagram = WiringDiagram(
+        name="refs",
+        components=[
+            Component(
+                name=f"load{i}",
+                type="Load",
+                parameters={"profile": {"$ref": "profiles/load.npy"}, "schema": schema},
+            )
+            for i in range(2)
+        ],
+        links=[],
+    )
+    generate_runner_config(
+        diagram, {"Load": load}, target_directory="build", base_directory=str(scenario)
+    )
+    for i in range(2):
+        with open(f"build/load{i}/static_inputs.json") as f:
+            static_inputs = json.load(f)
+        assert static_inputs["profile"] == {"$ref": "refs/profiles/load.npy"}
+        assert static_inputs["schema"] == schema
+        assert os.path.isfile(f"build/load{i}/refs/profiles/load.npy")
@@ -0,0 +1,179 @@
+"""Unit tests for partitioning a federation across hosts."""
+
+import json
+import subprocess
+from pathlib import Path
+
+import pytest
+
+from oedisi.componentframework.mock_component import MockComponent
+from oedisi.componentframework.partition import (
+    HostSpec,
+    PartitionConfig,
+    cut_weight,
+    generate_partitioned_runner_configs,
+    partition_wiring_diagram,
+)
+from oedisi.componentframework.system_configuration import Component, WiringDiagram
+from oedisi.types.helics_config import SharedFederateConfig
+
+pytest.importorskip("networkx")
+
+
+def diagram(links: list[tuple[str, str]], names: list[str], **kwargs) -> WiringDiagram:
+    """Mock components where each target subscribes to its sources."""
+    inputs = {name: [] for name in names}
+    for source, target in links:
+        inputs[target].append(source)
+    components = [
+        Component(
+            name=name,
+            type="MockComponent",
+            parameters={"inputs": inputs[name], "outputs": {"x": "double"}},
+        )
+        for name in names
+    ]
+    return WiringDiagram(
+        name="partition",
+        components=components,
+        links=[
+            {"source": source, "source_port": "x", "target": target,
+             "target_port": source}
+            for source, target in links
+        ],
+        **kwargs,
+    )
+
+
+def two_hosts(**kwargs) -> PartitionConfig:
+    return PartitionConfig(
+        hosts=[HostSpec(name="host0"), HostSpec(name="host1")], **kwargs
+    )
+
+
+def test_partition_keeps_connected_components_together():
+    # Two interleaved chains a0->a1->a2->a3 and b0->b1->b2->b3.
+    names = [f"{chain}{i}" for i in range(4) for chain in "ab"]
+    links = [(f"{c}{i}", f"{c}{i + 1}") for c in "ab" for i in range(3)]
+    wiring_diagram = diagram(links, names)
+
+    assignment = partition_wiring_diagram(wiring_diagram, two_hosts())
+    assert assignment == {
+        "host0": ["a0", "a1", "a2", "a3"],
+        "host1": ["b0", "b1", "b2", "b3"],
+    }
+    assert cut_weight(wiring_diagram, assignment) == 0
+
+
+def test_partition_cuts_light_links():
+    # A ring where the heavy links pair up (a, b), (c, d) and (e, f).
+    names = ["a", "b", "c", "d", "e", "f"]
+    links = [("a", "b"), ("b", "c"), ("c", "d"), ("d", "e"), ("e", "f"), ("f", "a")]
+    weights = {"a/x": 100, "c/x": 100, "e/x": 100}
+    wiring_diagram = diagram(links, names)
+
+    config = PartitionConfig(
+        hosts=[HostSpec(name=f"host{i}") for i in range(3)],
+        link_weights=weights,
+        imbalance=0,
+    )
+    assignment = partition_wiring_diagram(wiring_diagram, config)
+    assert sorted(map(sorted, assignment.values())) == [["a", "b"], ["c", "d"], ["e", "f"]]
+    assert cut_weight(wiring_diagram, assignment, weights) == 3
+
+
+def test_partition_balances_cpu():
+    names = [f"c{i}" for i in range(8)]
+    links = [(f"c{i}", f"c{i + 1}") for i in range(7)]
+    config = PartitionConfig(
+        hosts=[HostSpec(name="big", cpus=3), HostSpec(name="small", cpus=1)],
+        cpu_weights={"MockComponent": 2.0, "c0": 6.0},
+        imbalance=0,
+    )
+    assignment = partition_wiring_diagram(diagram(links, names), config)
+    # Total load 20: the big host's share is 15, it takes c0 to c4 (14).
+    assert assignment == {"big": names[:5], "small": names[5:]}
+
+
+def test_partitioned_runner_configs(tmp_path: Path):
+    names = ["a0", "b0", "a1", "b1"]
+    wiring_diagram = diagram(
+        [("a0", "a1"), ("b0", "b1"), ("a1", "b1")],
+        names,
+        shared_helics_config=SharedFederateConfig(core_type="zmq"),
+    )
+    runner_configs = generate_partitioned_runner_configs(
+        wiring_diagram,
+        {"MockComponent": MockComponent},
+        two_hosts(),
+        target_directory=str(tmp_path),
+    )
+    assert list(runner_configs) == ["host0", "host1"]
+    host0 = {federate.name: federate.exec for federate in runner_configs["host0"].federates}
+    host1 = {federate.name: federate.exec for federate in runner_configs["host1"].federates}
+    assert list(host0) == ["a0", "a1", "broker0", "broker"]
+    assert list(host1) == ["b0", "b1", "broker1"]
+    assert "--minbrokers=2" in host0["broker"]
+    assert "--ipv4" not in host0["broker"]
+    assert "--broker_address=localhost:23404" in host1["broker1"]
+    with open(tmp_path / "b1" / "helics_config.json") as f:
+        assert json.load(f)["broker"] == {"port": 24014}
+
+
+def test_partitioned_runner_configs_on_several_machines(tmp_path: Path):
+    config = PartitionConfig(
+        hosts=[
+            HostSpec(name="host0", hostname="10.0.0.1"),
+            HostSpec(name="host1", hostname="10.0.0.2"),
+        ],
+        assignment={"host0": ["a"], "host1": ["b"]},
+    )
+    runner_configs = generate_partitioned_runner_configs(
+        diagram([("a", "b")], ["a", "b"]),
+        {"MockComponent": MockComponent},
+        config,
+        target_directory=str(tmp_path),
+    )
+    host1 = runner_configs["host1"].federates
+    assert [federate.hostname for federate in host1] == ["10.0.0.2", "10.0.0.2"]
+    assert "--broker_address=10.0.0.1:23404 --ipv4" in host1[1].exec
+
+    config.assignment = {"host0": ["a"], "host1": []}
+    with pytest.raises(ValueError, match="missing"):
+        generate_partitioned_runner_configs(
+            diagram([("a", "b")], ["a", "b"]),
+            {"MockComponent": MockComponent},
+            config,
+            target_directory=str(tmp_path),
+        )
+
+
+def test_partitioned_runner_configs_run_on_one_machine(tmp_path: Path):
+    names = ["a0", "b0", "a1", "b1"]
+    wiring_diagram = diagram(
+        [("a0", "a1"), ("b0", "b1"), ("a1", "b1")],
+        names,
+        shared_helics_config=SharedFederateConfig(core_type="zmq"),
+    )
+    runner_configs = generate_partitioned_runner_configs(
+        wiring_diagram,
+        {"MockComponent": MockComponent},
+        two_hosts(),
+        target_directory=str(tmp_path),
+        base_port=25000,
+    )
+    runs = []
+    for host, runner_config in runner_configs.items():
+        path = tmp_path / f"system_runner_{host}.json"
+        path.write_text(runner_config.model_dump_json())
+        runs.append(
+            subprocess.Popen(
+                ["helics", "run", f"--path={path}"],
+                cwd=tmp_path,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+            )
+        )
+    assert [run.wait(timeout=120) for run in runs] == [0, 0]
+    # b1 received a1 across the two runner configs.
+    assert "From subscription a1" in (tmp_path / "b1.log").read_text()
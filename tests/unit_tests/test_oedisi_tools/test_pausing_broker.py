@@ -0,0 +1,149 @@
+"""Unit tests for the scripted pausing broker."""
+
+import subprocess
+from pathlib import Path
+
+import pytest
+from click.testing import CliRunner
+
+from oedisi.componentframework.mock_component import MockComponent
+from oedisi.componentframework.system_configuration import (
+    BrokerTopology,
+    PackingPolicy,
+    generate_runner_config,
+)
+from oedisi.tools import cli
+from oedisi.tools.cli_tools import remove_from_json
+from oedisi.tools.pausing_broker import PausingBroker, arrived
+from oedisi.tools.profiler import TimeSample
+from oedisi.types.helics_config import SharedFederateConfig
+
+
+def sample(name: str, granted: float, requested: float, computing=False) -> TimeSample:
+    return TimeSample(
+        wall_time=0.0,
+        name=name,
+        granted_time=granted,
+        requested_time=requested,
+        computing=computing,
+    )
+
+
+def test_arrived():
+    assert arrived([sample("a", 9, 10), sample("b", 5, 20)], 10)
+    assert not arrived([sample("a", 9, 10), sample("b", 9, 9.5)], 10)
+    assert not arrived([sample("a", 9, 10), sample("b", 9, 10, computing=True)], 10)
+    assert not arrived([], 10)
+
+
+@pytest.fixture
+def build(monkeypatch: pytest.MonkeyPatch) -> Path:
+    monkeypatch.chdir(Path(__file__).parent)
+    result = CliRunner().invoke(cli, ["build"])
+    assert result.exit_code == 0
+    return Path("build")
+
+
+def run_paused(build: Path, **kwargs) -> tuple[list[float], list]:
+    new_system, new_path, _ = remove_from_json(str(build / "system_runner.json"), "broker")
+    federation = subprocess.Popen(
+        ["helics", "run", f"--path={new_path}"],
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+    calls = []
+
+    def hook(broker, barrier, time_data):
+        calls.append((barrier, {s.name: s.granted_time for s in time_data}))
+
+    broker = PausingBroker(len(new_system.federates), hooks=[hook], **kwargs)
+    try:
+        reached = broker.run()
+    finally:
+        # The barrier is cleared on errors, so the federation still finishes.
+        broker.wait_for(lambda data: False)
+        assert federation.wait(timeout=60) == 0
+    return reached, calls
+
+
+def test_scripted_breakpoints(build: Path):
+    reached, calls = run_paused(build, breakpoints=[10.0, 50.0])
+
+    assert reached == [10.0, 50.0]
+    assert [barrier for barrier, _ in calls] == [10.0, 50.0]
+    # Federates are held back just before each barrier.
+    for barrier, granted in calls:
+        assert set(granted) == {"comp_abc", "comp_xyz"}
+        assert all(barrier - 1 <= t < barrier for t in granted.values())
+
+
+def test_breakpoint_schedule_function(build: Path):
+    def every_30(barrier, time_data):
+        assert (barrier is None) == (time_data == [])
+        barrier = (barrier or 0.0) + 30
+        return barrier if barrier < 100 else None
+
+    reached, _ = run_paused(build, breakpoints=every_30)
+    assert reached == [30.0, 60.0, 90.0]
+
+    with pytest.raises(ValueError, match="does not come after"):
+        run_paused(build, breakpoints=lambda barrier, time_data: 10.0)
+
+
+def test_run_with_pause_breakpoints_cli(build: Path):
+    result = CliRunner().invoke(cli, ["run-with-pause", "-b", "20", "-b", "500"])
+    assert result.exit_code == 0, result.output
+    # The federation ends at 100, before the second breakpoint.
+    assert "Paused at 1 of 2 breakpoints" in result.output
+
+
+def test_run_with_pause_failing_hook(build: Path, monkeypatch: pytest.MonkeyPatch):
+    from oedisi.tools import cli_tools
+
+    def failing_hook(broker, barrier, time_data):
+        raise RuntimeError("snapshot failed")
+
+    waited = []
+    start_federation = cli_tools._start_federation
+
+    def recording_start(runner_path, native):
+        wait = start_federation(runner_path, native)
+
+        def recording_wait():
+            waited.append(runner_path)
+            return wait()
+
+        return recording_wait
+
+    monkeypatch.setattr(cli_tools, "load_entry_point", lambda hook, directory: failing_hook)
+    monkeypatch.setattr(cli_tools, "_start_federation", recording_start)
+    result = CliRunner().invoke(cli, ["run-with-pause", "-b", "20", "--hook", "hooks:fail"])
+    assert isinstance(result.exception, RuntimeError)
+    # The federation still runs to completion before the error is raised.
+    assert len(waited) == 1
+
+
+@pytest.mark.parametrize(
+    "layout",
+    [
+        {"packing": {"MockComponent": PackingPolicy(max_federates=2)}},
+        {"brokers": BrokerTopology(max_federates=2)},
+    ],
+    ids=["packed", "broker-tree"],
+)
+def test_run_with_pause_reuses_root_broker(tmp_path: Path, chain_diagram, layout):
+    # Runner processes are not HELICS federates here: hosts hold several
+    # federates and sub-brokers connect to the root broker.
+    runner = generate_runner_config(
+        chain_diagram(4, shared_helics_config=SharedFederateConfig(core_type="zmq")),
+        {"MockComponent": MockComponent},
+        target_directory=str(tmp_path),
+        **layout,
+    )
+    runner_path = tmp_path / "system_runner.json"
+    runner_path.write_text(runner.model_dump_json())
+    result = CliRunner().invoke(
+        cli, ["run-with-pause", "--runner", str(runner_path), "--native", "-b", "20"]
+    )
+    assert result.exit_code == 0, result.output
+    assert "Paused at 1 of 1 breakpoints" in result.output
@@ -0,0 +1,136 @@
+"""Unit tests for the runtime timeline profiler."""
+
+import csv
+from pathlib import Path
+
+import pytest
+from click.testing import CliRunner
+
+from oedisi.tools import cli
+from oedisi.tools.broker_utils import parse_time_data
+from oedisi.tools.profiler import (
+    COORDINATION,
+    ProfilingBroker,
+    TimelineProfile,
+    TimeSample,
+    parse_time_samples,
+)
+
+
+def federate(name: str, granted: float, computing: bool, state="executing") -> dict:
+    return {
+        "attributes": {"name": name},
+        "granted": granted,
+        "requested": granted + 1,
+        "granted_mode": computing,
+        "federate_state": state,
+        "granted_time": granted,
+        "send_time": granted,
+    }
+
+
+def timeline(*snapshots: list[tuple[str, float, bool]]) -> TimelineProfile:
+    return TimelineProfile(
+        interval=1.0,
+        samples=[
+            TimeSample(
+                wall_time=float(i),
+                name=name,
+                granted_time=granted,
+                requested_time=granted + 1,
+                computing=computing,
+            )
+            for i, snapshot in enumerate(snapshots)
+            for name, granted, computing in snapshot
+        ],
+    )
+
+
+def test_parse_time_samples_includes_sub_brokers():
+    response = {
+        "cores": [{"federates": [federate("a", 1.0, True)]}],
+        "brokers": [
+            {
+                "cores": [
+                    {
+                        "federates": [
+                            federate("b", 0.0, False),
+                            federate("c", 0.0, False, state="initializing"),
+                        ]
+                    }
+                ]
+            }
+        ],
+    }
+    samples = parse_time_samples(response, 2.5)
+    assert [(s.name, s.granted_time, s.computing) for s in samples] == [
+        ("a", 1.0, True),
+        ("b", 0.0, False),
+    ]
+    assert [t.name for t in parse_time_data(response)] == ["a", "b", "c"]
+
+
+def test_gating_attributes_time_to_lagging_computing_federates():
+    profile = timeline(
+        [("slow", 1, True), ("fast", 1, False)],
+        [("slow", 1, True), ("fast", 1, False)],
+        [("slow", 2, False), ("fast", 2, False)],
+        [("slow", 2, True), ("fast", 2, True)],
+        [("slow", 3, True), ("fast", 2, True)],
+        [("slow", 3, False), ("fast", 3, False)],
+    )
+    gating = {share.name: share for share in profile.gating()}
+
+    # slow gates 2 s, 0.5 s shared with fast, fast 1.5 s, coordination 1 s.
+    assert gating["slow"].seconds == pytest.approx(2.5)
+    assert gating["fast"].seconds == pytest.approx(1.5)
+    assert gating[COORDINATION].seconds == pytest.approx(1.0)
+    assert gating["slow"].fraction == pytest.approx(0.5)
+    assert profile.gating()[0].name == "slow"
+    assert "slow" in profile.report()
+
+
+def test_timeline_export(tmp_path: Path):
+    profile = timeline([("a", 0, True), ("b", 0, False)], [("a", 1, False)])
+    profile.to_csv(tmp_path / "profile.csv")
+    with open(tmp_path / "profile.csv") as f:
+        rows = list(csv.DictReader(f))
+    assert len(rows) == 3
+    assert rows[2] == {
+        "wall_time": "1.0",
+        "name": "a",
+        "granted_time": "1.0",
+        "requested_time": "2.0",
+        "computing": "False",
+    }
+
+    feather = pytest.importorskip("pyarrow.feather")
+    profile.to_feather(tmp_path / "profile.feather")
+    table = feather.read_table(tmp_path / "profile.feather")
+    assert table.column_names == list(TimeSample.model_fields)
+    assert table.num_rows == 3
+
+
+def test_profiling_broker_reuses_runner_broker_args():
+    broker = ProfilingBroker(
+        3, broker_args="helics_broker -f 5 -t tcp --port 23700 --loglevel=warning"
+    )
+    assert broker.core_type == "tcp"
+    assert broker.initstring == "-f 5 --port 23700 --loglevel=warning --name=mainbroker"
+    assert ProfilingBroker(3).initstring == "-f 3 --name=mainbroker"
+
+
+def test_profile_cli(monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.chdir(Path(__file__).parent)
+
+    runner = CliRunner()
+    result = runner.invoke(cli, ["build"])
+    assert result.exit_code == 0
+    result = runner.invoke(
+        cli, ["profile", "--interval", "0.02", "--output", "build/profile.csv"]
+    )
+    assert result.exit_code == 0, result.output
+    assert "gating federate" in result.output
+    with open("build/profile.csv") as f:
+        names = {row["name"] for row in csv.DictReader(f)}
+    assert names == {"comp_abc", "comp_xyz"}
@@ -0,0 +1,135 @@
+"""Unit tests for the run history and regression detection."""
+
+import datetime
+from pathlib import Path
+
+import pytest
+from click.testing import CliRunner
+
+from oedisi.componentframework.system_configuration import (
+    BuildManifest,
+    ManifestEntry,
+    generate_runner_config,
+)
+from oedisi.tools import cli
+from oedisi.tools.run_history import RUN, RunHistory
+from oedisi.tools.run_summary import FederateSummary, RunSummary
+
+START = datetime.datetime(2024, 1, 1)
+
+
+def summary(compute_time: float, wall_time: float = 10.0) -> RunSummary:
+    return RunSummary(
+        name="nightly",
+        start=START,
+        end=START + datetime.timedelta(seconds=wall_time),
+        wall_time=wall_time,
+        final_granted_time=3600,
+        sim_throughput=3600 / wall_time,
+        federates=[
+            FederateSummary(name="feeder", compute_time=compute_time, peak_rss=2**30),
+            FederateSummary(name="estimator", compute_time=2.0, peak_rss=2**28),
+        ],
+    )
+
+
+def manifest(diagram_hash="diagram", feeder_source="v1") -> BuildManifest:
+    return BuildManifest(
+        components={
+            "feeder": ManifestEntry(type="Feeder", hash="f", source_hash=feeder_source),
+            "estimator": ManifestEntry(type="Estimator", hash="e", source_hash="v1"),
+        },
+        diagram_hash=diagram_hash,
+        build_time=1.0,
+    )
+
+
+def test_run_history_flags_slowdowns(tmp_path: Path):
+    with RunHistory(tmp_path / "runs.sqlite") as history:
+        for compute_time in [5.0, 5.2, 4.9, 5.1, 5.0]:
+            history.record(summary(compute_time), manifest())
+        # Other wiring diagrams are a separate history.
+        history.record(summary(50.0), manifest(diagram_hash="other"))
+        history.record(summary(7.5, wall_time=10.1), manifest(feeder_source="v2"))
+
+        comparison = history.compare("diagram")
+
+    assert comparison.history == 5
+    slowdowns = {(m.federate, m.metric): m for m in comparison.slowdowns}
+    assert list(slowdowns) == [("feeder", "compute_time")]
+    feeder = slowdowns[("feeder", "compute_time")]
+    assert feeder.mean == pytest.approx(5.04)
+    assert feeder.change == pytest.approx(7.5 / 5.04 - 1)
+    assert feeder.source_changed
+    # Identical history is only flagged above the minimum change.
+    metrics = {(m.federate, m.metric): m for m in comparison.metrics}
+    assert not metrics[(RUN, "wall_time")].slowdown
+    assert not metrics[("estimator", "peak_rss")].slowdown
+    assert "feeder" in comparison.report()
+
+
+def test_run_history_needs_enough_runs(tmp_path: Path):
+    with RunHistory(tmp_path / "runs.sqlite") as history:
+        with pytest.raises(ValueError, match="empty"):
+            history.compare()
+        history.record(summary(5.0), manifest())
+        history.record(summary(5.0), manifest())
+        history.record(summary(50.0), manifest())
+        comparison = history.compare()
+        with pytest.raises(ValueError, match="At least 2"):
+            history.compare(min_runs=1)
+
+    assert comparison.metrics == [] and comparison.history == 2
+    assert "too little history" in comparison.report()
+
+
+def test_run_history_of_full_builds(tmp_path: Path, component_type, sensor_diagram):
+    source, sensor = component_type()
+    build = tmp_path / "build"
+    feeder = sensor_diagram(1)
+    feeder.components[0].name = "feeder"
+
+    with RunHistory(tmp_path / "runs.sqlite") as history:
+        for compute_time in [5.0, 5.2, 4.9]:
+            generate_runner_config(feeder, {"Sensor": sensor}, target_directory=str(build))
+            history.record(summary(compute_time), BuildManifest.load(build))
+        # A plain build after a code change is recorded with the new source.
+        (source / "run.py").write_text("print('changed')\n")
+        generate_runner_config(feeder, {"Sensor": sensor}, target_directory=str(build))
+        history.record(summary(7.5), BuildManifest.load(build))
+        comparison = history.compare(min_runs=2)
+
+    assert comparison.history == 3
+    slowdowns = {(m.federate, m.metric): m for m in comparison.slowdowns}
+    assert slowdowns[("feeder", "compute_time")].source_changed
+
+
+def test_compare_runs_cli(monkeypatch: pytest.MonkeyPatch, tmp_path: Path):
+    monkeypatch.chdir(Path(__file__).parent)
+    history = str(tmp_path / "runs.sqlite")
+
+    runner = CliRunner()
+    result = runner.invoke(cli, ["build"])
+    assert result.exit_code == 0
+    for _ in range(3):
+        result = runner.invoke(cli, ["run", "--history", history])
+        assert result.exit_code == 0, result.output
+        assert "Recorded run" in result.output
+
+    with RunHistory(history) as run_history:
+        rows = run_history.connection.execute(
+            "SELECT name, source_hash, peak_rss FROM federate_runs WHERE run_id = 3"
+        ).fetchall()
+        (build_time,) = run_history.connection.execute(
+            "SELECT build_time FROM runs WHERE id = 3"
+        ).fetchone()
+    assert build_time > 0
+    peaks = {name: peak_rss for name, _, peak_rss in rows}
+    assert peaks["comp_abc"] > 0 and peaks["broker"] > 0
+    assert all(source for name, source, _ in rows if name != "broker")
+
+    result = runner.invoke(
+        cli, ["compare-runs", "--history", history, "--min-runs", "2", "--min-change", "10"]
+    )
+    assert result.exit_code == 0, result.output
+    assert "no slowdowns against 2 runs" in result.output
@@ -0,0 +1,109 @@
+"""Unit tests for run throughput summaries."""
+
+import datetime
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+from oedisi.componentframework.system_configuration import Federate, RunnerConfig
+from oedisi.tools.run_summary import (
+    PROFILE_FILE,
+    FederateSummary,
+    PeakMemoryMonitor,
+    remove_profile,
+    summarize_profile,
+    summarize_run,
+    write_profiled_runner,
+)
+
+PROFILE = """\
+<PROFILING>a[131072](created)MARKER<1000|1792262867742163964>[t=-9223372036.854776]</PROFILING>
+<PROFILING>a[131072](initializing)HELICS CODE ENTRY<2000>[t=-1000000]</PROFILING>
+<PROFILING>b[131073](initializing)HELICS CODE ENTRY<2100>[t=-1000000]</PROFILING>
+<PROFILING>a[131072](executing)HELICS CODE EXIT<5000>[t=0]</PROFILING>
+<PROFILING>b[131073](executing)HELICS CODE EXIT<5100>[t=0]</PROFILING>
+<PROFILING>a[131072](executing)HELICS CODE ENTRY<1000000>[t=0]</PROFILING>
+<PROFILING>b[131073](executing)HELICS CODE ENTRY<1000000>[t=0]</PROFILING>
+<PROFILING>a[131072](executing)HELICS CODE EXIT<2000000>[t=900]</PROFILING>
+<PROFILING>b[131073](executing)HELICS CODE EXIT<5000000>[t=900]</PROFILING>
+<PROFILING>a[131072](executing)HELICS CODE ENTRY<6000000>[t=900]</PROFILING>
+<PROFILING>a[131072](executing)HELICS CODE EXIT<9000000>[t=1800]</PROFILING>
+<PROFILING>a[131072](executing)HELICS CODE ENTRY<9500000>[t=1800]</PROFILING>
+"""
+
+
+def test_summarize_profile(tmp_path: Path):
+    (tmp_path / PROFILE_FILE).write_text(PROFILE)
+    a, b = summarize_profile(tmp_path / PROFILE_FILE)
+
+    assert (a.name, a.time_steps, a.final_granted_time) == ("a", 2, 1800)
+    assert a.grant_latency_mean == pytest.approx(2e-3)
+    assert a.grant_latency_p95 == pytest.approx(3e-3)
+    assert (b.name, b.time_steps, b.final_granted_time) == ("b", 1, 900)
+    assert b.grant_latency_p95 == pytest.approx(4e-3)
+    assert b.bytes_published is None
+    assert a.compute_time == pytest.approx(5.495e-3)
+    assert a.startup_time is None
+
+    start = datetime.datetime.fromtimestamp(1792262867)
+    a, b = summarize_profile(tmp_path / PROFILE_FILE, start)
+    assert a.startup_time == pytest.approx(0.742, abs=1e-3)
+    assert b.startup_time is None
+
+
+def test_summarize_run(tmp_path: Path):
+    (tmp_path / PROFILE_FILE).write_text(PROFILE)
+    start = datetime.datetime(2024, 1, 1)
+    end = start + datetime.timedelta(seconds=30)
+    summary = summarize_run("test", start, end, tmp_path / PROFILE_FILE)
+
+    # The federation is as far as its slowest federate.
+    assert summary.final_granted_time == 900
+    assert summary.sim_throughput == pytest.approx(30)
+    assert summary.report() == "Simulated 900 s in 30.00 s (30 simulated s per wall s)"
+
+    summary = summarize_run("test", start, end, peak_rss={"broker": 1024})
+    assert summary.sim_throughput is None
+    assert summary.federates == [FederateSummary(name="broker", peak_rss=1024)]
+
+
+def test_peak_memory_monitor(tmp_path: Path):
+    (tmp_path / "a").mkdir()
+    runner_config = RunnerConfig(
+        name="test", federates=[Federate(directory="a", name="a", exec="")]
+    )
+    with PeakMemoryMonitor(runner_config, tmp_path, interval=0.05) as monitor:
+        subprocess.run(
+            [sys.executable, "-c", "import time; time.sleep(0.5)"], cwd=tmp_path / "a"
+        )
+    assert monitor.peaks["a"] > 0
+    assert list(monitor.peaks) == ["a"]
+
+
+def test_write_profiled_runner(tmp_path: Path):
+    runner_config = RunnerConfig(
+        name="test",
+        federates=[
+            Federate(directory="a", name="a", exec="python a.py"),
+            Federate(directory=".", name="broker", exec="helics_broker -f 1"),
+        ],
+    )
+    runner_path = tmp_path / "system_runner.json"
+    runner_path.write_text(runner_config.model_dump_json())
+
+    profiled_path, profile_path = write_profiled_runner(str(runner_path))
+    assert profiled_path == str(tmp_path / "system_runner_profiled.json")
+    assert profile_path == str(tmp_path / PROFILE_FILE)
+    profiled = RunnerConfig.model_validate_json(Path(profiled_path).read_text())
+    assert profiled.federates[0] == runner_config.federates[0]
+    assert profiled.federates[1].exec == f"helics_broker -f 1 --profiler={profile_path}"
+    Path(profile_path).write_text(PROFILE)
+    remove_profile(profiled_path, profile_path)
+    assert not Path(profiled_path).exists() and not Path(profile_path).exists()
+
+    runner_path.write_text(RunnerConfig(name="test", federates=[]).model_dump_json())
+    assert write_profiled_runner(str(runner_path)) == (str(runner_path), None)
+    remove_profile(str(runner_path), None)
+    assert runner_path.exists()
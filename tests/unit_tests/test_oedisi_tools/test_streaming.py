@@ -0,0 +1,155 @@
+"""Unit tests for streaming wiring diagram loading and builds."""
+
+import json
+from pathlib import Path
+
+import pytest
+
+from oedisi.componentframework.basic_component import (
+    ComponentDescription,
+    basic_component,
+)
+from oedisi.componentframework.streaming import (
+    iter_components,
+    iter_wiring_diagram,
+    load_wiring_diagram_skeleton,
+)
+from oedisi.componentframework.system_configuration import (
+    AnnotatedType,
+    WiringDiagram,
+    generate_runner_config,
+)
+from oedisi.types.helics_config import HELICSFederateConfig
+
+
+def make_system(tmp_path: Path, n: int = 5) -> Path:
+    system = {
+        "name": "profiles",
+        "components": [
+            {
+                "name": f"load{i}",
+                "type": "Load",
+                "parameters": {"profile": [float(i)] * 1000, "label": "x" * 100},
+            }
+            for i in range(n)
+        ],
+        "links": [
+            {"source": f"load{i}", "source_port": "power",
+             "target": f"load{i + 1}", "target_port": "power"}
+            for i in range(n - 1)
+        ],
+        "shared_helics_config": None,
+    }
+    path = tmp_path / "system.json"
+    path.write_text(json.dumps(system, indent=1))
+    return path
+
+
+@pytest.mark.parametrize("chunk_size", [1, 7, 1 << 20])
+def test_skeleton_and_components_match_json_load(tmp_path: Path, chunk_size):
+    path = make_system(tmp_path)
+    with open(path) as f:
+        expected = WiringDiagram.model_validate(json.load(f))
+
+    skeleton = load_wiring_diagram_skeleton(path, chunk_size)
+    assert skeleton.name == expected.name
+    assert skeleton.links == expected.links
+    assert [c.name for c in skeleton.components] == [c.name for c in expected.components]
+    assert all(c.parameters == {} for c in skeleton.components)
+    assert list(iter_components(path, chunk_size)) == expected.components
+
+
+def test_iter_wiring_diagram_empty_arrays(tmp_path: Path):
+    path = tmp_path / "system.json"
+    path.write_text('{"name": "empty", "components": [], "links": [ ]}')
+    assert list(iter_wiring_diagram(path, chunk_size=2)) == [("name", "empty")]
+    path.write_text('{"name": "broken", "components": [')
+    with pytest.raises(ValueError):
+        list(iter_wiring_diagram(path))
+
+
+def test_streaming_build_matches_regular_build(tmp_path: Path):
+    source = tmp_path / "src" / "load"
+    source.mkdir(parents=True)
+    load = basic_component(
+        ComponentDescription(
+            directory=str(source),
+            execute_function="python run.py",
+            static_inputs=[],
+            dynamic_inputs=[
+                AnnotatedType(type="PowersReal", port_id="power", encodings=["binary", "json"])
+            ],
+            dynamic_outputs=[
+                AnnotatedType(type="PowersReal", port_id="power", encodings=["binary", "json"])
+            ],
+        ),
+        lambda t, x: True,
+    )
+    path = make_system(tmp_path)
+    with open(path) as f:
+        diagram = WiringDiagram.model_validate(json.load(f))
+    regular = generate_runner_config(
+        diagram, {"Load": load}, target_directory=str(tmp_path / "regular")
+    )
+    streamed = generate_runner_config(
+        load_wiring_diagram_skeleton(path),
+        {"Load": load},
+        target_directory=str(tmp_path / "streamed"),
+        components=iter_components(path),
+    )
+    assert regular == streamed
+    for i in range(5):
+        with open(tmp_path / "regular" / f"load{i}" / "static_inputs.json") as f:
+            expected = json.load(f)
+        with open(tmp_path / "streamed" / f"load{i}" / "static_inputs.json") as f:
+            assert json.load(f) == expected
+        assert expected["profile"][0] == i
+        assert expected["encodings"]["outputs"] == ({"power": "binary"} if i < 4 else {})
+
+    with pytest.raises(ValueError, match="serially"):
+        generate_runner_config(
+            load_wiring_diagram_skeleton(path),
+            {"Load": load},
+            target_directory=str(tmp_path / "threads"),
+            components=iter_components(path),
+            max_workers=2,
+        )
+
+
+def test_parameters_released_only_when_streaming(tmp_path: Path):
+    source = tmp_path / "src"
+    source.mkdir()
+    component_type = basic_component(
+        ComponentDescription(
+            directory=str(source),
+            execute_function="python run.py",
+            static_inputs=[],
+            dynamic_inputs=[],
+            dynamic_outputs=[],
+        ),
+        lambda t, x: True,
+    )
+    parameters = {"profile": [1.0, 2.0]}
+    directory = tmp_path / "load"
+    directory.mkdir()
+
+    component = component_type(
+        HELICSFederateConfig(name="load"), parameters, str(directory), None, None, "Load"
+    )
+    # The caller's parameters are not modified and can be written again.
+    assert parameters == {"profile": [1.0, 2.0]}
+    component.generate_parameter_config()
+    with open(directory / "static_inputs.json") as f:
+        assert json.load(f) == {"profile": [1.0, 2.0], "name": "load"}
+
+    released = component_type(
+        HELICSFederateConfig(name="load"),
+        parameters,
+        str(directory),
+        None,
+        None,
+        "Load",
+        release_parameters=True,
+    )
+    with pytest.raises(ValueError, match="released"):
+        released.generate_parameter_config()
@@ -0,0 +1,146 @@
+"""Unit tests for the native federation supervisor."""
+
+import asyncio
+import io
+import os
+import signal
+import sys
+import time
+from pathlib import Path
+
+from click.testing import CliRunner
+
+from oedisi.componentframework.system_configuration import Federate, RunnerConfig
+from oedisi.tools import cli
+from oedisi.tools.supervisor import run_federation
+
+
+def python(code: str) -> str:
+    return f'{sys.executable} -c "{code}"'
+
+
+def runner_config(**commands: str) -> RunnerConfig:
+    return RunnerConfig(
+        name="test",
+        federates=[
+            Federate(directory=".", name=name, exec=command)
+            for name, command in commands.items()
+        ],
+    )
+
+
+def run(config: RunnerConfig, directory: Path, **kwargs):
+    output = io.StringIO()
+    result = asyncio.run(run_federation(config, directory, output=output, **kwargs))
+    return result, output.getvalue()
+
+
+def test_supervisor_runs_federates(tmp_path: Path):
+    config = runner_config(
+        a=python("print('hello from a')"),
+        b=python("import sys; print('warning from b', file=sys.stderr)"),
+    )
+    result, output = run(config, tmp_path)
+
+    assert result.ok
+    assert [federate.returncode for federate in result.federates] == [0, 0]
+    assert all(federate.start_latency >= 0 for federate in result.federates)
+    assert "[a] hello from a\n" in output
+    assert "[b] warning from b\n" in output
+    assert (tmp_path / "a.log").read_text() == "hello from a\n"
+    assert "b" in result.report()
+
+
+def test_supervisor_tears_down_on_failure(tmp_path: Path):
+    config = runner_config(
+        crash=python("import sys, time; time.sleep(0.5); sys.exit(3)"),
+        blocked=python("import time; time.sleep(60)"),
+    )
+    start = time.perf_counter()
+    result, _ = run(config, tmp_path, grace_period=2)
+
+    assert time.perf_counter() - start < 10
+    assert not result.ok
+    assert result.failed == ["crash"]
+    crash, blocked = result.federates
+    assert crash.returncode == 3 and not crash.terminated
+    assert blocked.returncode == -signal.SIGTERM and blocked.terminated
+
+
+def test_supervisor_timeout_kills_stubborn_federates(tmp_path: Path):
+    config = runner_config(
+        stubborn=python(
+            "import signal, time; signal.signal(signal.SIGTERM, signal.SIG_IGN); "
+            "print('ready', flush=True); time.sleep(60)"
+        ),
+    )
+    result, output = run(config, tmp_path, timeout=1, grace_period=0.5)
+
+    assert result.timed_out
+    assert result.failed == []
+    assert result.federates[0].returncode == -signal.SIGKILL
+    assert "[stubborn] ready" in output
+    assert result.wall_time < 10
+
+
+def test_supervisor_long_lines(tmp_path: Path):
+    # Longer than the default 64 KiB StreamReader limit, followed by enough
+    # output to fill the pipe if it were no longer read.
+    config = runner_config(
+        chatty=python("print('x' * 200000); [print(i) for i in range(100000)]"),
+    )
+    result, output = run(config, tmp_path, timeout=30, grace_period=1)
+
+    assert result.ok
+    assert f"[chatty] {'x' * 200000}\n" in output
+    assert "[chatty] 99999\n" in output
+    assert (tmp_path / "chatty.log").read_text().startswith("x" * 200000 + "\n0\n")
+
+
+def test_supervisor_reports_missing_executable(tmp_path: Path):
+    config = runner_config(
+        missing="/nonexistent/federate",
+        blocked=python("import time; time.sleep(60)"),
+    )
+    result, _ = run(config, tmp_path, grace_period=1)
+
+    assert result.failed == ["missing"]
+    assert result.federates[0].returncode is None
+    assert result.federates[1].terminated
+    assert "Could not start" in (tmp_path / "missing.log").read_text()
+
+
+def test_supervisor_without_process_groups(tmp_path: Path, monkeypatch):
+    # Platforms without os.killpg, such as Windows, stop the process itself.
+    monkeypatch.delattr(os, "killpg")
+    config = runner_config(
+        crash=python("import sys; sys.exit(3)"),
+        blocked=python("import time; time.sleep(60)"),
+    )
+    result, _ = run(config, tmp_path, grace_period=2)
+
+    assert result.failed == ["crash"]
+    assert result.federates[1].terminated
+
+
+def test_debug_component_reports_native_failure(tmp_path: Path):
+    config = runner_config(
+        crash=python("import sys; sys.exit(3)"),
+        foreground=python("pass"),
+    )
+    runner_path = tmp_path / "system_runner.json"
+    runner_path.write_text(config.model_dump_json())
+
+    result = CliRunner().invoke(
+        cli,
+        [
+            "debug-component",
+            "--runner",
+            str(runner_path),
+            "--foreground",
+            "foreground",
+            "--native",
+        ],
+    )
+    assert result.exit_code == 1
+    assert "Federation test failed" in result.output
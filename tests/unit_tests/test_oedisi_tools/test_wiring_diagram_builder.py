@@ -0,0 +1,66 @@
+"""Unit tests for the indexed WiringDiagramBuilder."""
+
+import pytest
+
+from oedisi.componentframework.system_configuration import (
+    Component,
+    Link,
+    WiringDiagram,
+)
+from oedisi.componentframework.wiring_diagram_utils import WiringDiagramBuilder
+
+
+def component(name: str) -> Component:
+    return Component(name=name, type="MockComponent", parameters={})
+
+
+def link(source, source_port, target, target_port) -> Link:
+    return Link(
+        source=source, source_port=source_port, target=target, target_port=target_port
+    )
+
+
+@pytest.fixture
+def builder():
+    builder = WiringDiagramBuilder("sensors")
+    feeder = builder.add_component(component("feeder"))
+    for i in range(3):
+        sensor = builder.add_component(component(f"sensor{i}"))
+        builder.add_link(feeder.port("voltages").connect(sensor.port("voltages")))
+    return builder
+
+
+def test_builder_matches_list_diagram(builder):
+    diagram = WiringDiagram(
+        name="sensors",
+        components=[component(name) for name in ["feeder", "sensor0", "sensor1", "sensor2"]],
+        links=[link("feeder", "voltages", f"sensor{i}", "voltages") for i in range(3)],
+    )
+    assert builder.to_wiring_diagram().model_dump_json() == diagram.model_dump_json()
+    rebuilt = WiringDiagramBuilder.from_wiring_diagram(diagram).to_wiring_diagram()
+    assert rebuilt.model_dump_json() == diagram.model_dump_json()
+
+
+def test_builder_lookups(builder):
+    assert builder.component("sensor1").name == "sensor1"
+    assert "sensor2" in builder and "estimator" not in builder
+    assert len(builder) == 4
+    assert len(builder.links_from("feeder")) == 3
+    assert builder.links_from("feeder", "currents") == []
+    assert builder.links_to("sensor0") == [link("feeder", "voltages", "sensor0", "voltages")]
+    link_map = builder.get_link_map()
+    assert link_map == builder.to_wiring_diagram().get_link_map()
+    assert link_map["feeder"] == []
+
+
+def test_builder_validates_incrementally(builder):
+    with pytest.raises(ValueError, match="already exists"):
+        builder.add_component(component("feeder"))
+    with pytest.raises(ValueError, match="unknown component"):
+        builder.add_link(link("feeder", "voltages", "estimator", "voltages"))
+    with pytest.raises(ValueError, match="Duplicate link"):
+        builder.add_link(link("feeder", "voltages", "sensor0", "voltages"))
+    builder.add_component(component("other"))
+    with pytest.raises(ValueError, match="already linked"):
+        builder.add_link(link("other", "voltages", "sensor0", "voltages"))
+    assert len(builder.links) == 3